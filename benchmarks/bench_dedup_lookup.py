@@ -0,0 +1,172 @@
+"""
+저장된 포스트 중복 조회 벤치마크.
+
+company_posts에 포스트 N개(기본 1만, 10만)를 넣고, 크롤링된 포스트 M개(절반은 저장된 URL)의
+중복 여부를 다음 방식으로 확인하는 비용을 비교합니다.
+
+- per_post_source_url: 포스트마다 인덱스 없는 source_url로 조회 (기존 _is_duplicate_post)
+- per_post_hash: 포스트마다 source_url_hash 유니크 인덱스로 조회
+- batched_hash: source_url_hash IN (...)으로 DEDUP_LOOKUP_BATCH_SIZE개씩 묶어 조회 (find_stored_urls)
+
+데이터베이스 시간과 함께, 쿼리마다 --rtt-ms만큼의 왕복 시간(SSH 터널 너머 RDS)을 더한
+예상 시간을 출력합니다. 기본은 임시 SQLite 파일이며, --database-url로 빈 MySQL 데이터베이스를
+지정할 수도 있습니다.
+
+    python -m benchmarks.bench_dedup_lookup --sizes 10000,100000
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.engine import Connection
+
+from src.config.dedup_config import DEDUP_LOOKUP_BATCH_SIZE
+from src.database.models import Base, DBCompanyPost, DBPost
+from src.utils.url_utils import url_hash
+
+_INSERT_BATCH = 5000
+
+
+def _url(index: int) -> str:
+    return f"https://tech.example.com/posts/{index:08d}-some-article-slug"
+
+
+def _populate(conn: Connection, size: int) -> None:
+    posts, company_posts = DBPost.__table__, DBCompanyPost.__table__
+    now = datetime.now()
+    for start in range(1, size + 1, _INSERT_BATCH):
+        ids = range(start, min(start + _INSERT_BATCH, size + 1))
+        conn.execute(
+            insert(posts),
+            [
+                {
+                    "id": i,
+                    "title": f"글 {i}",
+                    "content": "요약",
+                    "created_at": now,
+                    "updated_at": now,
+                    "view_count": 0,
+                    "post_type": "COMPANY",
+                }
+                for i in ids
+            ],
+        )
+        conn.execute(
+            insert(company_posts),
+            [
+                {
+                    "id": i,
+                    "source_url": _url(i),
+                    "source_url_hash": url_hash(_url(i)),
+                    "company": "KAKAO",
+                }
+                for i in ids
+            ],
+        )
+
+
+def _per_post_source_url(conn: Connection, urls: List[str]) -> int:
+    column = DBCompanyPost.__table__.c.source_url
+    for url in urls:
+        conn.execute(select(column).where(column == url).limit(1)).first()
+    return len(urls)
+
+
+def _per_post_hash(conn: Connection, urls: List[str]) -> int:
+    column = DBCompanyPost.__table__.c.source_url_hash
+    for url in urls:
+        conn.execute(select(column).where(column == url_hash(url)).limit(1)).first()
+    return len(urls)
+
+
+def _batched_hash(conn: Connection, urls: List[str]) -> int:
+    column = DBCompanyPost.__table__.c.source_url_hash
+    hashes = [url_hash(url) for url in urls]
+    queries = 0
+    for start in range(0, len(hashes), DEDUP_LOOKUP_BATCH_SIZE):
+        conn.execute(
+            select(column).where(
+                column.in_(hashes[start : start + DEDUP_LOOKUP_BATCH_SIZE])
+            )
+        ).all()
+        queries += 1
+    return queries
+
+
+_METHODS: Dict[str, Callable[[Connection, List[str]], int]] = {
+    "per_post_source_url": _per_post_source_url,
+    "per_post_hash": _per_post_hash,
+    "batched_hash": _batched_hash,
+}
+
+
+def _measure(
+    conn: Connection, urls: List[str], repeat: int, rtt_ms: float
+) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for name, method in _METHODS.items():
+        best = float("inf")
+        queries = 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            queries = method(conn, urls)
+            best = min(best, time.perf_counter() - started)
+        results[name] = {
+            "queries": queries,
+            "db_ms": round(best * 1000, 2),
+            "db_us_per_post": round(best / len(urls) * 1_000_000, 1),
+            "estimated_ms_with_rtt": round(best * 1000 + queries * rtt_ms, 1),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="저장된 포스트 중복 조회 벤치마크")
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--rtt-ms", type=float, default=20.0)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    report: Dict[str, Any] = {
+        "lookups": args.lookups,
+        "rtt_ms": args.rtt_ms,
+        "batch_size": DEDUP_LOOKUP_BATCH_SIZE,
+        "sizes": {},
+    }
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in [int(value) for value in args.sizes.split(",")]:
+            database_url = args.database_url or (
+                f"sqlite:///{os.path.join(work_dir, f'dedup_{size}.sqlite3')}"
+            )
+            engine = create_engine(database_url)
+            tables = [DBPost.__table__, DBCompanyPost.__table__]
+            Base.metadata.drop_all(engine, tables=tables)
+            Base.metadata.create_all(engine, tables=tables)
+            with engine.begin() as conn:
+                _populate(conn, size)
+            # 절반은 저장된 URL(테이블 전체에 고르게), 절반은 새 URL입니다.
+            stored = [
+                _url(1 + i * size // (args.lookups // 2))
+                for i in range(args.lookups // 2)
+            ]
+            new = [_url(size + 1 + i) for i in range(args.lookups - len(stored))]
+            with engine.connect() as conn:
+                report["sizes"][size] = _measure(
+                    conn, stored + new, args.repeat, args.rtt_ms
+                )
+            engine.dispose()
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
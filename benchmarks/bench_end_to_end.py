@@ -0,0 +1,373 @@
+"""
+크롤링 → 요약 → 썸네일 → 저장 전체 과정의 오프라인 벤치마크.
+
+외부 서비스 대신 로컬 대체물을 사용합니다.
+
+- 피드/글/이미지: 합성 피드를 제공하는 로컬 HTTP 서버 (또는 `--replay DIR`의 HTTP 아카이브)
+- ChatOpenAI: 지정한 지연 시간 뒤 고정된 JSON을 돌려주는 가짜 채팅 모델
+- S3: PUT 요청을 받아 버리는 로컬 엔드포인트 (`S3_ENDPOINT_URL`)
+- RDS: 로컬 SQLite 파일 (`DATABASE_URL`)
+
+포스트 수, 소스 수, 동시성, 실행 방식(serial/pipeline)의 조합마다 별도 프로세스에서
+실행하여 최대 RSS를 따로 측정하고, 결과를 커밋끼리 비교할 수 있는 JSON으로 출력합니다.
+
+    python -m benchmarks.bench_end_to_end --posts 5,20 --sources 4,16 --concurrency 1,8
+    python -m benchmarks.bench_end_to_end --mode serial,pipeline --output report.json
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List
+
+_FEED_ITEM = (
+    "<item><title>글 {source}-{i}</title><link>{base}/post/{source}/{i}</link>"
+    "<guid>{base}/post/{source}/{i}</guid><pubDate>{date}</pubDate>{body}</item>"
+)
+_FULL_BODY = (
+    "<content:encoded><![CDATA[<p>{text}</p><img src='/img/{source}/{i}.png'>]]>"
+    "</content:encoded>"
+)
+_TRUNCATED_BODY = "<description>&lt;p&gt;짧은 요약...&lt;/p&gt;</description>"
+_PAGE = (
+    "<html><head><meta property='og:image' content='/img/{source}/{i}.png'></head>"
+    "<body><nav>메뉴</nav><article><h1>글</h1><p>{text}</p></article></body></html>"
+)
+_IMAGE = b"\x89PNG\r\n\x1a\n" + b"\x00" * 2048
+_TEXT = "벤치마크 본문 문장입니다. " * 150
+
+
+def _make_handler(posts: int, latency: float):
+    """합성 피드/글/이미지를 제공하고 S3 PUT 요청을 받는 핸들러를 만듭니다."""
+
+    class Handler(BaseHTTPRequestHandler):
+        # boto3의 Expect: 100-continue를 처리하려면 HTTP/1.1이어야 합니다.
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            if latency:
+                time.sleep(latency)
+            parts = self.path.strip("/").split("/")
+            base = f"http://{self.headers['Host']}"
+            if parts[0] == "feed":
+                source = parts[1]
+                items = "".join(
+                    _FEED_ITEM.format(
+                        base=base,
+                        source=source,
+                        i=i,
+                        date=f"Mon, 01 Jan 2024 {i % 24:02d}:00:00 +0900",
+                        body=(
+                            _FULL_BODY.format(text=_TEXT, source=source, i=i)
+                            if i % 2 == 0
+                            else _TRUNCATED_BODY
+                        ),
+                    )
+                    for i in range(posts)
+                )
+                body = (
+                    "<rss version='2.0' xmlns:content='http://purl.org/rss/1.0/modules/content/'>"
+                    f"<channel>{items}</channel></rss>"
+                ).encode()
+                self._reply(body, "application/rss+xml")
+            elif parts[0] == "post":
+                page = _PAGE.format(source=parts[1], i=parts[2], text=_TEXT)
+                self._reply(page.encode(), "text/html; charset=utf-8")
+            elif parts[0] == "img":
+                self._reply(_IMAGE, "image/png")
+            else:
+                self.send_error(404)
+
+        def do_PUT(self) -> None:
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self.send_response(200)
+            self.send_header("ETag", '"benchmark"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def _reply(self, body: bytes, content_type: str) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def _timed(func: Callable, latencies: List[float]) -> Callable:
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    return wrapper
+
+
+def _fake_chat_client(latency: float):
+    """지연 시간 뒤 고정된 요약 JSON을 돌려주는 채팅 모델을 만듭니다."""
+    from langchain_core.language_models.chat_models import BaseChatModel
+    from langchain_core.messages import AIMessage
+    from langchain_core.outputs import ChatGeneration, ChatResult
+
+    response = json.dumps(
+        {"summary": "벤치마크 요약입니다. " * 30, "field": "Backend"},
+        ensure_ascii=False,
+    )
+
+    class FakeChatModel(BaseChatModel):
+        @property
+        def _llm_type(self) -> str:
+            return "benchmark-fake"
+
+        def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+            time.sleep(latency)
+            return ChatResult(
+                generations=[ChatGeneration(message=AIMessage(content=response))]
+            )
+
+    return FakeChatModel()
+
+
+def run_single(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    조합 하나를 현재 프로세스에서 실행하고 결과를 반환합니다.
+
+    src 모듈은 환경 변수(DATABASE_URL, S3_ENDPOINT_URL 등)를 import 시점에 읽으므로
+    환경을 설정한 뒤에 불러옵니다.
+    """
+    work_dir = tempfile.mkdtemp(prefix="bench-e2e-")
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0),
+        _make_handler(params["posts"], params["server_latency"]),
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    os.environ.update(
+        {
+            "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", "benchmark"),
+            "AWS_ACCESS_KEY_ID": "benchmark",
+            "AWS_SECRET_ACCESS_KEY": "benchmark",
+            "S3_BUCKET_NAME": "benchmark",
+            "S3_ENDPOINT_URL": base_url,
+            "CDN_URL": "cdn.benchmark.local",
+            "DATABASE_URL": f"sqlite:///{os.path.join(work_dir, 'bench.sqlite3')}",
+            "CRAWLER_CACHE_DIR": os.path.join(work_dir, "cache"),
+        }
+    )
+    logging.disable(logging.CRITICAL)
+
+    import src.core.post_processor as post_processor
+    import src.services.summarizer as summarizer
+    from src.core.db_handler import save_to_rds
+    from src.core.pipeline import PostPipeline, StageStats
+    from sqlalchemy import create_engine
+
+    from src.database import connection
+    from src.database.models import Base
+    from src.services.crawler import BlogCrawler
+    from src.utils.http_archive import HttpArchive
+    from src.utils.http_cache import http_cache
+    from src.utils.http_client import http_client
+
+    # posts/company_posts는 서비스 쪽 테이블이라 init_db가 만들지 않으므로 먼저 만들어 둡니다.
+    Base.metadata.create_all(create_engine(os.environ["DATABASE_URL"]))
+    connection.init_db()
+    http_cache.enabled = False
+    summarizer.get_chat_client = lambda: _fake_chat_client(params["llm_latency"])
+
+    if params.get("replay"):
+        from src.config.blog_config import feed_registry
+
+        http_client.use_archive(HttpArchive(params["replay"], HttpArchive.REPLAY))
+        configs = feed_registry.configs[: params["sources"]]
+    else:
+        from src.models.enums import Company
+
+        configs = [
+            {
+                "blog_url": f"{base_url}/feed/{source}",
+                "name": f"벤치마크 블로그 {source}",
+                "company": Company.ETC,
+                "type": "rss",
+            }
+            for source in range(params["sources"])
+        ]
+
+    latencies: Dict[str, List[float]] = {
+        name: [] for name in ("crawl", "summarize", "thumbnail", "save")
+    }
+    crawler = BlogCrawler(
+        concurrency=params["concurrency"], per_host_limit=params["concurrency"]
+    )
+    crawler._crawl_blog = _timed(crawler._crawl_blog, latencies["crawl"])
+
+    started = time.perf_counter()
+    if params["mode"] == "pipeline":
+        result = PostPipeline(
+            summarize_workers=params["concurrency"],
+            thumbnail_workers=params["concurrency"],
+        ).run(crawler, configs, params["posts"])
+        saved = result.saved
+        stages = {
+            name: stats for name, stats in result.stages.items() if name != "crawl"
+        }
+    else:
+        post_processor.summarize_contents = _timed(
+            post_processor.summarize_contents, latencies["summarize"]
+        )
+        # 일반 모드는 요약 중에 썸네일을 내려받고, 저장할 포스트만 업로드합니다.
+        latencies["thumbnail_download"] = latencies.pop("thumbnail")
+        latencies["thumbnail_upload"] = []
+        post_processor.download_thumbnail = _timed(
+            post_processor.download_thumbnail, latencies["thumbnail_download"]
+        )
+        post_processor.upload_thumbnail = _timed(
+            post_processor.upload_thumbnail, latencies["thumbnail_upload"]
+        )
+        crawled_posts = crawler.crawl_all_sources(
+            configs=configs, max_posts=params["posts"]
+        )
+        processed_posts = post_processor.process_posts(
+            crawled_posts,
+            summary_concurrency=params["concurrency"],
+            thumbnail_workers=params["concurrency"],
+        )
+        saved, _ = _timed(save_to_rds, latencies["save"])(processed_posts)
+        stages = {
+            name: StageStats(
+                name, workers=1, processed=len(values), latencies=values
+            ).summary()
+            for name, values in latencies.items()
+            if name != "crawl"
+        }
+    wall_time = time.perf_counter() - started
+
+    stages = {
+        "crawl": StageStats(
+            "crawl",
+            params["concurrency"],
+            processed=len(latencies["crawl"]),
+            latencies=latencies["crawl"],
+        ).summary(),
+        **stages,
+    }
+    server.shutdown()
+    return {
+        **params,
+        "posts_saved": saved,
+        "wall_time_s": round(wall_time, 3),
+        "posts_per_sec": round(saved / wall_time, 2) if wall_time else 0.0,
+        "stages": stages,
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        ),
+        "http": http_client.stats(),
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="전체 파이프라인 오프라인 벤치마크")
+    parser.add_argument("--posts", type=_int_list, default=[5, 20])
+    parser.add_argument("--sources", type=_int_list, default=[4, 16])
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 8])
+    parser.add_argument(
+        "--mode", type=lambda value: value.split(","), default=["serial", "pipeline"]
+    )
+    parser.add_argument(
+        "--llm-latency", type=float, default=0.2, help="가짜 채팅 모델의 응답 지연(초)"
+    )
+    parser.add_argument(
+        "--server-latency",
+        type=float,
+        default=0.02,
+        help="로컬 HTTP 서버의 응답 지연(초)",
+    )
+    parser.add_argument(
+        "--replay", default=None, help="합성 피드 대신 사용할 HTTP 아카이브 디렉토리"
+    )
+    parser.add_argument("--output", default=None, help="결과 JSON을 저장할 파일")
+    parser.add_argument("--single", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(run_single(json.loads(args.single)), ensure_ascii=False))
+        return
+
+    runs = []
+    for mode, sources, posts, concurrency in itertools.product(
+        args.mode, args.sources, args.posts, args.concurrency
+    ):
+        params = {
+            "mode": mode,
+            "sources": sources,
+            "posts": posts,
+            "concurrency": concurrency,
+            "llm_latency": args.llm_latency,
+            "server_latency": args.server_latency,
+            "replay": args.replay,
+        }
+        completed = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_end_to_end"]
+            + ["--single", json.dumps(params)],
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode != 0:
+            print(completed.stderr, file=sys.stderr)
+            runs.append({**params, "error": completed.stderr.strip().splitlines()[-1:]})
+            continue
+        run = json.loads(completed.stdout.strip().splitlines()[-1])
+        print(
+            f"{mode:8} sources={sources:<3} posts={posts:<3} concurrency={concurrency:<3}"
+            f" → {run['wall_time_s']}s, {run['posts_per_sec']} posts/s",
+            file=sys.stderr,
+        )
+        runs.append(run)
+
+    report = {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "runs": runs,
+    }
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
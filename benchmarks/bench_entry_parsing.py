@@ -0,0 +1,118 @@
+"""
+피드 항목 파싱(발행일, 썸네일) 벤치마크.
+
+피드별 파싱 프로필 없이 매번 전체 탐색을 수행할 때와, 프로필을 학습한 뒤
+빠른 경로를 사용할 때의 항목당 처리 시간을 비교하고 결과가 같은지 확인합니다.
+
+    python -m benchmarks.corpus record     # 네트워크가 있는 곳에서 한 번 실행
+    python -m benchmarks.bench_entry_parsing
+"""
+
+import argparse
+import json
+import logging
+import time
+from typing import Dict, List, Tuple
+
+import feedparser
+
+from benchmarks.corpus import DEFAULT_CORPUS_DIR, has_corpus, load_feeds
+from src.services.source_profile import (
+    SourceProfile,
+    extract_entry_thumbnail,
+    parse_entry_date,
+)
+
+_SYNTHETIC_ITEM = (
+    "<item><title>글 {i}</title><link>https://example.com/post/{i}</link>"
+    "<pubDate>{date}</pubDate>"
+    "<description>&lt;p&gt;{text}&lt;/p&gt;&lt;img src='/img/{i}.png'&gt;</description>"
+    "</item>"
+)
+
+
+def _synthetic_feeds(entries: int) -> List[Tuple[str, bytes]]:
+    """날짜 형식이 서로 다른 합성 피드를 만듭니다. 뒤쪽 형식일수록 전체 탐색 비용이 큽니다."""
+    dates = {
+        "rfc822": "Mon, 01 Jan 2024 10:00:00 +0900",
+        "iso_fraction": "2024-01-01T10:00:00.123+09:00",
+        "date_only": "2024-01-01",
+    }
+    feeds = []
+    for name, date in dates.items():
+        items = "".join(
+            _SYNTHETIC_ITEM.format(i=i, date=date, text="본문 " * 300)
+            for i in range(entries)
+        )
+        feeds.append(
+            (name, f"<rss version='2.0'><channel>{items}</channel></rss>".encode())
+        )
+    return feeds
+
+
+def _parse_all(entries, profile) -> List[tuple]:
+    return [
+        (parse_entry_date(entry, profile), extract_entry_thumbnail(entry, profile))
+        for entry in entries
+    ]
+
+
+def _measure(entries, repeat: int) -> Dict[str, float]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        _parse_all(entries, None)
+    cascade = time.perf_counter() - start
+
+    profile = SourceProfile()
+    _parse_all(entries, profile)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        _parse_all(entries, profile)
+    profiled = time.perf_counter() - start
+
+    count = len(entries) * repeat
+    return {
+        "entries": len(entries),
+        "cascade_us": round(cascade / count * 1_000_000, 2),
+        "profiled_us": round(profiled / count * 1_000_000, 2),
+        "speedup": round(cascade / profiled, 2) if profiled else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="피드 항목 파싱 벤치마크")
+    parser.add_argument("--corpus-dir", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--entries", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    if has_corpus(args.corpus_dir):
+        feeds = [
+            (recorded.url, recorded.body) for recorded in load_feeds(args.corpus_dir)
+        ]
+        source = args.corpus_dir
+    else:
+        feeds = _synthetic_feeds(args.entries)
+        source = "synthetic"
+
+    report = {"corpus": source, "mismatches": 0, "feeds": {}}
+    for name, body in feeds:
+        entries = feedparser.parse(body).entries
+        if not entries:
+            continue
+        profile = SourceProfile()
+        _parse_all(entries, profile)
+        report["mismatches"] += sum(
+            1
+            for expected, actual in zip(
+                _parse_all(entries, None), _parse_all(entries, profile)
+            )
+            if expected != actual
+        )
+        report["feeds"][name] = _measure(entries, args.repeat)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
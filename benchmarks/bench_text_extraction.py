@@ -0,0 +1,94 @@
+"""
+본문 텍스트 추출 엔진 벤치마크.
+
+기록된 피드의 항목 본문(content 또는 summary)에 대해 각 엔진의 초당 처리 항목 수를
+측정하고, 모든 엔진의 결과가 기준 엔진(bs4)과 같은지 확인합니다.
+
+    python -m benchmarks.corpus record     # 네트워크가 있는 곳에서 한 번 실행
+    python -m benchmarks.bench_text_extraction
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, List, Tuple
+
+import feedparser
+
+from benchmarks.corpus import (
+    DEFAULT_CORPUS_DIR,
+    has_corpus,
+    load_feeds,
+    synthetic_pages,
+)
+from src.services.text_extractor import TEXT_EXTRACTION_BACKENDS
+
+REFERENCE_BACKEND = "bs4"
+
+
+def _entry_bodies(corpus_dir: str) -> List[Tuple[str, str]]:
+    """기록된 피드에서 (회사, 항목 HTML) 목록을 만듭니다."""
+    bodies = []
+    for recorded in load_feeds(corpus_dir):
+        feed = feedparser.parse(recorded.body)
+        for entry in feed.entries:
+            if "content" in entry and len(entry.content) > 0:
+                bodies.append((recorded.company, entry.content[0].value))
+            elif "summary" in entry:
+                bodies.append((recorded.company, entry.summary))
+    return bodies
+
+
+def _measure(bodies: List[str], repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, extractor in TEXT_EXTRACTION_BACKENDS.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for body in bodies:
+                extractor(body)
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            "entries_per_sec": round(len(bodies) * repeat / elapsed, 1),
+            "mean_ms": round(elapsed / (len(bodies) * repeat) * 1000, 3),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="텍스트 추출 엔진 벤치마크")
+    parser.add_argument("--corpus-dir", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--synthetic", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if has_corpus(args.corpus_dir):
+        bodies = _entry_bodies(args.corpus_dir)
+        source = args.corpus_dir
+    else:
+        bodies = [("synthetic", page.html) for page in synthetic_pages(args.synthetic)]
+        source = "synthetic"
+
+    reference = TEXT_EXTRACTION_BACKENDS[REFERENCE_BACKEND]
+    mismatches = {
+        name: sum(1 for _, body in bodies if extractor(body) != reference(body))
+        for name, extractor in TEXT_EXTRACTION_BACKENDS.items()
+        if name != REFERENCE_BACKEND
+    }
+
+    by_company: Dict[str, List[str]] = {}
+    for company, body in bodies:
+        by_company.setdefault(company, []).append(body)
+
+    report = {
+        "corpus": source,
+        "entries": len(bodies),
+        "mismatches": mismatches,
+        "all": _measure([body for _, body in bodies], args.repeat),
+    }
+    for company, company_bodies in sorted(by_company.items()):
+        report[company] = _measure(company_bodies, args.repeat)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+웹페이지 썸네일 추출기 마이크로 벤치마크.
+
+기존 BeautifulSoup 기반 구현(메타 태그 find 3회 + 본문 재파싱)과
+lxml 단일 패스 추출기(scan_image_candidates)를 같은 페이지에서 비교합니다.
+
+    python -m benchmarks.corpus record          # 네트워크가 있는 곳에서 한 번 실행
+    python -m benchmarks.bench_thumbnail_extractor
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from benchmarks.corpus import (
+    DEFAULT_CORPUS_DIR,
+    RecordedPage,
+    has_corpus,
+    load_pages,
+    synthetic_pages,
+)
+from src.services.html_image_extractor import scan_image_candidates
+
+
+def legacy_extract(html: str, url: str) -> Optional[str]:
+    """변경 전 extract_thumbnail_from_webpage의 파싱 로직입니다."""
+    soup = BeautifulSoup(html, "lxml")
+
+    og_image = soup.find("meta", property="og:image")
+    if og_image and og_image.get("content"):
+        return urljoin(url, og_image["content"])
+
+    twitter_image = soup.find("meta", attrs={"name": "twitter:image"})
+    if twitter_image and twitter_image.get("content"):
+        return urljoin(url, twitter_image["content"])
+
+    image_src_link = soup.find("link", rel="image_src")
+    if image_src_link and image_src_link.get("href"):
+        return urljoin(url, image_src_link["href"])
+
+    body_soup = BeautifulSoup(html, "lxml")
+    img_tag = body_soup.find("img")
+    if img_tag and img_tag.get("src"):
+        return urljoin(url, img_tag["src"])
+    return None
+
+
+def single_pass_extract(html: str, url: str) -> Optional[str]:
+    best = scan_image_candidates(html).best()
+    return urljoin(url, best[1]) if best else None
+
+
+def _time(
+    func: Callable[[str, str], Optional[str]], pages: List[RecordedPage], repeat: int
+) -> Dict[str, float]:
+    per_page = []
+    for page in pages:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func(page.html, page.url)
+        per_page.append((time.perf_counter() - start) / repeat)
+    total = sum(per_page)
+    return {
+        "total_ms": round(total * 1000, 3),
+        "mean_ms": round(total / len(per_page) * 1000, 3),
+        "pages_per_sec": round(len(per_page) / total, 1) if total else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="썸네일 추출기 마이크로 벤치마크")
+    parser.add_argument("--corpus-dir", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--synthetic", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if has_corpus(args.corpus_dir):
+        pages = load_pages(args.corpus_dir)
+        source = args.corpus_dir
+    else:
+        pages = synthetic_pages(args.synthetic)
+        source = "synthetic"
+
+    mismatches = [
+        page.url
+        for page in pages
+        if legacy_extract(page.html, page.url)
+        != single_pass_extract(page.html, page.url)
+    ]
+
+    report = {"corpus": source, "pages": len(pages), "mismatches": mismatches}
+    by_company: Dict[str, List[RecordedPage]] = {}
+    for page in pages:
+        by_company.setdefault(page.company, []).append(page)
+    for company, company_pages in sorted(by_company.items()):
+        report[company] = {
+            "legacy": _time(legacy_extract, company_pages, args.repeat),
+            "single_pass": _time(single_pass_extract, company_pages, args.repeat),
+        }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
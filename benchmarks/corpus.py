@@ -0,0 +1,171 @@
+"""
+벤치마크용 피드/웹페이지 코퍼스를 기록하고 불러옵니다.
+
+`python -m benchmarks.corpus record` 로 설정된 모든 블로그의 피드와 글 페이지를
+내려받아 저장해 두면, 이후 벤치마크는 네트워크 없이 같은 코퍼스로 실행됩니다.
+코퍼스가 없을 때는 합성 데이터로 대체할 수 있습니다.
+"""
+
+import argparse
+import json
+import os
+import random
+from dataclasses import dataclass
+from typing import List
+
+import feedparser
+import requests
+
+from src.config.blog_config import BLOG_CONFIGS
+from src.services.crawler_constants import REQUEST_TIMEOUT
+from src.utils.http_client import http_client
+
+DEFAULT_CORPUS_DIR = os.path.join(os.path.dirname(__file__), "corpus")
+
+
+@dataclass
+class RecordedPage:
+    """기록된 글 페이지 하나를 나타냅니다."""
+
+    company: str
+    url: str
+    html: str
+
+
+@dataclass
+class RecordedFeed:
+    """기록된 피드 하나를 나타냅니다."""
+
+    company: str
+    url: str
+    body: bytes
+
+
+def record_corpus(corpus_dir: str, pages_per_blog: int) -> None:
+    """설정된 모든 블로그의 피드와 최신 글 페이지를 corpus_dir에 저장합니다."""
+    os.makedirs(os.path.join(corpus_dir, "feeds"), exist_ok=True)
+    os.makedirs(os.path.join(corpus_dir, "pages"), exist_ok=True)
+    index = {"feeds": [], "pages": []}
+
+    for config in BLOG_CONFIGS:
+        company = config["company"].name.lower()
+        try:
+            response = http_client.get(
+                config["blog_url"], kind="feed", timeout=REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"피드 기록 실패: {config['blog_url']} - {e}")
+            continue
+
+        feed_path = os.path.join("feeds", f"{company}.xml")
+        with open(os.path.join(corpus_dir, feed_path), "wb") as f:
+            f.write(response.content)
+        index["feeds"].append(
+            {"company": company, "url": config["blog_url"], "path": feed_path}
+        )
+
+        feed = feedparser.parse(response.content)
+        for i, entry in enumerate(feed.entries[:pages_per_blog]):
+            link = entry.get("link")
+            if not link:
+                continue
+            try:
+                page = http_client.get(link, kind="html", timeout=REQUEST_TIMEOUT)
+                page.raise_for_status()
+            except requests.RequestException as e:
+                print(f"페이지 기록 실패: {link} - {e}")
+                continue
+            page_path = os.path.join("pages", f"{company}_{i}.html")
+            with open(os.path.join(corpus_dir, page_path), "w", encoding="utf-8") as f:
+                f.write(page.text)
+            index["pages"].append({"company": company, "url": link, "path": page_path})
+
+    with open(os.path.join(corpus_dir, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    print(
+        f"{len(index['feeds'])}개 피드, {len(index['pages'])}개 페이지를 "
+        f"{corpus_dir}에 기록했습니다."
+    )
+
+
+def has_corpus(corpus_dir: str) -> bool:
+    return os.path.exists(os.path.join(corpus_dir, "index.json"))
+
+
+def load_pages(corpus_dir: str) -> List[RecordedPage]:
+    """기록된 글 페이지를 불러옵니다."""
+    index = _load_index(corpus_dir)
+    pages = []
+    for item in index["pages"]:
+        with open(os.path.join(corpus_dir, item["path"]), encoding="utf-8") as f:
+            pages.append(RecordedPage(item["company"], item["url"], f.read()))
+    return pages
+
+
+def load_feeds(corpus_dir: str) -> List[RecordedFeed]:
+    """기록된 피드를 불러옵니다."""
+    index = _load_index(corpus_dir)
+    feeds = []
+    for item in index["feeds"]:
+        with open(os.path.join(corpus_dir, item["path"]), "rb") as f:
+            feeds.append(RecordedFeed(item["company"], item["url"], f.read()))
+    return feeds
+
+
+def synthetic_pages(count: int, seed: int = 0) -> List[RecordedPage]:
+    """
+    실제 기술 블로그와 비슷한 구조의 합성 페이지를 만듭니다.
+
+    큰 인라인 스크립트/스타일, 긴 본문, 메타 태그 유무를 섞어서 생성합니다.
+    """
+    rng = random.Random(seed)
+    pages = []
+    for i in range(count):
+        meta = ""
+        variant = i % 4
+        if variant == 0:
+            meta = f'<meta property="og:image" content="/og/{i}.png">'
+        elif variant == 1:
+            meta = f'<meta name="twitter:image" content="/tw/{i}.png">'
+        elif variant == 2:
+            meta = f'<link rel="image_src" href="/src/{i}.png">'
+        head = (
+            f"<head><meta charset='utf-8'><title>글 {i}</title>"
+            f"<style>{'.c{color:red}' * rng.randint(500, 3000)}</style>"
+            f"<script>{'var a=1;' * rng.randint(1000, 5000)}</script>{meta}</head>"
+        )
+        paragraphs = "".join(
+            f"<p>문단 {j} 본문 텍스트입니다. lorem ipsum dolor sit amet.</p>"
+            + (f"<pre><code>{'x = 1' * 50}</code></pre>" if j % 7 == 0 else "")
+            for j in range(rng.randint(50, 400))
+        )
+        body = f"<body><article>{paragraphs}<img src='/body/{i}.png'></article></body>"
+        pages.append(
+            RecordedPage(
+                "synthetic",
+                f"https://example.com/post/{i}",
+                f"<!DOCTYPE html><html>{head}{body}</html>",
+            )
+        )
+    return pages
+
+
+def _load_index(corpus_dir: str) -> dict:
+    with open(os.path.join(corpus_dir, "index.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크 코퍼스 기록 도구")
+    parser.add_argument("command", choices=["record"])
+    parser.add_argument("--corpus-dir", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--pages-per-blog", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record_corpus(args.corpus_dir, args.pages_per_blog)
+
+
+if __name__ == "__main__":
+    main()
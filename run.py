@@ -1,17 +1,65 @@
 import argparse
+import json
 import logging
+import os
+import sqlite3
 import sys
-from typing import Any, Callable, List, Tuple
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from src.config.api_config import OPENAI_API_KEY
-from src.config.blog_config import BLOG_CONFIGS
-from src.models.dto import CrawledContentDto
+from src.config.api_config import (
+    OPENAI_API_KEY,
+    OPENAI_MODEL_NAME,
+    SUMMARY_CONCURRENCY,
+)
+from src.config.blog_config import (
+    FEED_REGISTRY_PATH,
+    FeedRegistry,
+    feed_registry,
+    load_blog_configs,
+    parse_shard,
+)
+from src.config.cache_config import RUN_REPORT_DIR
+from src.config.dedup_config import NEAR_DUPLICATE_MAX_DISTANCE
+from src.config.pipeline_config import (
+    DEDUP_WORKERS,
+    PIPELINE_QUEUE_SIZE,
+    SAVE_WORKERS,
+    SUMMARIZE_WORKERS,
+    THUMBNAIL_WORKERS,
+)
+from src.models.dto import CrawledContentDto, CrawlWatermark
 from src.models.enums import Company
 from src.services.crawler import BlogCrawler
+from src.services.crawler_constants import (
+    CRAWL_CONCURRENCY,
+    FEED_TIMEOUT,
+    PER_HOST_CONCURRENCY,
+    RUN_TIMEOUT,
+    TEXT_EXTRACTION_BACKEND,
+)
+from src.services.llm_rate_limiter import llm_rate_limiter
+from src.services.llm_usage import llm_usage
+from src.services.summarizer import (
+    FIELD_SOURCES,
+    SUMMARY_BACKENDS,
+    SUMMARY_FALLBACKS,
+    summary_policy,
+)
+from src.services.summary_chunker import summary_token_stats
+from src.services.text_extractor import TEXT_EXTRACTION_BACKENDS
+from src.utils.feed_poll_log import feed_poll_log
+from src.utils.http_archive import HttpArchive
+from src.utils.http_cache import http_cache
+from src.utils.http_client import http_client
+from src.utils.http_retry import http_guard
+from src.utils.known_urls import KnownUrlIndex
+from src.utils.summary_cache import summary_cache
+from src.utils.transfer_stats import thumbnail_stats
 
 logging.basicConfig(
     level=logging.INFO,
@@ -29,8 +77,8 @@ def setup_parser() -> argparse.ArgumentParser:
         "mode",
         nargs="?",
         default="crawl",
-        choices=["crawl", "crawl-only"],
-        help="실행 모드를 선택합니다 (기본값: 'crawl'). 'crawl'(크롤링, 처리, 저장), 'crawl-only'(크롤링만)",
+        choices=["crawl", "crawl-only", "reclassify", "migrate"],
+        help="실행 모드를 선택합니다 (기본값: 'crawl'). 'crawl'(크롤링, 처리, 저장), 'crawl-only'(크롤링만), 'reclassify'(저장된 포스트를 로컬 분류기로 다시 분류), 'migrate'(company_posts의 source_url_hash 마이그레이션을 적용하고 중복 URL 보고서 출력)",
     )
     parser.add_argument(
         "--max-posts",
@@ -46,57 +94,356 @@ def setup_parser() -> argparse.ArgumentParser:
         default="ALL",
         help="크롤링할 회사 선택 (기본값: ALL)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=CRAWL_CONCURRENCY,
+        help=f"동시에 크롤링할 최대 피드 수, 1이면 순차 실행 (기본값: {CRAWL_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--per-host-limit",
+        type=int,
+        default=PER_HOST_CONCURRENCY,
+        help=f"같은 호스트에 대한 최대 동시 크롤링 수 (기본값: {PER_HOST_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--feed-timeout",
+        type=float,
+        default=FEED_TIMEOUT,
+        help=f"피드 하나의 크롤링 제한 시간(초), 0이면 제한 없음 (기본값: {FEED_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--run-timeout",
+        type=float,
+        default=RUN_TIMEOUT,
+        help=f"전체 크롤링 제한 시간(초), 0이면 제한 없음 (기본값: {RUN_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--no-http-cache",
+        action="store_true",
+        help="피드/웹페이지 HTTP 캐시(조건부 GET)를 사용하지 않습니다.",
+    )
+    parser.add_argument(
+        "--no-summary-cache",
+        action="store_true",
+        help="요약 캐시를 사용하지 않고 모든 포스트를 LLM으로 요약합니다.",
+    )
+    report_group = parser.add_mutually_exclusive_group()
+    report_group.add_argument(
+        "--run-report",
+        metavar="PATH",
+        default=None,
+        help=f"LLM 호출별 토큰, 지연 시간, 재시도, 비용을 실행/회사/포스트별로 집계한 JSON 보고서 경로 (기본값: {RUN_REPORT_DIR}/run-<UTC 시각>.json)",
+    )
+    report_group.add_argument(
+        "--no-run-report",
+        action="store_true",
+        help="실행 보고서를 저장하지 않습니다.",
+    )
+    archive_group = parser.add_mutually_exclusive_group()
+    archive_group.add_argument(
+        "--record",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help="피드/웹페이지/이미지 응답을 DIR의 HTTP 아카이브에 기록합니다.",
+    )
+    archive_group.add_argument(
+        "--replay",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help="네트워크 대신 DIR의 HTTP 아카이브에 기록된 응답을 사용합니다.",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        default=0.0,
+        help="재생할 때 기록된 응답 시간에 곱할 배율, 0이면 지연 없음 (기본값: 0)",
+    )
+    parser.add_argument(
+        "--text-backend",
+        choices=sorted(TEXT_EXTRACTION_BACKENDS),
+        default=TEXT_EXTRACTION_BACKEND,
+        help=f"본문 텍스트 추출 엔진 (기본값: {TEXT_EXTRACTION_BACKEND})",
+    )
+    parser.add_argument(
+        "--ignore-watermarks",
+        action="store_true",
+        help="증분 크롤링 기준점을 무시하고 각 피드의 최신 포스트부터 다시 크롤링합니다.",
+    )
+    parser.add_argument(
+        "--no-known-url-filter",
+        action="store_true",
+        help="크롤링 단계에서 이미 저장된 URL을 걸러내지 않습니다. (중복 검사는 처리 단계에서 수행)",
+    )
+    parser.add_argument(
+        "--field-source",
+        choices=FIELD_SOURCES,
+        default=summary_policy.field_source,
+        help=f"분류 방식, local이면 LLM에는 요약만 요청하고 저장된 포스트로 학습한 로컬 분류기로 분류 (기본값: {summary_policy.field_source})",
+    )
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="reclassify 모드에서 다시 분류한 결과를 데이터베이스에 저장합니다. (없으면 보고서만 출력)",
+    )
+    parser.add_argument(
+        "--near-duplicate-distance",
+        type=int,
+        default=NEAR_DUPLICATE_MAX_DISTANCE,
+        help=f"본문 지문(SimHash)의 해밍 거리가 이 값 이하이면 근사 중복으로 보고 건너뜁니다 (기본값: {NEAR_DUPLICATE_MAX_DISTANCE})",
+    )
+    parser.add_argument(
+        "--no-near-duplicate-filter",
+        action="store_true",
+        help="본문 근사 중복 검사를 하지 않습니다. (URL 중복 검사는 수행)",
+    )
+    parser.add_argument(
+        "--feed-registry",
+        type=str,
+        default=None,
+        help=f"피드 레지스트리 JSON 파일 경로 (기본값: {FEED_REGISTRY_PATH})",
+    )
+    parser.add_argument(
+        "--shard",
+        type=_shard_arg,
+        default=(0, 1),
+        metavar="i/N",
+        help="레지스트리를 N개로 나눈 것 중 i번(0부터 시작) 샤드만 크롤링합니다 (기본값: 0/1)",
+    )
+    parser.add_argument(
+        "--ignore-poll-interval",
+        action="store_true",
+        help="피드별 poll_interval을 무시하고 최근에 크롤링한 피드도 크롤링합니다.",
+    )
+    parser.add_argument(
+        "--summary-concurrency",
+        type=int,
+        default=SUMMARY_CONCURRENCY,
+        help=f"일괄 요약 시 동시에 보낼 최대 요약 요청 수 (기본값: {SUMMARY_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--summary-backend",
+        choices=SUMMARY_BACKENDS,
+        default=summary_policy.backend,
+        help=f"요약 방식, local이면 LLM 없이 TextRank로 요약 (기본값: {summary_policy.backend})",
+    )
+    parser.add_argument(
+        "--local-summary-max-chars",
+        type=int,
+        default=summary_policy.local_max_chars,
+        help=f"본문이 이 글자 수 이하이면 LLM 대신 로컬 요약기를 사용, 0이면 사용 안 함 (기본값: {summary_policy.local_max_chars})",
+    )
+    parser.add_argument(
+        "--summary-fallback",
+        choices=SUMMARY_FALLBACKS,
+        default=summary_policy.fallback,
+        help=f"LLM 요약 실패 시 local이면 로컬 요약으로 대체, none이면 저장하지 않음 (기본값: {summary_policy.fallback})",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="크롤링 → 중복 확인 → 요약 → 썸네일 → 저장을 단계별 워커로 동시에 실행하고, 포스트를 끝나는 대로 저장합니다.",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=PIPELINE_QUEUE_SIZE,
+        help=f"파이프라인 단계 사이 큐의 최대 크기 (기본값: {PIPELINE_QUEUE_SIZE})",
+    )
+    parser.add_argument(
+        "--dedup-workers",
+        type=int,
+        default=DEDUP_WORKERS,
+        help=f"파이프라인 중복 확인 워커 수 (기본값: {DEDUP_WORKERS})",
+    )
+    parser.add_argument(
+        "--summarize-workers",
+        type=int,
+        default=SUMMARIZE_WORKERS,
+        help=f"파이프라인 요약 워커 수 (기본값: {SUMMARIZE_WORKERS})",
+    )
+    parser.add_argument(
+        "--thumbnail-workers",
+        type=int,
+        default=THUMBNAIL_WORKERS,
+        help=f"썸네일 다운로드/업로드 워커 수 (기본값: {THUMBNAIL_WORKERS})",
+    )
+    parser.add_argument(
+        "--save-workers",
+        type=int,
+        default=SAVE_WORKERS,
+        help=f"파이프라인 저장 워커 수 (기본값: {SAVE_WORKERS})",
+    )
     return parser
 
 
-def _get_target_configs(company_arg: str) -> List[dict]:
-    """Helper function to get target blog configurations based on company argument."""
-    if company_arg == "ALL":
-        return BLOG_CONFIGS
+def _shard_arg(value: str) -> Tuple[int, int]:
+    """Parse the --shard argument."""
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
 
-    target_configs = [
-        config for config in BLOG_CONFIGS if config["company"].name == company_arg
-    ]
+def _get_target_configs(args: argparse.Namespace) -> List[dict]:
+    """Helper function to get target blog configurations from command line arguments."""
+    registry = feed_registry
+    if args.feed_registry:
+        registry = FeedRegistry(load_blog_configs(args.feed_registry))
+
+    target_configs = registry.by_company(args.company)
     if not target_configs:
-        logger.warning(f"{company_arg}에 해당하는 블로그 설정이 없습니다.")
+        logger.warning(f"{args.company}에 해당하는 블로그 설정이 없습니다.")
+        return []
+
+    shard_index, shard_total = args.shard
+    if shard_total > 1:
+        target_configs = registry.shard(target_configs, shard_index, shard_total)
+        logger.info(
+            f"샤드 {shard_index}/{shard_total}: {len(target_configs)}개 블로그를 크롤링합니다."
+        )
+
+    # 재생 모드는 기록된 코퍼스 전체를 다시 크롤링하므로 poll_interval을 적용하지 않습니다.
+    if not args.ignore_poll_interval and not args.replay:
+        due_configs = [
+            config
+            for config in target_configs
+            if feed_poll_log.is_due(config["blog_url"], config["poll_interval"])
+        ]
+        skipped = len(target_configs) - len(due_configs)
+        if skipped:
+            logger.info(f"poll_interval이 지나지 않은 {skipped}개 블로그를 건너뜁니다.")
+        target_configs = due_configs
     return target_configs
 
 
-def _run_crawler(target_configs: List[dict], max_posts: int) -> List[CrawledContentDto]:
+def _near_duplicate_distance(args: argparse.Namespace) -> Optional[int]:
+    """근사 중복 검사에 쓸 최대 해밍 거리를 반환합니다. 검사하지 않으면 None."""
+    if args.no_near_duplicate_filter:
+        return None
+    return args.near_duplicate_distance
+
+
+def _build_crawler(
+    args: argparse.Namespace,
+    watermarks: Optional[Dict[str, CrawlWatermark]] = None,
+    known_urls: Optional[KnownUrlIndex] = None,
+) -> BlogCrawler:
+    """Helper function to build a crawler from command line arguments."""
+    return BlogCrawler(
+        concurrency=args.concurrency,
+        per_host_limit=args.per_host_limit,
+        feed_timeout=args.feed_timeout or None,
+        run_timeout=args.run_timeout or None,
+        watermarks=watermarks,
+        text_backend=args.text_backend,
+        known_urls=known_urls,
+        poll_log=feed_poll_log if args.mode == "crawl" and not args.replay else None,
+    )
+
+
+def _run_crawler(
+    target_configs: List[dict],
+    args: argparse.Namespace,
+    watermarks: Optional[Dict[str, CrawlWatermark]] = None,
+    known_urls: Optional[KnownUrlIndex] = None,
+) -> List[CrawledContentDto]:
     """Helper function to run the crawler and return crawled posts."""
-    crawler = BlogCrawler()
-    logger.info(f"크롤링을 시작합니다... (대상: {len(target_configs)}개 블로그)")
+    crawler = _build_crawler(args, watermarks, known_urls)
+    logger.info(
+        f"크롤링을 시작합니다... (대상: {len(target_configs)}개 블로그, 동시성: {crawler.concurrency})"
+    )
     crawled_posts = crawler.crawl_all_sources(
-        configs=target_configs, max_posts=max_posts
+        configs=target_configs, max_posts=args.max_posts
     )
     logger.info(f"총 {len(crawled_posts)}개의 포스트를 크롤링했습니다.")
+    if http_cache.enabled:
+        logger.info(f"HTTP 캐시 통계: {http_cache.stats()}")
     return crawled_posts
 
 
 def run_crawl_and_process(
     args: argparse.Namespace,
-    process_posts: Callable[[List[CrawledContentDto]], List[Any]],
+    process_posts: Callable[
+        [List[CrawledContentDto], int, Optional[int], int], List[Any]
+    ],
     save_to_rds: Callable[[List[Any]], Tuple[int, int]],
+    load_watermarks: Optional[Callable[[], Dict[str, CrawlWatermark]]] = None,
+    advance_watermarks: Optional[Callable[[List[CrawledContentDto]], int]] = None,
+    load_known_urls: Optional[Callable[[], Optional[KnownUrlIndex]]] = None,
 ) -> int:
     """Crawl, process, and save posts."""
-    target_configs = _get_target_configs(args.company)
+    target_configs = _get_target_configs(args)
     if not target_configs:
         return 0
 
     try:
-        crawled_posts = _run_crawler(target_configs, args.max_posts)
+        watermarks = None
+        if load_watermarks and not args.ignore_watermarks:
+            watermarks = load_watermarks()
+        known_urls = None
+        if load_known_urls and not args.no_known_url_filter:
+            known_urls = load_known_urls()
+        crawled_posts = _run_crawler(target_configs, args, watermarks, known_urls)
 
         if not crawled_posts:
             logger.info("저장할 포스트가 없습니다.")
             return 0
 
         logger.info("포스트 처리 중...")
-        processed_posts = process_posts(crawled_posts)
+        processed_posts = process_posts(
+            crawled_posts,
+            args.summary_concurrency,
+            _near_duplicate_distance(args),
+            args.thumbnail_workers,
+        )
 
         logger.info("RDS에 저장 중...")
         saved, errors = save_to_rds(processed_posts)
         logger.info(f"RDS 저장 완료: {saved}개 성공, {errors}개 실패")
 
+        if advance_watermarks:
+            advance_watermarks(crawled_posts)
+
+    except Exception as e:
+        logger.error(f"처리 중 오류 발생: {e}", exc_info=True)
+        return 1
+    return 0
+
+
+def run_pipeline(
+    args: argparse.Namespace,
+    pipeline: Any,
+    load_watermarks: Optional[Callable[[], Dict[str, CrawlWatermark]]] = None,
+    advance_watermarks: Optional[Callable[[List[CrawledContentDto]], int]] = None,
+    load_known_urls: Optional[Callable[[], Optional[KnownUrlIndex]]] = None,
+) -> int:
+    """Crawl, process, and save posts through the staged pipeline."""
+    target_configs = _get_target_configs(args)
+    if not target_configs:
+        return 0
+
+    try:
+        watermarks = None
+        if load_watermarks and not args.ignore_watermarks:
+            watermarks = load_watermarks()
+        known_urls = None
+        if load_known_urls and not args.no_known_url_filter:
+            known_urls = load_known_urls()
+        crawler = _build_crawler(args, watermarks, known_urls)
+
+        logger.info(
+            f"파이프라인 모드로 크롤링을 시작합니다... (대상: {len(target_configs)}개 블로그)"
+        )
+        result = pipeline.run(crawler, target_configs, args.max_posts)
+        if http_cache.enabled:
+            logger.info(f"HTTP 캐시 통계: {http_cache.stats()}")
+
+        if advance_watermarks and result.crawled_posts:
+            advance_watermarks(result.crawled_posts)
+
     except Exception as e:
         logger.error(f"처리 중 오류 발생: {e}", exc_info=True)
         return 1
@@ -105,12 +452,12 @@ def run_crawl_and_process(
 
 def run_crawl_only(args: argparse.Namespace) -> int:
     """Crawl and print posts without saving."""
-    target_configs = _get_target_configs(args.company)
+    target_configs = _get_target_configs(args)
     if not target_configs:
         return 0
 
     try:
-        crawled_posts = _run_crawler(target_configs, args.max_posts)
+        crawled_posts = _run_crawler(target_configs, args)
 
         for i, post in enumerate(crawled_posts, 1):
             logger.info(f"[{i}] {post.title}")
@@ -125,26 +472,175 @@ def run_crawl_only(args: argparse.Namespace) -> int:
     return 0
 
 
-def main() -> int:
-    """Main entry point of the application."""
-    parser = setup_parser()
-    args = parser.parse_args()
+def run_reclassify(
+    args: argparse.Namespace, reclassify_posts: Callable[[bool], Dict[str, Any]]
+) -> int:
+    """Re-classify stored posts with the local classifier and print the report."""
+    try:
+        report = reclassify_posts(args.apply)
+    except Exception as e:
+        logger.error(f"다시 분류하는 중 오류 발생: {e}", exc_info=True)
+        return 1
+
+    logger.info(
+        f"다시 분류 보고서:\n{json.dumps(report, ensure_ascii=False, indent=2)}"
+    )
+    if args.apply:
+        logger.info(f"분류 변경 저장 완료: {report['updated']}개")
+    else:
+        logger.info(
+            f"{report['changed']}개 포스트의 분류가 달라집니다. 저장하려면 --apply를 사용하세요."
+        )
+    return 0
 
-    if not OPENAI_API_KEY:
-        logger.error("OPENAI_API_KEY가 설정되지 않았습니다. .env 파일을 확인해주세요.")
+
+def run_migrate(migrate: Callable[[], Dict[str, Any]]) -> int:
+    """Apply the schema migration and print the report."""
+    try:
+        report = migrate()
+    except Exception as e:
+        logger.error(f"마이그레이션 중 오류 발생: {e}", exc_info=True)
         return 1
 
-    from src.database import init_db
+    logger.info(
+        f"마이그레이션 보고서:\n{json.dumps(report, ensure_ascii=False, indent=2)}"
+    )
+    return 0
+
 
-    init_db()
-    from src.core.db_handler import save_to_rds
-    from src.core.post_processor import process_posts
+def _run_report_path(args: argparse.Namespace, started_at: datetime) -> Optional[str]:
+    """실행 보고서를 저장할 경로를 반환합니다. 저장하지 않으면 None."""
+    if args.no_run_report or args.mode != "crawl":
+        return None
+    if args.run_report:
+        return args.run_report
+    return os.path.join(
+        RUN_REPORT_DIR, f"run-{started_at.strftime('%Y%m%dT%H%M%SZ')}.json"
+    )
+
+
+def write_run_report(path: str, args: argparse.Namespace, started_at: datetime) -> None:
+    """LLM 사용량 보고서에 실행 정보와 요약 관련 통계를 더해 저장하고, 합계를 로그로 남깁니다."""
+    saved = llm_usage.write_report(
+        path,
+        run={
+            "started_at": started_at.isoformat(),
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+            "mode": "pipeline" if args.pipeline else args.mode,
+            "company": args.company,
+            "model": OPENAI_MODEL_NAME,
+            "summary_concurrency": args.summary_concurrency,
+            "summary_backend": args.summary_backend,
+            "field_source": args.field_source,
+        },
+        summary_routes=summary_policy.stats(),
+        summary_tokens=summary_token_stats.stats(),
+        rate_limiter=llm_rate_limiter.stats(),
+        thumbnails=thumbnail_stats.stats(),
+    )
+    totals = llm_usage.report(top=0)["totals"]
+    logger.info(
+        f"LLM 사용량: 호출 {totals['calls']}회, 입력 {totals['prompt_tokens']} / "
+        f"출력 {totals['completion_tokens']} 토큰, 약 ${totals['cost_usd']:.4f}, "
+        f"재시도 {totals['retries']}회, 파싱 실패 {totals['parse_failures']}회, "
+        f"p95 지연 {totals['latency_p95_ms']}ms"
+    )
+    if saved:
+        logger.info(f"실행 보고서 저장 완료: {path}")
+
+
+def main() -> int:
+    """Main entry point of the application."""
+    parser = setup_parser()
+    args = parser.parse_args()
+    started_at = datetime.now(timezone.utc)
+    http_cache.enabled = not args.no_http_cache
+    summary_cache.enabled = not args.no_summary_cache
+    summary_policy.backend = args.summary_backend
+    summary_policy.local_max_chars = args.local_summary_max_chars
+    summary_policy.fallback = args.summary_fallback
+    summary_policy.field_source = args.field_source
+    archive = None
+    if args.record or args.replay:
+        try:
+            archive = HttpArchive(
+                args.record or args.replay,
+                HttpArchive.RECORD if args.record else HttpArchive.REPLAY,
+                latency_scale=args.replay_latency,
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"HTTP 아카이브를 열지 못했습니다: {e}")
+            return 1
+        http_client.use_archive(archive)
+        # 조건부 GET의 304 응답은 재생할 수 없으므로 아카이브 사용 중에는 캐시를 끕니다.
+        http_cache.enabled = False
 
     try:
-        if args.mode == "crawl":
-            return run_crawl_and_process(args, process_posts, save_to_rds)
-        elif args.mode == "crawl-only":
+        # crawl-only는 데이터베이스와 LLM을 쓰지 않으므로 키 확인과 DB 연결 없이 실행합니다.
+        if args.mode == "crawl-only":
             return run_crawl_only(args)
+
+        if (
+            args.mode == "crawl"
+            and args.summary_backend == "llm"
+            and not OPENAI_API_KEY
+        ):
+            logger.error(
+                "OPENAI_API_KEY가 설정되지 않았습니다. .env 파일을 확인해주세요."
+            )
+            return 1
+        if args.replay and not os.getenv("DATABASE_URL"):
+            logger.error(
+                "crawl-only가 아닌 모드에서 --replay를 사용하려면 DATABASE_URL로 로컬 데이터베이스를 "
+                "지정해야 합니다. (운영 데이터베이스에 연결하지 않기 위함)"
+            )
+            return 1
+
+        from src.database import init_db, migrate_source_url_hash
+
+        init_db(check_schema=args.mode != "migrate")
+        from src.core.db_handler import (
+            advance_watermarks,
+            load_known_urls,
+            load_watermarks,
+            save_to_rds,
+        )
+        from src.core.field_reclassifier import (
+            reclassify_posts,
+            train_field_classifier,
+        )
+        from src.core.post_processor import process_posts
+
+        if args.mode == "reclassify":
+            return run_reclassify(args, reclassify_posts)
+        if args.mode == "migrate":
+            return run_migrate(migrate_source_url_hash)
+        if args.field_source == "local":
+            train_field_classifier()
+
+        if args.mode == "crawl" and args.pipeline:
+            from src.core.pipeline import PostPipeline
+
+            pipeline = PostPipeline(
+                queue_size=args.queue_size,
+                dedup_workers=args.dedup_workers,
+                summarize_workers=args.summarize_workers,
+                thumbnail_workers=args.thumbnail_workers,
+                save_workers=args.save_workers,
+                near_duplicate_distance=_near_duplicate_distance(args),
+            )
+            return run_pipeline(
+                args, pipeline, load_watermarks, advance_watermarks, load_known_urls
+            )
+        elif args.mode == "crawl":
+            return run_crawl_and_process(
+                args,
+                process_posts,
+                save_to_rds,
+                load_watermarks,
+                advance_watermarks,
+                load_known_urls,
+            )
         else:
             parser.print_help()
             return 1
@@ -152,6 +648,23 @@ def main() -> int:
     except Exception as e:
         logger.error(f"실행 중 오류 발생: {e}", exc_info=True)
         return 1
+    finally:
+        logger.info(f"HTTP 연결/전송량 통계: {http_client.stats()}")
+        logger.info(f"HTTP 재시도/회로 차단기 상태: {http_guard.stats()}")
+        http_cache.close()
+        if summary_cache.enabled:
+            logger.info(f"요약 캐시 통계: {summary_cache.stats()}")
+        logger.info(f"요약 입력 토큰 통계(추정): {summary_token_stats.stats()}")
+        logger.info(f"LLM 요청 한도 통계: {llm_rate_limiter.stats()}")
+        logger.info(f"요약 경로 통계: {summary_policy.stats()}")
+        logger.info(f"썸네일 다운로드/업로드 통계: {thumbnail_stats.stats()}")
+        report_path = _run_report_path(args, started_at)
+        if report_path:
+            write_run_report(report_path, args, started_at)
+        summary_cache.close()
+        if archive is not None:
+            logger.info(f"HTTP 아카이브 통계: {archive.stats()}")
+            archive.close()
 
 
 if __name__ == "__main__":
@@ -1,4 +1,4 @@
 from src.config.api_config import OPENAI_API_KEY
-from src.config.blog_config import BLOG_CONFIGS
+from src.config.blog_config import BLOG_CONFIGS, feed_registry
 
-__all__ = ["OPENAI_API_KEY", "BLOG_CONFIGS"]
+__all__ = ["OPENAI_API_KEY", "BLOG_CONFIGS", "feed_registry"]
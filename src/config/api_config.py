@@ -1,17 +1,58 @@
 import logging
 import os
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# LLM을 쓰지 않는 실행(crawl-only 등)도 있으므로 키는 LLM을 쓰는 모드에서 run.py가 확인합니다.
 OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
 
-if not OPENAI_API_KEY:
-    error_message = "OPENAI_API_KEY가 .env 파일에 제대로 설정되지 않았습니다. 프로그램을 종료합니다."
-    logger.error(error_message)
-    raise ValueError(error_message)
-
 OPENAI_MODEL_NAME: str = os.getenv("OPENAI_MODEL_NAME", "gpt-4o-mini")
 OPENAI_TEMPERATURE: float = float(os.getenv("OPENAI_MODEL_TEMPERATURE", 0.3))
+SUMMARY_CONCURRENCY: int = int(os.getenv("SUMMARY_CONCURRENCY", 4))
+# 본문 토큰(추정치)이 이보다 많으면 조각으로 나눠 요약합니다 (map-reduce).
+SUMMARY_MAX_INPUT_TOKENS: int = int(os.getenv("SUMMARY_MAX_INPUT_TOKENS", 6000))
+SUMMARY_CHUNK_TOKENS: int = int(os.getenv("SUMMARY_CHUNK_TOKENS", 2500))
+# 요약 방식: "llm"(기본) 또는 "local"(모든 콘텐츠를 LLM 없이 TextRank로 요약).
+SUMMARY_BACKEND: str = os.getenv("SUMMARY_BACKEND", "llm")
+# 공백을 정리한 본문이 이 글자 수 이하이면 LLM을 부르지 않고 로컬 요약기를 씁니다 (0이면 사용 안 함).
+LOCAL_SUMMARY_MAX_CHARS: int = int(os.getenv("LOCAL_SUMMARY_MAX_CHARS", 500))
+# LLM 요약이 재시도 후에도 실패했을 때: "local"이면 로컬 요약으로 대체, "none"이면 저장하지 않습니다.
+SUMMARY_FALLBACK: str = os.getenv("SUMMARY_FALLBACK", "local")
+# 분류 방식: "llm"이면 요약과 함께 LLM에 분류도 요청하고, "local"이면 요약만 요청하고 로컬 분류기로 분류합니다.
+FIELD_SOURCE: str = os.getenv("FIELD_SOURCE", "llm")
+# 요청 한 번의 출력 토큰 예상치. 요청 전에 TPM 예산에서 입력 토큰과 함께 미리 차감합니다.
+SUMMARY_OUTPUT_TOKENS: int = int(os.getenv("SUMMARY_OUTPUT_TOKENS", 800))
+
+# OpenAI 계정의 분당 요청 수(RPM)/토큰 수(TPM) 한도. 응답의 x-ratelimit-* 헤더가 있으면 그 값을 따릅니다.
+OPENAI_RPM_LIMIT: int = int(os.getenv("OPENAI_RPM_LIMIT", 500))
+OPENAI_TPM_LIMIT: int = int(os.getenv("OPENAI_TPM_LIMIT", 200000))
+# 동시 요청 수는 SUMMARY_CONCURRENCY에서 시작해 429 응답과 지연 시간에 따라 1~OPENAI_MAX_CONCURRENCY 사이에서 조정됩니다.
+OPENAI_MAX_CONCURRENCY: int = int(os.getenv("OPENAI_MAX_CONCURRENCY", 16))
+OPENAI_LATENCY_TARGET: float = float(os.getenv("OPENAI_LATENCY_TARGET", 30))
+OPENAI_MAX_RETRIES: int = int(os.getenv("OPENAI_MAX_RETRIES", 6))
+OPENAI_RETRY_AFTER_MAX: float = float(os.getenv("OPENAI_RETRY_AFTER_MAX", 120))
+
+# 모델별 100만 토큰당 가격(USD, 입력/출력). 응답의 모델 이름이 가장 길게 일치하는 이름으로 시작하면 그 가격을 씁니다.
+OPENAI_MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+}
+# 둘 다 설정하면 모델과 관계없이 이 가격(100만 토큰당 USD)으로 비용을 계산합니다.
+OPENAI_INPUT_PRICE_PER_1M: Optional[float] = (
+    float(os.environ["OPENAI_INPUT_PRICE_PER_1M"])
+    if os.getenv("OPENAI_INPUT_PRICE_PER_1M")
+    else None
+)
+OPENAI_OUTPUT_PRICE_PER_1M: Optional[float] = (
+    float(os.environ["OPENAI_OUTPUT_PRICE_PER_1M"])
+    if os.getenv("OPENAI_OUTPUT_PRICE_PER_1M")
+    else None
+)
 
 logger.info(f"OpenAI 모델: {OPENAI_MODEL_NAME}, 온도: {OPENAI_TEMPERATURE}")
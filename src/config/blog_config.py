@@ -1,7 +1,26 @@
-from typing import List, TypedDict
+import hashlib
+import json
+import logging
+import os
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple, TypedDict
 
 from src.models.enums import Company
 
+logger = logging.getLogger(__name__)
+
+FEED_REGISTRY_PATH: str = os.getenv(
+    "FEED_REGISTRY_PATH", os.path.join(os.path.dirname(__file__), "feeds.json")
+)
+
+# 샤드 하나가 해시 링 위에 놓이는 가상 노드 수
+SHARD_VIRTUAL_NODES = 64
+
+DEFAULT_FEED_TYPE = "rss"
+DEFAULT_POLL_INTERVAL = 0
+DEFAULT_PRIORITY = 0
+
 
 class BlogConfig(TypedDict):
     """
@@ -11,52 +30,153 @@ class BlogConfig(TypedDict):
         blog_url: 블로그의 RSS/Atom 피드 URL.
         name: 블로그의 이름 (표시용).
         company: Company Enum으로 정의된 회사 식별자.
+        type: 피드 파서를 고를 블로그 타입 (BlogType 값, 예: "naver", "medium", "rss").
+        poll_interval: 최소 크롤링 간격(초). 0이면 실행할 때마다 크롤링합니다.
+        priority: 크롤링 우선순위. 클수록 먼저 크롤링합니다.
     """
 
     blog_url: str
     name: str
     company: Company
+    type: str
+    poll_interval: int
+    priority: int
+
+
+def load_blog_configs(path: str = FEED_REGISTRY_PATH) -> List[BlogConfig]:
+    """
+    피드 레지스트리(JSON 배열) 파일에서 블로그 설정을 불러옵니다.
+
+    company는 Company 이름(예: "NAVER")이며, 정의되지 않은 회사는 Company.ETC로 처리합니다.
+    같은 blog_url이 여러 번 있으면 처음 것만 사용합니다.
+
+    Args:
+        path: 레지스트리 파일 경로.
+
+    Returns:
+        우선순위가 높은 순서로 정렬된 블로그 설정 목록.
+
+    Raises:
+        OSError: 파일을 읽지 못한 경우.
+        ValueError: 파일 형식이 잘못된 경우.
+    """
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"피드 레지스트리는 JSON 배열이어야 합니다: {path}")
+
+    configs: List[BlogConfig] = []
+    seen = set()
+    for entry in entries:
+        blog_url = entry.get("blog_url")
+        if not blog_url:
+            raise ValueError(f"blog_url이 없는 피드 레지스트리 항목입니다: {entry}")
+        if blog_url in seen:
+            logger.warning(f"피드 레지스트리에 중복된 blog_url이 있습니다: {blog_url}")
+            continue
+        seen.add(blog_url)
+
+        company_name = str(entry.get("company", "ETC")).upper()
+        company = Company.__members__.get(company_name, Company.ETC)
+        configs.append(
+            {
+                "blog_url": blog_url,
+                "name": entry.get("name") or blog_url,
+                "company": company,
+                "type": entry.get("type") or DEFAULT_FEED_TYPE,
+                "poll_interval": int(entry.get("poll_interval", DEFAULT_POLL_INTERVAL)),
+                "priority": int(entry.get("priority", DEFAULT_PRIORITY)),
+            }
+        )
+
+    configs.sort(key=lambda config: -config["priority"])
+    return configs
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    "i/N" 형식의 샤드 지정을 (i, N)으로 변환합니다. i는 0부터 N-1까지입니다.
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 범위를 벗어난 경우.
+    """
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"샤드는 'i/N' 형식이어야 합니다: {value}")
+    if total < 1 or not 0 <= index < total:
+        raise ValueError(f"샤드 번호는 0 이상 {total} 미만이어야 합니다: {value}")
+    return index, total
+
+
+def _ring_hash(key: str) -> int:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8)
+    return int.from_bytes(digest.digest(), "big")
+
+
+class FeedRegistry:
+    """
+    블로그 설정 목록과 그 조회 인덱스입니다.
+
+    회사별/URL별 조회는 미리 만든 딕셔너리로 처리하고, 여러 실행기가 레지스트리를
+    나눠 크롤링할 수 있도록 일관된 해싱(consistent hashing)으로 샤드를 나눕니다.
+    피드는 blog_url의 해시로 링 위의 샤드에 배정되므로 샤드끼리 겹치지 않고,
+    샤드 수가 바뀌어도 대부분의 피드는 원래 샤드에 남습니다.
+    """
+
+    def __init__(self, configs: Iterable[BlogConfig]):
+        self.configs: List[BlogConfig] = list(configs)
+        self._by_url: Dict[str, BlogConfig] = {}
+        self._by_company: Dict[str, List[BlogConfig]] = defaultdict(list)
+        for config in self.configs:
+            self._by_url[config["blog_url"]] = config
+            self._by_company[config["company"].name].append(config)
+        self._rings: Dict[int, Tuple[List[int], List[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.configs)
+
+    def get(self, blog_url: str) -> Optional[BlogConfig]:
+        """blog_url에 해당하는 설정을 반환합니다."""
+        return self._by_url.get(blog_url)
+
+    def by_company(self, company_name: str) -> List[BlogConfig]:
+        """회사 이름(Company 멤버 이름)에 해당하는 설정 목록을 반환합니다. "ALL"이면 전체입니다."""
+        if company_name == "ALL":
+            return list(self.configs)
+        return list(self._by_company.get(company_name, ()))
+
+    def shard_of(self, blog_url: str, total: int) -> int:
+        """blog_url이 배정되는 샤드 번호를 반환합니다."""
+        points, owners = self._ring(total)
+        position = bisect_right(points, _ring_hash(blog_url)) % len(points)
+        return owners[position]
+
+    def shard(
+        self, configs: List[BlogConfig], index: int, total: int
+    ) -> List[BlogConfig]:
+        """configs 중 index번 샤드에 배정된 설정만 순서를 유지하여 반환합니다."""
+        if total <= 1:
+            return list(configs)
+        return [
+            config
+            for config in configs
+            if self.shard_of(config["blog_url"], total) == index
+        ]
+
+    def _ring(self, total: int) -> Tuple[List[int], List[int]]:
+        ring = self._rings.get(total)
+        if ring is None:
+            nodes = sorted(
+                (_ring_hash(f"shard-{shard}-{vnode}"), shard)
+                for shard in range(total)
+                for vnode in range(SHARD_VIRTUAL_NODES)
+            )
+            ring = ([point for point, _ in nodes], [shard for _, shard in nodes])
+            self._rings[total] = ring
+        return ring
+
 
+feed_registry = FeedRegistry(load_blog_configs())
 
-BLOG_CONFIGS: List[BlogConfig] = [
-    {
-        "blog_url": "https://d2.naver.com/d2.atom",
-        "name": "네이버 기술 블로그",
-        "company": Company.NAVER,
-    },
-    {
-        "blog_url": "https://tech.kakao.com/feed",
-        "name": "카카오 기술 블로그",
-        "company": Company.KAKAO,
-    },
-    {
-        "blog_url": "https://politepol.com/fd/XiV8r39FL4YI",
-        "name": "데보션 기술 블로그",
-        "company": Company.DEVOCEAN,
-    },
-    {
-        "blog_url": "https://toss.tech/atom.xml",
-        "name": "토스 기술 블로그",
-        "company": Company.TOSS,
-    },
-    {
-        "blog_url": "https://medium.com/feed/myrealtrip-product",
-        "name": "마이리얼트립 기술 블로그",
-        "company": Company.MY_REAL_TRIP,
-    },
-    {
-        "blog_url": "https://techblog.lycorp.co.jp/ko/feed/index.xml",
-        "name": "라인 기술 블로그",
-        "company": Company.LINE,
-    },
-    {
-        "blog_url": "https://medium.com/feed/daangn",
-        "name": "당근마켓 기술 블로그",
-        "company": Company.DAANGN,
-    },
-    {
-        "blog_url": "https://oliveyoung.tech/rss.xml",
-        "name": "올리브영 기술 블로그",
-        "company": Company.OLIVE_YOUNG,
-    },
-]
+BLOG_CONFIGS: List[BlogConfig] = feed_registry.configs
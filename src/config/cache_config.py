@@ -0,0 +1,22 @@
+import os
+
+CACHE_DIR: str = os.getenv("CRAWLER_CACHE_DIR", ".cache")
+
+HTTP_CACHE_PATH: str = os.path.join(CACHE_DIR, "http_cache.sqlite3")
+HTTP_CACHE_TTL: int = int(os.getenv("HTTP_CACHE_TTL", 7 * 24 * 60 * 60))
+HTTP_CACHE_MAX_BYTES: int = int(os.getenv("HTTP_CACHE_MAX_BYTES", 200 * 1024 * 1024))
+
+SOURCE_PROFILE_PATH: str = os.path.join(CACHE_DIR, "source_profiles.json")
+KNOWN_URLS_PATH: str = os.path.join(CACHE_DIR, "known_urls.bin")
+FEED_POLL_LOG_PATH: str = os.path.join(CACHE_DIR, "feed_polls.json")
+
+SUMMARY_CACHE_PATH: str = os.path.join(CACHE_DIR, "summary_cache.sqlite3")
+SUMMARY_CACHE_TTL: int = int(os.getenv("SUMMARY_CACHE_TTL", 90 * 24 * 60 * 60))
+SUMMARY_CACHE_MAX_BYTES: int = int(
+    os.getenv("SUMMARY_CACHE_MAX_BYTES", 50 * 1024 * 1024)
+)
+
+# 실행마다 LLM 사용량/지연 시간/비용 보고서(JSON)를 남기는 디렉토리입니다.
+RUN_REPORT_DIR: str = os.getenv(
+    "RUN_REPORT_DIR", os.path.join(CACHE_DIR, "run_reports")
+)
@@ -0,0 +1,9 @@
+import os
+
+# 두 글의 SimHash 지문(64비트)이 이 해밍 거리 이하이면 근사 중복으로 봅니다.
+NEAR_DUPLICATE_MAX_DISTANCE: int = int(os.getenv("NEAR_DUPLICATE_MAX_DISTANCE", 6))
+SIMHASH_SHINGLE_SIZE: int = 3
+# 서로 다른 shingle이 이보다 적은 짧은 글은 지문이 불안정하므로 근사 중복 검사를 하지 않습니다.
+SIMHASH_MIN_SHINGLES: int = int(os.getenv("SIMHASH_MIN_SHINGLES", 30))
+# 저장된 포스트 URL을 조회할 때 IN 절 하나에 넣을 최대 URL 수입니다.
+DEDUP_LOOKUP_BATCH_SIZE: int = int(os.getenv("DEDUP_LOOKUP_BATCH_SIZE", 500))
@@ -0,0 +1,25 @@
+import os
+
+# 재시도 정책: 일시적인 오류(연결 실패, 타임아웃, 429/5xx)에 대해서만 재시도합니다.
+MAX_RETRIES: int = int(os.getenv("HTTP_MAX_RETRIES", 3))
+RETRY_BACKOFF_BASE: float = 0.5
+RETRY_BACKOFF_MAX: float = 8.0
+RETRY_AFTER_MAX: float = 60.0
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# 호스트별 회로 차단기: 연속 실패가 임계값에 도달하면 일정 시간 요청을 바로 실패시킵니다.
+BREAKER_FAILURE_THRESHOLD: int = 5
+BREAKER_RESET_TIMEOUT: float = 60.0
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# 공유 HTTP 클라이언트의 연결 풀 설정: 캐시할 호스트 풀 수와 호스트당 최대 연결 수입니다.
+POOL_CONNECTIONS: int = 32
+POOL_MAXSIZE: int = 8
+
+# 응답 종류별 Accept 헤더입니다.
+ACCEPT_HEADERS = {
+    "feed": "application/atom+xml,application/rss+xml,application/xml;q=0.9,text/xml;q=0.9,*/*;q=0.8",
+    "html": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "image": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+}
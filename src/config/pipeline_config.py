@@ -0,0 +1,5 @@
+PIPELINE_QUEUE_SIZE = 8
+DEDUP_WORKERS = 1
+SUMMARIZE_WORKERS = 4
+THUMBNAIL_WORKERS = 4
+SAVE_WORKERS = 1
@@ -1,4 +1,17 @@
-from src.core.db_handler import save_to_rds
+from src.core.db_handler import (
+    advance_watermarks,
+    load_known_urls,
+    load_watermarks,
+    save_to_rds,
+)
+from src.core.pipeline import PostPipeline
 from src.core.post_processor import process_posts
 
-__all__ = ["process_posts", "save_to_rds"]
+__all__ = [
+    "process_posts",
+    "save_to_rds",
+    "load_watermarks",
+    "advance_watermarks",
+    "load_known_urls",
+    "PostPipeline",
+]
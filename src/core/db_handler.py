@@ -1,19 +1,48 @@
 import logging
+from collections import defaultdict
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Generator, List, Tuple
+from typing import Dict, Generator, Iterable, List, Optional, Set, Tuple
 
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from src.database import DBCompanyPost, get_db
-from src.models.dto import CompanyPost
+from src.config.cache_config import KNOWN_URLS_PATH
+from src.config.dedup_config import DEDUP_LOOKUP_BATCH_SIZE
+from src.database import (
+    DBCompanyPost,
+    DBCrawlWatermark,
+    DBPost,
+    DBPostFingerprint,
+    get_db,
+)
+from src.models.dto import CompanyPost, CrawledContentDto, CrawlWatermark
+from src.models.enums import Field
+from src.utils.date_utils import to_naive_utc, watermark_time
+from src.utils.known_urls import KnownUrlIndex
+from src.utils.near_duplicates import (
+    NearDuplicateIndex,
+    NearDuplicateMatch,
+    format_fingerprint,
+    parse_fingerprint,
+)
+from src.utils.url_utils import normalize_url, url_hash
 
 logger = logging.getLogger(__name__)
 
 
 def save_to_rds(posts: List[CompanyPost]) -> Tuple[int, int]:
-    """주어진 CompanyPost 목록을 단일 트랜잭션으로 RDS에 저장합니다."""
+    """
+    주어진 CompanyPost 목록을 단일 트랜잭션으로 RDS에 저장합니다.
+
+    같은 URL이 이미 저장되어 있으면(동시에 실행된 다른 크롤러가 먼저 저장한 경우 등)
+    source_url_hash 유니크 인덱스 위반으로 배치가 롤백되므로, 포스트마다 다시 저장하여
+    중복된 포스트만 건너뜁니다. 건너뛴 포스트는 실패 수에 넣지 않고 로그로 따로 남깁니다.
+
+    Returns:
+        (저장한 포스트 수, 저장하지 못한 포스트 수).
+    """
     if not posts:
         return 0, 0
 
@@ -24,28 +53,16 @@ def save_to_rds(posts: List[CompanyPost]) -> Tuple[int, int]:
         with _db_session_manager() as db:
             logger.info(f"RDS에 {len(posts)}개 포스트 저장을 시도합니다.")
             for post_dto in posts:
-                db_post = DBCompanyPost(
-                    title=post_dto.title,
-                    content=post_dto.summary,
-                    field=post_dto.field,
-                    company=post_dto.company,
-                    source_url=post_dto.url,
-                    thumbnail_image_url=post_dto.thumbnail_url,
-                    published_at=post_dto.published_at,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
-                    view_count=0,
-                )
-                db.add(db_post)
+                _add_post(db, post_dto)
 
             saved_count = len(posts)
 
     except IntegrityError as e:
-        logger.error(
-            f"무결성 제약 조건 위반. 중복된 URL이 있을 수 있습니다. 전체 배치가 롤백됩니다. 오류: {e}",
-            exc_info=True,
+        logger.warning(
+            f"이미 저장된 URL이 있어 배치가 롤백되었습니다. 포스트별로 다시 저장합니다. 오류: {e.orig}"
         )
-        error_count = len(posts)
+        saved_count, _, error_count = _save_individually(posts)
+        return saved_count, error_count
     except Exception as e:
         logger.error(
             f"데이터베이스 저장 중 오류 발생. 전체 배치가 롤백됩니다. 오류: {e}",
@@ -60,6 +77,398 @@ def save_to_rds(posts: List[CompanyPost]) -> Tuple[int, int]:
     return final_saved_count, error_count
 
 
+def _add_post(db: Session, post_dto: CompanyPost) -> None:
+    db.add(
+        DBCompanyPost(
+            title=post_dto.title,
+            content=post_dto.summary,
+            field=post_dto.field,
+            company=post_dto.company,
+            source_url=post_dto.url,
+            source_url_hash=url_hash(post_dto.url),
+            thumbnail_image_url=post_dto.thumbnail_url,
+            published_at=post_dto.published_at,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            view_count=0,
+        )
+    )
+    if post_dto.fingerprint:
+        db.merge(
+            DBPostFingerprint(
+                source_url=post_dto.url,
+                fingerprint=post_dto.fingerprint,
+                created_at=datetime.now(),
+            )
+        )
+
+
+def _save_individually(posts: List[CompanyPost]) -> Tuple[int, int, int]:
+    """
+    포스트마다 SAVEPOINT를 두고 저장하여, 이미 저장된 URL의 포스트만 건너뜁니다.
+
+    Returns:
+        (저장한 수, 이미 저장된 URL이라 건너뛴 수, 다른 오류로 저장하지 못한 수).
+    """
+    saved_count = 0
+    skipped_count = 0
+    failed_count = 0
+    try:
+        with _db_session_manager() as db:
+            for post_dto in posts:
+                try:
+                    with db.begin_nested():
+                        _add_post(db, post_dto)
+                except IntegrityError as e:
+                    if _query_stored_urls(db, [post_dto.url]):
+                        logger.info(
+                            f"  - 이미 저장된 URL이라 건너뜁니다: {post_dto.url}"
+                        )
+                        skipped_count += 1
+                    else:
+                        logger.error(f"  - 포스트 저장 실패: {post_dto.url} - {e.orig}")
+                        failed_count += 1
+                else:
+                    saved_count += 1
+    except Exception as e:
+        logger.error(
+            f"데이터베이스 저장 중 오류 발생. 전체 배치가 롤백됩니다. 오류: {e}",
+            exc_info=True,
+        )
+        return 0, 0, len(posts)
+
+    logger.info(
+        f"RDS 저장 완료: {saved_count}개 성공, 이미 저장된 URL {skipped_count}개 건너뜀, "
+        f"{failed_count}개 실패."
+    )
+    return saved_count, skipped_count, failed_count
+
+
+def find_stored_urls(urls: Iterable[str]) -> Set[str]:
+    """
+    주어진 URL 중 이미 company_posts에 저장된 것을 찾습니다.
+
+    source_url_hash 유니크 인덱스로 DEDUP_LOOKUP_BATCH_SIZE개씩 묶어 조회하므로,
+    URL 수와 관계없이 쿼리는 몇 번만 보냅니다.
+
+    Args:
+        urls: 확인할 URL 목록. 정규화하여 비교합니다.
+
+    Returns:
+        저장된 정규화 URL 집합.
+
+    Raises:
+        Exception: 데이터베이스 조회에 실패한 경우.
+    """
+    normalized_urls = {normalize_url(url) for url in urls} - {""}
+    if not normalized_urls:
+        return set()
+
+    with _db_session_manager() as db:
+        return _query_stored_urls(db, normalized_urls)
+
+
+def _query_stored_urls(db: Session, normalized_urls: Iterable[str]) -> Set[str]:
+    urls_by_hash = {url_hash(url): url for url in normalized_urls}
+    hashes = list(urls_by_hash)
+    stored: Set[str] = set()
+    for start in range(0, len(hashes), DEDUP_LOOKUP_BATCH_SIZE):
+        stored.update(
+            urls_by_hash[row[0]]
+            for row in db.query(DBCompanyPost.source_url_hash)
+            .filter(
+                DBCompanyPost.source_url_hash.in_(
+                    hashes[start : start + DEDUP_LOOKUP_BATCH_SIZE]
+                )
+            )
+            .all()
+        )
+    return stored
+
+
+def load_watermarks() -> Dict[str, CrawlWatermark]:
+    """저장된 피드별 증분 크롤링 기준점을 feed_url을 키로 하여 불러옵니다."""
+    try:
+        with _db_session_manager() as db:
+            rows = db.query(DBCrawlWatermark).all()
+            watermarks = {
+                row.feed_url: CrawlWatermark(
+                    feed_url=row.feed_url,
+                    entry_id=row.last_entry_id,
+                    published_at=row.last_published_at,
+                )
+                for row in rows
+            }
+    except Exception as e:
+        logger.error(
+            f"크롤링 기준점을 불러오지 못했습니다. 전체 항목을 크롤링합니다. 오류: {e}",
+            exc_info=True,
+        )
+        return {}
+
+    logger.info(f"{len(watermarks)}개 피드의 크롤링 기준점을 불러왔습니다.")
+    return watermarks
+
+
+def load_known_urls(path: str = KNOWN_URLS_PATH) -> Optional[KnownUrlIndex]:
+    """
+    이미 저장된 포스트 URL의 인덱스를 불러옵니다.
+
+    로컬에 저장된 인덱스가 있으면 그 이후에 추가된 행(id 기준)만 조회하여 반영하고,
+    인덱스에 반영된 행 중 삭제된 것이 있거나 인덱스가 없으면 전체를 다시 만듭니다.
+
+    Returns:
+        KnownUrlIndex 객체. 데이터베이스를 조회하지 못하면 None.
+    """
+    index = KnownUrlIndex.load(path)
+    try:
+        with _db_session_manager() as db:
+            if index is not None:
+                # 인덱스에 반영된 구간(id <= max_id)의 행 수가 다르면 그 사이에 행이
+                # 삭제된 것이므로 다시 만듭니다. 전체 행 수로 비교하면 삭제 후 새 행이
+                # 추가된 경우를 놓칩니다.
+                indexed = (
+                    db.query(func.count(DBCompanyPost.id))
+                    .filter(DBCompanyPost.id <= index.max_id)
+                    .scalar()
+                    or 0
+                )
+                if indexed != index.row_count:
+                    index = None
+            if index is None:
+                index = KnownUrlIndex()
+
+            rows = (
+                db.query(DBCompanyPost.id, DBCompanyPost.source_url)
+                .filter(DBCompanyPost.id > index.max_id)
+                .all()
+            )
+    except Exception as e:
+        logger.error(
+            f"저장된 URL 인덱스를 불러오지 못했습니다. 크롤링 단계 필터 없이 진행합니다. 오류: {e}",
+            exc_info=True,
+        )
+        return None
+
+    if rows:
+        index.add_urls(source_url for _, source_url in rows)
+        index.max_id = max(post_id for post_id, _ in rows)
+        index.row_count += len(rows)
+        index.save(path)
+
+    logger.info(f"저장된 URL {len(index)}개를 불러왔습니다. (새로 반영: {len(rows)}개)")
+    return index
+
+
+def load_near_duplicate_index(max_distance: int) -> Optional[NearDuplicateIndex]:
+    """
+    저장된 포스트의 본문 지문으로 근사 중복 인덱스를 만듭니다.
+
+    지문은 포스트를 저장할 때 함께 기록되므로, 이 기능 이전에 저장된 포스트는 인덱스에 없습니다.
+
+    Args:
+        max_distance: 근사 중복으로 볼 최대 해밍 거리.
+
+    Returns:
+        NearDuplicateIndex 객체. 데이터베이스를 조회하지 못하면 None.
+    """
+    index = NearDuplicateIndex(max_distance)
+    try:
+        with _db_session_manager() as db:
+            rows = (
+                db.query(DBPostFingerprint.source_url, DBPostFingerprint.fingerprint)
+                .filter(DBPostFingerprint.duplicate_of.is_(None))
+                .all()
+            )
+    except Exception as e:
+        logger.error(
+            f"근사 중복 인덱스를 불러오지 못했습니다. URL 중복 검사만 수행합니다. 오류: {e}",
+            exc_info=True,
+        )
+        return None
+
+    for source_url, fingerprint in rows:
+        index.add(source_url, parse_fingerprint(fingerprint))
+    logger.info(f"저장된 포스트 지문 {len(index)}개로 근사 중복 인덱스를 만들었습니다.")
+    return index
+
+
+def record_near_duplicates(matches: List[NearDuplicateMatch]) -> None:
+    """
+    근사 중복으로 건너뛴 포스트를 기록합니다.
+
+    기록된 포스트는 저장된 포스트처럼 취급되어 크롤링 기준점이 그 뒤로 전진합니다.
+    같은 실행에서 처리 중인(아직 저장되지 않은) 포스트와 겹친 경우는 원본이 저장되지
+    않을 수도 있으므로 기록하지 않고, 다음 실행에서 다시 확인합니다.
+    """
+    matches = [match for match in matches if match.stored]
+    if not matches:
+        return
+    try:
+        with _db_session_manager() as db:
+            for match in matches:
+                db.merge(
+                    DBPostFingerprint(
+                        source_url=normalize_url(match.url),
+                        fingerprint=format_fingerprint(match.fingerprint),
+                        duplicate_of=match.duplicate_of,
+                        distance=match.distance,
+                        created_at=datetime.now(),
+                    )
+                )
+    except Exception as e:
+        logger.error(f"근사 중복 기록 중 오류 발생: {e}", exc_info=True)
+
+
+def load_labeled_posts() -> List[Tuple[int, str, str, Field]]:
+    """
+    분류가 저장된 회사 블로그 포스트를 불러옵니다.
+
+    Returns:
+        (id, 제목, 요약, 분류) 목록.
+
+    Raises:
+        Exception: 데이터베이스 조회에 실패한 경우.
+    """
+    with _db_session_manager() as db:
+        rows = (
+            db.query(
+                DBCompanyPost.id,
+                DBCompanyPost.title,
+                DBCompanyPost.content,
+                DBCompanyPost.field,
+            )
+            .filter(DBCompanyPost.field.isnot(None))
+            .filter(DBCompanyPost.content.isnot(None))
+            .all()
+        )
+    return [
+        (post_id, title or "", content, field)
+        for post_id, title, content, field in rows
+    ]
+
+
+def update_post_fields(fields: Dict[int, Field], batch_size: int = 1000) -> int:
+    """
+    포스트의 분류를 한 트랜잭션으로 바꿉니다. 분류별로 id를 batch_size개씩 묶어 UPDATE합니다.
+
+    Args:
+        fields: 포스트 id별 새 분류.
+        batch_size: UPDATE 한 번에 넣을 최대 id 수.
+
+    Returns:
+        바뀐 행 수.
+
+    Raises:
+        Exception: 데이터베이스 갱신에 실패한 경우. 전체가 롤백됩니다.
+    """
+    ids_by_field: Dict[Field, List[int]] = defaultdict(list)
+    for post_id, field in fields.items():
+        ids_by_field[field].append(post_id)
+
+    updated = 0
+    now = datetime.now()
+    with _db_session_manager() as db:
+        for field, ids in ids_by_field.items():
+            for start in range(0, len(ids), batch_size):
+                updated += (
+                    db.query(DBPost)
+                    .filter(DBPost.id.in_(ids[start : start + batch_size]))
+                    .update(
+                        {DBPost.field: field, DBPost.updated_at: now},
+                        synchronize_session=False,
+                    )
+                )
+    return updated
+
+
+def advance_watermarks(crawled_posts: List[CrawledContentDto]) -> int:
+    """
+    데이터베이스에 실제로 저장된 포스트를 기준으로 피드별 기준점을 전진시킵니다.
+
+    피드마다 발행일 오름차순으로 포스트를 확인하여, 저장되지 않은(근사 중복으로
+    기록되지도 않은) 첫 포스트 직전까지만 기준점을 옮깁니다. 처리나 저장에 실패한 포스트는 기준점 뒤에
+    남으므로 다음 실행에서 다시 크롤링됩니다. 발행일을 파싱하지 못했거나 시간대가 없는 포스트는
+    발행 일시 기준점을 옮기지 않고 entry_id로만 기준점을 남깁니다.
+
+    Returns:
+        기준점이 갱신된 피드 수.
+    """
+    posts_by_feed: Dict[str, List[CrawledContentDto]] = defaultdict(list)
+    for post in crawled_posts:
+        if post.feed_url:
+            posts_by_feed[post.feed_url].append(post)
+    if not posts_by_feed:
+        return 0
+
+    updated = 0
+    try:
+        with _db_session_manager() as db:
+            normalized_urls = {
+                normalize_url(post.url)
+                for posts in posts_by_feed.values()
+                for post in posts
+            }
+            stored_urls = _query_stored_urls(db, normalized_urls - {""})
+            # 근사 중복으로 건너뛴 포스트도 처리된 것으로 봅니다.
+            stored_urls.update(
+                row[0]
+                for row in db.query(DBPostFingerprint.source_url)
+                .filter(DBPostFingerprint.source_url.in_(normalized_urls))
+                .filter(DBPostFingerprint.duplicate_of.isnot(None))
+                .all()
+            )
+
+            for feed_url, posts in posts_by_feed.items():
+                newest = None
+                newest_published = None
+                for post in sorted(posts, key=lambda p: to_naive_utc(p.published_at)):
+                    if normalize_url(post.url) not in stored_urls:
+                        break
+                    newest = post
+                    published = _watermark_time(post)
+                    if published is not None:
+                        newest_published = published
+                if newest is None:
+                    continue
+
+                published_at = _watermark_time(newest)
+                row = db.get(DBCrawlWatermark, feed_url)
+                if row is None:
+                    row = DBCrawlWatermark(feed_url=feed_url, company=newest.company)
+                    db.add(row)
+                elif (
+                    published_at is not None
+                    and row.last_published_at
+                    and row.last_published_at >= published_at
+                ):
+                    continue
+
+                row.last_entry_id = newest.entry_id
+                # 발행일을 믿을 수 없는 포스트(파싱 실패, 시간대 없음)는 entry_id로만 기준점을 옮깁니다.
+                if newest_published is not None and (
+                    row.last_published_at is None
+                    or newest_published > row.last_published_at
+                ):
+                    row.last_published_at = newest_published
+                row.updated_at = datetime.now()
+                updated += 1
+
+    except Exception as e:
+        logger.error(f"크롤링 기준점 갱신 중 오류 발생: {e}", exc_info=True)
+        return 0
+
+    logger.info(f"{updated}개 피드의 크롤링 기준점을 갱신했습니다.")
+    return updated
+
+
+def _watermark_time(post: CrawledContentDto) -> Optional[datetime]:
+    """기준점으로 쓸 수 있는 포스트의 발행 일시(naive UTC). 믿을 수 없으면 None."""
+    if post.published_at_estimated:
+        return None
+    return watermark_time(post.published_at)
+
+
 @contextmanager
 def _db_session_manager() -> Generator[Session, None, None]:
     """Provide a transactional scope around a series of operations."""
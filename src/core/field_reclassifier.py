@@ -0,0 +1,99 @@
+import logging
+import time
+from typing import Any, Dict
+
+from src.core.db_handler import load_labeled_posts, update_post_fields
+from src.services.field_classifier import (
+    FIELD_CLASSIFIER_MIN_POSTS,
+    FieldClassifier,
+    agreement_report,
+    field_classifier,
+    holdout_agreement,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _post_text(title: str, summary: str) -> str:
+    # build_company_post에서 새 포스트를 분류할 때와 같은 형태로 맞춥니다.
+    return f"{title}\n{summary}"
+
+
+def train_field_classifier(classifier: FieldClassifier = field_classifier) -> bool:
+    """
+    저장된 포스트의 분류로 로컬 분류기를 학습합니다.
+
+    Returns:
+        학습했으면 True. 포스트를 불러오지 못했거나 FIELD_CLASSIFIER_MIN_POSTS개보다 적으면 False이며,
+        이때 분류기는 키워드 분류로 대신합니다.
+    """
+    try:
+        rows = load_labeled_posts()
+    except Exception as e:
+        logger.error(
+            f"분류기 학습용 포스트를 불러오지 못했습니다. 키워드 분류를 사용합니다. 오류: {e}",
+            exc_info=True,
+        )
+        return False
+    if len(rows) < FIELD_CLASSIFIER_MIN_POSTS:
+        logger.warning(
+            f"분류가 저장된 포스트가 {len(rows)}개뿐이라 분류기를 학습하지 않습니다. "
+            f"(최소 {FIELD_CLASSIFIER_MIN_POSTS}개) 키워드 분류를 사용합니다."
+        )
+        return False
+
+    started = time.perf_counter()
+    classifier.fit(
+        [_post_text(title, summary) for _, title, summary, _ in rows],
+        [field for _, _, _, field in rows],
+    )
+    logger.info(
+        f"로컬 분류기 학습 완료: 포스트 {len(rows)}개, "
+        f"분류 {len(classifier.fields)}개, {time.perf_counter() - started:.2f}초 소요"
+    )
+    return True
+
+
+def reclassify_posts(apply: bool = False) -> Dict[str, Any]:
+    """
+    저장된 모든 포스트를 로컬 분류기로 한 번에 다시 분류합니다.
+
+    저장된 분류(LLM이 정한 분류)로 학습한 분류기로 모든 포스트를 분류하고, 저장된 분류와의
+    일치도를 보고합니다. 학습에 쓴 포스트의 일치도는 실제보다 높게 나오므로, 일부를 떼어 두고
+    학습한 분류기의 일치도(holdout)도 함께 보고합니다.
+
+    Args:
+        apply: True이면 저장된 분류와 다르게 분류된 포스트의 분류를 바꿉니다.
+
+    Returns:
+        일치도 보고서. apply이면 바뀐 행 수(updated)를 포함합니다.
+    """
+    rows = load_labeled_posts()
+    if len(rows) < FIELD_CLASSIFIER_MIN_POSTS:
+        raise ValueError(
+            f"분류가 저장된 포스트가 {len(rows)}개뿐이라 다시 분류할 수 없습니다. "
+            f"(최소 {FIELD_CLASSIFIER_MIN_POSTS}개)"
+        )
+    texts = [_post_text(title, summary) for _, title, summary, _ in rows]
+    labels = [field for _, _, _, field in rows]
+
+    classifier = FieldClassifier().fit(texts, labels)
+    started = time.perf_counter()
+    predicted = classifier.predict_many(texts)
+    elapsed = time.perf_counter() - started
+
+    changes = {
+        post_id: field
+        for (post_id, _, _, stored), field in zip(rows, predicted)
+        if field != stored
+    }
+    report: Dict[str, Any] = {
+        "posts": len(rows),
+        "changed": len(changes),
+        "classify_us_per_post": round(elapsed / len(rows) * 1_000_000, 1),
+        "holdout": holdout_agreement(texts, labels),
+        "stored_vs_local": agreement_report(labels, predicted),
+    }
+    if apply:
+        report["updated"] = update_post_fields(changes)
+    return report
@@ -0,0 +1,396 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set
+
+from src.core.db_handler import (
+    find_stored_urls,
+    load_near_duplicate_index,
+    record_near_duplicates,
+    save_to_rds,
+)
+from src.config.dedup_config import NEAR_DUPLICATE_MAX_DISTANCE
+from src.config.pipeline_config import (
+    DEDUP_WORKERS,
+    PIPELINE_QUEUE_SIZE,
+    SAVE_WORKERS,
+    SUMMARIZE_WORKERS,
+    THUMBNAIL_WORKERS,
+)
+from src.core.post_processor import (
+    build_company_post,
+    log_near_duplicate,
+    log_near_duplicate_report,
+    process_thumbnail,
+    summary_source,
+)
+from src.models.dto import CompanyPost, CrawledContentDto
+from src.services.crawler import BlogCrawler
+from src.services.summarizer import summarize_content
+from src.utils.near_duplicates import NearDuplicateIndex, format_fingerprint
+from src.utils.stat_utils import percentile_ms
+from src.utils.url_utils import normalize_url
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+# 첫 단계 큐가 가득 찼을 때 파이프라인이 닫혔는지 다시 확인하는 간격(초)
+_INTAKE_POLL_SECONDS = 0.1
+
+
+@dataclass
+class PipelineItem:
+    """
+    파이프라인 단계 사이를 이동하는 포스트 하나의 처리 상태입니다.
+
+    Attributes:
+        crawled: 크롤링된 원본 포스트.
+        summary_result: 요약 단계의 결과 (summary, field).
+        thumbnail_url: 썸네일 단계에서 처리된 썸네일 URL.
+        post: 저장 단계에서 만든 CompanyPost.
+        fingerprint: 중복 확인 단계에서 계산한 본문 지문.
+        stored: URL이 이미 저장된 포스트인지 여부. 피드 하나의 포스트를 큐에 넣기 전에
+            한 번에 조회합니다.
+    """
+
+    crawled: CrawledContentDto
+    summary_result: Optional[Dict[str, str]] = None
+    thumbnail_url: Optional[str] = None
+    post: Optional[CompanyPost] = None
+    fingerprint: Optional[str] = None
+    stored: bool = False
+
+
+@dataclass
+class StageStats:
+    """
+    파이프라인 단계 하나의 처리 통계입니다.
+
+    Attributes:
+        name: 단계 이름.
+        workers: 워커 수.
+        processed: 다음 단계로 넘긴 항목 수.
+        dropped: 단계에서 걸러진 항목 수 (예: 중복).
+        failed: 처리 중 예외가 발생한 항목 수.
+        latencies: 항목별 처리 시간(초).
+    """
+
+    name: str
+    workers: int
+    processed: int = 0
+    dropped: int = 0
+    failed: int = 0
+    latencies: List[float] = field(default_factory=list, repr=False)
+
+    def summary(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+        return {
+            "workers": self.workers,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "p50_ms": percentile_ms(latencies, 0.50),
+            "p95_ms": percentile_ms(latencies, 0.95),
+            "max_ms": round(latencies[-1] * 1000, 1) if latencies else 0.0,
+        }
+
+
+@dataclass
+class PipelineResult:
+    """
+    파이프라인 실행 결과입니다.
+
+    Attributes:
+        crawled_posts: 크롤링된 모든 포스트 (기준점 갱신에 사용).
+        saved: 저장에 성공한 포스트 수.
+        errors: 저장에 실패한 포스트 수.
+        stages: 단계별 처리 통계.
+        elapsed: 전체 실행 시간(초).
+    """
+
+    crawled_posts: List[CrawledContentDto]
+    saved: int
+    errors: int
+    stages: Dict[str, Dict[str, Any]]
+    elapsed: float
+
+
+class _Stage:
+    """입력 큐에서 항목을 꺼내 처리하고 다음 큐로 넘기는 워커 묶음입니다."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[PipelineItem], bool],
+        workers: int,
+        inbox: "queue.Queue",
+        outbox: Optional["queue.Queue"],
+    ):
+        self.name = name
+        self.func = func
+        self.inbox = inbox
+        self.outbox = outbox
+        self.stats = StageStats(name=name, workers=max(1, workers))
+        self._lock = threading.Lock()
+        self._threads = [
+            threading.Thread(
+                target=self._work, name=f"pipeline-{name}-{index}", daemon=True
+            )
+            for index in range(self.stats.workers)
+        ]
+
+    def start(self) -> None:
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """워커마다 종료 신호를 보내고 모두 끝날 때까지 기다립니다."""
+        for _ in self._threads:
+            self.inbox.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self) -> None:
+        while True:
+            item = self.inbox.get()
+            if item is _STOP:
+                return
+
+            started = time.perf_counter()
+            try:
+                passed = self.func(item)
+            except Exception as e:
+                passed = False
+                with self._lock:
+                    self.stats.failed += 1
+                logger.error(
+                    f"[{self.name}] '{item.crawled.title}' 처리 중 오류 발생: {e}",
+                    exc_info=True,
+                )
+            else:
+                with self._lock:
+                    if passed:
+                        self.stats.processed += 1
+                    else:
+                        self.stats.dropped += 1
+            finally:
+                with self._lock:
+                    self.stats.latencies.append(time.perf_counter() - started)
+
+            if passed and self.outbox is not None:
+                self.outbox.put(item)
+
+
+class PostPipeline:
+    """
+    크롤링 → 중복 확인 → 요약 → 썸네일 → 저장을 동시에 실행하는 파이프라인입니다.
+
+    단계 사이는 크기가 제한된 큐로 연결되어, 뒤 단계가 밀리면 앞 단계가 기다립니다.
+    각 포스트는 모든 단계를 마치는 즉시 저장되므로, LLM 대기 시간이 네트워크 I/O와
+    겹치고 실행 도중 중단되어도 이미 끝난 포스트는 남습니다.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+        dedup_workers: int = DEDUP_WORKERS,
+        summarize_workers: int = SUMMARIZE_WORKERS,
+        thumbnail_workers: int = THUMBNAIL_WORKERS,
+        save_workers: int = SAVE_WORKERS,
+        summarize: Callable[
+            [str, Optional[Mapping[str, str]]], Optional[Dict[str, str]]
+        ] = summarize_content,
+        save: Callable[[List[CompanyPost]], Any] = save_to_rds,
+        near_duplicate_distance: Optional[int] = NEAR_DUPLICATE_MAX_DISTANCE,
+    ):
+        """파이프라인 초기화
+
+        Args:
+            queue_size: 단계 사이 큐의 최대 크기.
+            dedup_workers: 중복 확인 워커 수.
+            summarize_workers: 요약 워커 수.
+            thumbnail_workers: 썸네일 다운로드/업로드 워커 수.
+            save_workers: 저장 워커 수.
+            summarize: 콘텐츠와 포스트 정보(summary_source)를 받는 요약 함수.
+                None을 반환하면 포스트를 저장하지 않습니다.
+            save: CompanyPost 목록을 저장하고 (성공 수, 실패 수)를 반환하는 함수.
+            near_duplicate_distance: 근사 중복으로 볼 최대 지문 해밍 거리. None이면 검사하지 않습니다.
+        """
+        self.queue_size = max(1, queue_size)
+        self.worker_counts = {
+            "dedup": dedup_workers,
+            "summarize": summarize_workers,
+            "thumbnail": thumbnail_workers,
+            "save": save_workers,
+        }
+        self.summarize = summarize
+        self.save = save
+        self.near_duplicate_distance = near_duplicate_distance
+        self._near_duplicates: Optional[NearDuplicateIndex] = None
+        self._saved = 0
+        self._errors = 0
+        self._save_lock = threading.Lock()
+
+    def run(
+        self, crawler: BlogCrawler, configs: List[Dict[str, Any]], max_posts: int
+    ) -> PipelineResult:
+        """
+        파이프라인을 실행합니다. 모든 단계가 끝날 때까지 반환하지 않습니다.
+
+        Args:
+            crawler: 크롤링에 사용할 BlogCrawler.
+            configs: 크롤링할 블로그 설정 목록.
+            max_posts: 블로그별 최대 포스트 수.
+
+        Returns:
+            PipelineResult 객체.
+        """
+        started = time.perf_counter()
+        if self.near_duplicate_distance is not None:
+            self._near_duplicates = load_near_duplicate_index(
+                self.near_duplicate_distance
+            )
+        funcs = {
+            "dedup": self._dedup,
+            "summarize": self._summarize,
+            "thumbnail": self._thumbnail,
+            "save": self._save,
+        }
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in funcs]
+        stages = [
+            _Stage(
+                name,
+                func,
+                self.worker_counts[name],
+                queues[index],
+                queues[index + 1] if index + 1 < len(queues) else None,
+            )
+            for index, (name, func) in enumerate(funcs.items())
+        ]
+        for stage in stages:
+            stage.start()
+
+        # 실행 시간 제한으로 crawl_all_sources가 먼저 반환되면 이미 시작된 피드 스레드가
+        # 단계가 멈춘 뒤에도 포스트를 넘길 수 있으므로, 닫힌 뒤의 포스트는 버리고 기록합니다.
+        closed = threading.Event()
+        intake_lock = threading.Lock()
+
+        def on_posts(posts: List[CrawledContentDto]) -> None:
+            stored_urls = _find_stored_urls(posts)
+            for index, post in enumerate(posts):
+                item = PipelineItem(
+                    crawled=post, stored=normalize_url(post.url) in stored_urls
+                )
+                while True:
+                    with intake_lock:
+                        if closed.is_set():
+                            logger.warning(
+                                f"파이프라인 종료 후 도착한 포스트 {len(posts) - index}개를 "
+                                f"처리하지 않습니다. (첫 포스트: {post.url})"
+                            )
+                            return
+                        try:
+                            queues[0].put(item, timeout=_INTAKE_POLL_SECONDS)
+                            break
+                        except queue.Full:
+                            pass
+
+        crawled_posts: List[CrawledContentDto] = []
+        crawl_elapsed = 0.0
+        try:
+            crawled_posts = crawler.crawl_all_sources(
+                configs=configs, max_posts=max_posts, on_posts=on_posts
+            )
+            crawl_elapsed = time.perf_counter() - started
+        finally:
+            with intake_lock:
+                closed.set()
+            for stage in stages:
+                stage.stop()
+
+        crawl_stats = {
+            "workers": crawler.concurrency,
+            "processed": len(crawled_posts),
+            "elapsed_ms": round(crawl_elapsed * 1000, 1),
+        }
+        result = PipelineResult(
+            crawled_posts=crawled_posts,
+            saved=self._saved,
+            errors=self._errors,
+            stages={
+                "crawl": crawl_stats,
+                **{stage.name: stage.stats.summary() for stage in stages},
+            },
+            elapsed=time.perf_counter() - started,
+        )
+        logger.info(
+            f"파이프라인 완료: {result.saved}개 저장, {result.errors}개 실패, "
+            f"{result.elapsed:.1f}초 소요"
+        )
+        for name, stats in result.stages.items():
+            logger.info(f"  - [{name}] {stats}")
+        if self._near_duplicates is not None:
+            log_near_duplicate_report(self._near_duplicates)
+        return result
+
+    def _dedup(self, item: PipelineItem) -> bool:
+        url = normalize_url(item.crawled.url)
+        if item.stored:
+            logger.info(f"이미 저장된 포스트: {item.crawled.title} (건너뜀)")
+            return False
+        if self._near_duplicates is None:
+            return True
+
+        fingerprint, match = self._near_duplicates.check(
+            url, item.crawled.title, item.crawled.content
+        )
+        if match is not None:
+            log_near_duplicate(match)
+            record_near_duplicates([match])
+            return False
+        if fingerprint is not None:
+            item.fingerprint = format_fingerprint(fingerprint)
+        return True
+
+    def _summarize(self, item: PipelineItem) -> bool:
+        item.summary_result = self.summarize(
+            item.crawled.content, summary_source(item.crawled)
+        )
+        return item.summary_result is not None
+
+    def _thumbnail(self, item: PipelineItem) -> bool:
+        item.thumbnail_url = process_thumbnail(
+            item.crawled.thumbnail_url, item.crawled.company.name.lower()
+        )
+        return True
+
+    def _save(self, item: PipelineItem) -> bool:
+        item.post = build_company_post(
+            item.crawled, item.summary_result, item.thumbnail_url
+        )
+        if item.post is None:
+            return False
+        item.post.fingerprint = item.fingerprint
+
+        saved, errors = self.save([item.post])
+        with self._save_lock:
+            self._saved += saved
+            self._errors += errors
+        return saved > 0
+
+
+def _find_stored_urls(posts: List[CrawledContentDto]) -> Set[str]:
+    """
+    피드 하나에서 크롤링된 포스트 중 이미 저장된 URL을 한 번에 조회합니다.
+
+    조회에 실패하면 중복 검사 없이 다시 요약하지 않도록 예외를 그대로 전달하여 실행을 멈춥니다.
+    """
+    try:
+        return find_stored_urls(post.url for post in posts)
+    except Exception as e:
+        logger.error(
+            f"저장된 포스트를 조회하지 못해 파이프라인을 중단합니다. 오류: {e}"
+        )
+        raise
@@ -1,166 +1,276 @@
 import logging
-from typing import Generator, List, Optional, Tuple
-from urllib.parse import unquote, urlparse, urlunparse
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set
 
 import requests
-from sqlalchemy.orm import Session
 
-from src.database import DBCompanyPost, get_db, init_db
+from src.config.api_config import SUMMARY_CONCURRENCY
+from src.config.dedup_config import NEAR_DUPLICATE_MAX_DISTANCE
+from src.config.pipeline_config import THUMBNAIL_WORKERS
+from src.core.db_handler import (
+    find_stored_urls,
+    load_near_duplicate_index,
+    record_near_duplicates,
+)
 from src.models.dto import CompanyPost, CrawledContentDto
 from src.models.enums import Field
-from src.services.summarizer import summarize_content
+from src.services.field_classifier import field_classifier
+from src.services.summarizer import summarize_contents
+from src.utils.http_client import http_client
+from src.utils.http_retry import CircuitOpenError
+from src.utils.near_duplicates import (
+    NearDuplicateIndex,
+    NearDuplicateMatch,
+    format_fingerprint,
+)
 from src.utils.s3_uploader import s3_uploader
+from src.utils.transfer_stats import thumbnail_stats
+from src.utils.url_utils import normalize_url
 
 logger = logging.getLogger(__name__)
 
 
-def process_posts(crawled_posts: List[CrawledContentDto]) -> List[CompanyPost]:
-    """크롤링된 포스트를 처리하고 요약을 추가합니다."""
+def process_posts(
+    crawled_posts: List[CrawledContentDto],
+    summary_concurrency: int = SUMMARY_CONCURRENCY,
+    near_duplicate_distance: Optional[int] = NEAR_DUPLICATE_MAX_DISTANCE,
+    thumbnail_workers: int = THUMBNAIL_WORKERS,
+) -> List[CompanyPost]:
+    """
+    크롤링된 포스트를 처리하고 요약을 추가합니다.
+
+    URL이 이미 저장된 포스트(한 번에 일괄 조회)와 본문이 저장된 포스트(또는 앞서 처리한 포스트)의
+    근사 중복인 포스트를 건너뛴 뒤, 나머지를 모아 한 번에 요약 요청을 보내고
+    (최대 summary_concurrency개 동시), 요약 결과를 각 포스트에 맞춰 CompanyPost를 만듭니다.
+    썸네일 다운로드/업로드는 요약을 기다리지 않고 별도의 워커 풀에서 동시에 처리합니다.
+
+    Args:
+        crawled_posts: 크롤링된 포스트 목록.
+        summary_concurrency: 동시에 보낼 최대 요약 요청 수.
+        near_duplicate_distance: 근사 중복으로 볼 최대 지문 해밍 거리. None이면 검사하지 않습니다.
+        thumbnail_workers: 썸네일을 동시에 처리할 워커 수.
+    """
     processed_posts: List[CompanyPost] = []
-    db_session_info = _get_db_session()
-    db = db_session_info[0] if db_session_info else None
+    stored_urls = _find_stored_urls(crawled_posts)
+    near_duplicates = None
+    if near_duplicate_distance is not None:
+        near_duplicates = load_near_duplicate_index(near_duplicate_distance)
 
+    new_posts: List[CrawledContentDto] = []
+    fingerprints: Dict[str, str] = {}
     for i, crawled in enumerate(crawled_posts, 1):
         try:
-            logger.info(f"[{i}/{len(crawled_posts)}] '{crawled.title}' 처리 중...")
-
-            if _is_duplicate_post(db, crawled):
+            logger.info(f"[{i}/{len(crawled_posts)}] '{crawled.title}' 중복 확인 중...")
+            if normalize_url(crawled.url) in stored_urls:
                 logger.info(
                     f"  - 이미 저장된 포스트: {crawled.title} (요약 및 저장 건너뜀)"
                 )
                 continue
-
-            logger.info(f"  - 콘텐츠 요약 중...")
-            summary_result = summarize_content(crawled.content)
-
-            logger.info(f"  - 썸네일 처리 중...")
-            thumbnail_s3_url = _process_thumbnail(
-                crawled.thumbnail_url, crawled.company.name.lower()
-            )
-
-            normalized_url = _normalize_url(crawled.url)
-            if not normalized_url:
-                logger.error(
-                    f"URL 정규화 실패: {crawled.url}. 포스트를 건너<0xEB><01><0x81>니다."
+            if near_duplicates is not None:
+                fingerprint, match = near_duplicates.check(
+                    normalize_url(crawled.url), crawled.title, crawled.content
                 )
-                continue
-
-            processed_post = CompanyPost(
-                title=crawled.title,
-                summary=summary_result["summary"],
-                thumbnail_url=thumbnail_s3_url,
-                field=Field(summary_result["field"]),
-                published_at=crawled.published_at,
-                company=crawled.company,
-                url=normalized_url,
-            )
-
-            processed_posts.append(processed_post)
-            logger.info(f"  - 포스트 처리 완료: {crawled.title}")
-
+                if match is not None:
+                    log_near_duplicate(match)
+                    continue
+                if fingerprint is not None:
+                    fingerprints[crawled.url] = format_fingerprint(fingerprint)
+            new_posts.append(crawled)
         except Exception as e:
             logger.error(
                 f"포스트 '{crawled.title}' 처리 중 오류 발생: {e}", exc_info=True
             )
+    if near_duplicates is not None:
+        record_near_duplicates(near_duplicates.skipped)
+        log_near_duplicate_report(near_duplicates)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, thumbnail_workers), thread_name_prefix="thumbnail"
+    ) as thumbnail_pool:
+        # 요약을 기다리는 동안 썸네일을 미리 내려받고, S3 업로드는 요약에 성공해
+        # 저장할 포스트만 하여 저장하지 않는 포스트의 객체가 S3에 남지 않게 합니다.
+        downloads = [
+            thumbnail_pool.submit(download_thumbnail, crawled.thumbnail_url)
+            for crawled in new_posts
+        ]
+
+        logger.info(f"  - 콘텐츠 {len(new_posts)}개 요약 중...")
+        summary_results = summarize_contents(
+            [crawled.content for crawled in new_posts],
+            max_concurrency=summary_concurrency,
+            sources=[summary_source(crawled) for crawled in new_posts],
+        )
+        thumbnails: List[Optional[Future]] = []
+        for crawled, summary_result, download in zip(
+            new_posts, summary_results, downloads
+        ):
+            if summary_result is None:
+                download.cancel()
+                thumbnails.append(None)
+            else:
+                thumbnails.append(
+                    thumbnail_pool.submit(
+                        _upload_downloaded_thumbnail, crawled, download
+                    )
+                )
 
-    _close_db_session(db_session_info)
-    return processed_posts
+        for i, (crawled, summary_result, thumbnail) in enumerate(
+            zip(new_posts, summary_results, thumbnails), 1
+        ):
+            if summary_result is None:
+                logger.warning(
+                    f"[{i}/{len(new_posts)}] '{crawled.title}' 요약 실패 (저장 건너뜀)"
+                )
+                continue
+            try:
+                logger.info(f"[{i}/{len(new_posts)}] '{crawled.title}' 처리 중...")
+                thumbnail_s3_url = thumbnail.result()
 
+                processed_post = build_company_post(
+                    crawled, summary_result, thumbnail_s3_url
+                )
+                if processed_post is None:
+                    continue
+                processed_post.fingerprint = fingerprints.get(crawled.url)
 
-def _get_db_session() -> Optional[Tuple[Session, Generator[Session, None, None]]]:
-    """데이터베이스 세션을 가져옵니다."""
-    init_db()
-    db_gen = get_db()
-    db = next(db_gen, None)
+                processed_posts.append(processed_post)
+                logger.info(f"  - 포스트 처리 완료: {crawled.title}")
 
-    if db is None:
-        logger.error(
-            "데이터베이스 세션을 가져올 수 없습니다. 중복 검사 없이 처리합니다."
-        )
-        try:
-            next(db_gen)
-        except StopIteration:
-            pass
-        return None
-    return db, db_gen
+            except Exception as e:
+                logger.error(
+                    f"포스트 '{crawled.title}' 처리 중 오류 발생: {e}", exc_info=True
+                )
 
+    return processed_posts
 
-def _close_db_session(
-    db_session_info: Optional[Tuple[Session, Generator[Session, None, None]]]
-) -> None:
-    """데이터베이스 세션을 닫습니다."""
-    if db_session_info and db_session_info[1]:
-        try:
-            next(db_session_info[1])
-        except StopIteration:
-            pass
 
+def summary_source(crawled: CrawledContentDto) -> Dict[str, str]:
+    """LLM 사용량을 회사별, 포스트별로 집계할 수 있도록 요약 요청에 함께 넘길 포스트 정보입니다."""
+    return {"company": crawled.company.name, "url": crawled.url}
 
-def _is_duplicate_post(db: Optional[Session], crawled: CrawledContentDto) -> bool:
-    """포스트가 이미 데이터베이스에 존재하는지 확인합니다."""
-    if not db:
-        return False
 
-    normalized_url = _normalize_url(crawled.url)
+def build_company_post(
+    crawled: CrawledContentDto,
+    summary_result: Dict[str, str],
+    thumbnail_url: Optional[str],
+) -> Optional[CompanyPost]:
+    """
+    크롤링 결과와 요약, 처리된 썸네일로 저장할 CompanyPost를 만듭니다.
+    요약 결과에 분류(field)가 없으면 제목과 요약으로 로컬 분류기가 분류합니다.
+
+    Returns:
+        CompanyPost 객체. URL 정규화에 실패하면 None.
+    """
+    normalized_url = normalize_url(crawled.url)
     if not normalized_url:
-        logger.warning(
-            f"중복 검사를 위한 URL 정규화 실패: {crawled.url}. 중복으로 간주하지 않음."
+        logger.error(
+            f"URL 정규화 실패: {crawled.url}. 포스트를 건너<0xEB><01><0x81>니다."
         )
-        return False
+        return None
 
-    logger.info(f"  - 중복 확인 (정규화된 URL): {normalized_url}")
+    field = summary_result.get("field")
+    if field is None:
+        field = field_classifier.predict(
+            f"{crawled.title}\n{summary_result['summary']}"
+        )
 
-    exists = (
-        db.query(DBCompanyPost)
-        .filter(DBCompanyPost.source_url == normalized_url)
-        .first()
+    return CompanyPost(
+        title=crawled.title,
+        summary=summary_result["summary"],
+        thumbnail_url=thumbnail_url,
+        field=Field(field),
+        published_at=crawled.published_at,
+        company=crawled.company,
+        url=normalized_url,
     )
-    return exists is not None
 
 
-def _normalize_url(url: any) -> str:
-    """URL에서 쿼리 파라미터, 프래그먼트, 불필요한 경로 요소를 제거하여 정규화합니다."""
-    if isinstance(url, dict) and "href" in url:
-        url_str = url["href"]
-    elif isinstance(url, str):
-        url_str = url
-    else:
-        try:
-            url_str = str(url)
-        except Exception:
-            logger.error(f"URL을 문자열로 변환 실패: {url}, 타입: {type(url)}")
-            return ""
+def _find_stored_urls(crawled_posts: List[CrawledContentDto]) -> Set[str]:
+    """
+    크롤링된 포스트 중 이미 저장된 포스트의 정규화 URL을 한 번에 조회합니다.
 
+    조회에 실패하면 중복 검사 없이 모든 포스트를 다시 요약하지 않도록 예외를 그대로 전달합니다.
+    """
     try:
-        parsed = urlparse(url_str)
-        path = unquote(parsed.path)
-        path = path.lower()
-        path = path.rstrip("/")
+        return find_stored_urls(crawled.url for crawled in crawled_posts)
+    except Exception as e:
+        logger.error(f"저장된 포스트를 조회하지 못해 처리를 중단합니다. 오류: {e}")
+        raise
 
-        if "?" in path:
-            path = path.split("?", 1)[0]
-        if "#" in path:
-            path = path.split("#", 1)[0]
 
-        return urlunparse((parsed.scheme, parsed.netloc.lower(), path, "", "", ""))
-    except Exception as e:
-        logger.error(f"URL 정규화 중 오류 발생: {url_str} - {e}", exc_info=True)
-        return ""
+def log_near_duplicate(match: NearDuplicateMatch) -> None:
+    logger.info(
+        f"  - 근사 중복 포스트: {match.title} → {match.duplicate_of} "
+        f"(지문 거리 {match.distance}, 요약 및 저장 건너뜀)"
+    )
 
 
-def _process_thumbnail(
+def log_near_duplicate_report(near_duplicates: NearDuplicateIndex) -> None:
+    """근사 중복 검사 결과를 요약해 로그로 남깁니다."""
+    report = near_duplicates.report()
+    logger.info(
+        f"근사 중복 검사: {report['checked']}개 확인, {len(report['skipped'])}개 건너뜀 "
+        f"(인덱스 {report['indexed']}개, 최대 거리 {near_duplicates.max_distance})"
+    )
+    for skipped in report["skipped"]:
+        logger.info(
+            f"  - {skipped['title']}: {skipped['url']} ≈ {skipped['duplicate_of']} "
+            f"(거리 {skipped['distance']})"
+        )
+
+
+def process_thumbnail(
     thumbnail_url: Optional[str], company_name: Optional[str]
 ) -> Optional[str]:
     """썸네일을 다운로드하고 S3에 업로드합니다."""
+    return upload_thumbnail(
+        thumbnail_url, company_name, download_thumbnail(thumbnail_url)
+    )
+
+
+def download_thumbnail(thumbnail_url: Optional[str]) -> Optional[bytes]:
+    """썸네일 이미지를 내려받습니다. 내려받지 못하면 None."""
     if not thumbnail_url:
         return None
 
     try:
         logger.info(f"    - 썸네일 다운로드 중: {thumbnail_url}")
-        response = requests.get(thumbnail_url, timeout=10)
-        response.raise_for_status()
+        with thumbnail_stats.timed("download") as download:
+            response = http_client.get(thumbnail_url, kind="image", timeout=10)
+            response.raise_for_status()
+            file_content = response.content
+            download["bytes"] = len(file_content)
+        return file_content
+    except CircuitOpenError as e:
+        logger.warning(f"    - 썸네일 다운로드 건너뜀: {e}")
+    except requests.exceptions.RequestException as e:
+        logger.error(
+            f"    - 썸네일 다운로드 중 오류 발생 (RequestException): {thumbnail_url} - {e}",
+            exc_info=True,
+        )
+    except Exception as e:
+        logger.error(
+            f"    - 썸네일 처리 중 예기치 않은 오류 발생: {thumbnail_url} - {e}",
+            exc_info=True,
+        )
+    return None
 
-        file_content = response.content
+
+def upload_thumbnail(
+    thumbnail_url: Optional[str],
+    company_name: Optional[str],
+    file_content: Optional[bytes],
+) -> Optional[str]:
+    """
+    내려받은 썸네일을 S3에 업로드합니다.
+
+    Returns:
+        S3 URL. 내려받지 못했거나 업로드에 실패하면 원본 썸네일 URL.
+    """
+    if not thumbnail_url or file_content is None:
+        return thumbnail_url
+
+    try:
         original_filename = (
             thumbnail_url.split("/")[-1] if "/" in thumbnail_url else "thumbnail"
         )
@@ -176,11 +286,14 @@ def _process_thumbnail(
                 original_filename = ".".join(filename_parts[:-1])
 
         logger.info("    - S3에 썸네일 업로드 중...")
-        s3_url = s3_uploader.upload_image(
-            file_content,
-            company_name=company_name.lower() if company_name else "etc",
-            original_filename=original_filename,
-        )
+        with thumbnail_stats.timed("upload") as upload:
+            s3_url = s3_uploader.upload_image(
+                file_content,
+                company_name=company_name.lower() if company_name else "etc",
+                original_filename=original_filename,
+            )
+            upload["bytes"] = len(file_content)
+            upload["ok"] = s3_url is not None
 
         if s3_url:
             logger.info(f"    - S3 업로드 성공: {s3_url}")
@@ -188,11 +301,6 @@ def _process_thumbnail(
         else:
             logger.warning("    - S3 업로드 실패, 원본 URL 사용 시도")
             return thumbnail_url
-    except requests.exceptions.RequestException as e:
-        logger.error(
-            f"    - 썸네일 다운로드 중 오류 발생 (RequestException): {thumbnail_url} - {e}",
-            exc_info=True,
-        )
     except Exception as e:
         logger.error(
             f"    - 썸네일 처리 중 예기치 않은 오류 발생: {thumbnail_url} - {e}",
@@ -200,3 +308,11 @@ def _process_thumbnail(
         )
 
     return thumbnail_url
+
+
+def _upload_downloaded_thumbnail(
+    crawled: CrawledContentDto, download: Future
+) -> Optional[str]:
+    return upload_thumbnail(
+        crawled.thumbnail_url, crawled.company.name.lower(), download.result()
+    )
@@ -1,4 +1,18 @@
 from src.database.connection import get_db, init_db
-from src.database.models import DBCompanyPost, DBPost
+from src.database.models import (
+    DBCompanyPost,
+    DBCrawlWatermark,
+    DBPost,
+    DBPostFingerprint,
+)
+from src.database.migrations import migrate_source_url_hash
 
-__all__ = ["init_db", "get_db", "DBPost", "DBCompanyPost"]
+__all__ = [
+    "init_db",
+    "get_db",
+    "DBPost",
+    "DBCompanyPost",
+    "DBCrawlWatermark",
+    "DBPostFingerprint",
+    "migrate_source_url_hash",
+]
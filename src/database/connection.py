@@ -1,10 +1,12 @@
 import logging
+import os
 from typing import Generator, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from src.database.models import DBCompanyPost, DBCrawlWatermark, DBPostFingerprint
 from src.utils.ssh_tunnel import db_tunnel
 
 logger = logging.getLogger(__name__)
@@ -13,17 +15,24 @@ engine: Optional[Engine] = None
 SessionLocal: Optional[sessionmaker[Session]] = None
 
 
-def init_db() -> None:
+def init_db(check_schema: bool = True) -> None:
     """
     데이터베이스 연결을 초기화합니다.
 
     SSH 터널을 시작하고, 연결 파라미터를 가져와 SQLAlchemy 엔진을 생성합니다.
+    DATABASE_URL 환경 변수가 있으면 SSH 터널 없이 그 URL로 연결합니다 (로컬 DB, 벤치마크 등).
+    크롤러 보조 테이블을 만들고, company_posts에 source_url_hash 마이그레이션이 적용되어 있는지 확인합니다.
     그 다음, 세션 팩토리(SessionLocal)를 설정합니다.
     이 함수는 애플리케이션 시작 시 한 번만 호출되어야 합니다.
     이미 초기화된 경우 아무 작업도 수행하지 않습니다.
 
+    Args:
+        check_schema: company_posts의 마이그레이션 적용 여부를 확인할지 여부.
+            마이그레이션을 적용하는 migrate 모드에서만 False로 호출합니다.
+
     Raises:
         Exception: SSH 터널 시작 또는 데이터베이스 연결 설정 중 오류 발생 시.
+        RuntimeError: check_schema가 True이고 마이그레이션이 적용되지 않은 경우.
     """
     global engine, SessionLocal
 
@@ -32,26 +41,34 @@ def init_db() -> None:
         return
 
     try:
-        logger.info("SSH 터널을 시작합니다...")
-        if not db_tunnel.start():
-            raise Exception("SSH 터널 시작에 실패했습니다.")
-        logger.info("SSH 터널이 성공적으로 시작되었습니다.")
-
-        conn_params = db_tunnel.get_connection_params()
-        logger.debug(
-            f"DB 연결 파라미터: 호스트-{conn_params['host']}, 포트-{conn_params['port']}, DB명-{conn_params['db']}"
-        )
-
-        DATABASE_URL = (
-            f"mysql+pymysql://{conn_params['user']}:{conn_params['password']}@"
-            f"{conn_params['host']}:{conn_params['port']}/{conn_params['db']}?charset=utf8mb4"
-        )
+        DATABASE_URL = os.getenv("DATABASE_URL")
+        if DATABASE_URL:
+            logger.info("DATABASE_URL이 설정되어 있어 SSH 터널 없이 연결합니다.")
+        else:
+            logger.info("SSH 터널을 시작합니다...")
+            if not db_tunnel.start():
+                raise Exception("SSH 터널 시작에 실패했습니다.")
+            logger.info("SSH 터널이 성공적으로 시작되었습니다.")
+
+            conn_params = db_tunnel.get_connection_params()
+            logger.debug(
+                f"DB 연결 파라미터: 호스트-{conn_params['host']}, 포트-{conn_params['port']}, DB명-{conn_params['db']}"
+            )
+
+            DATABASE_URL = (
+                f"mysql+pymysql://{conn_params['user']}:{conn_params['password']}@"
+                f"{conn_params['host']}:{conn_params['port']}/{conn_params['db']}?charset=utf8mb4"
+            )
 
         engine = create_engine(DATABASE_URL, pool_recycle=3600, pool_pre_ping=True)
 
         with engine.connect():
             logger.info("데이터베이스 엔진 연결 테스트 성공.")
 
+        _create_crawler_tables(engine)
+        if check_schema:
+            _check_company_posts_schema(engine)
+
         SessionLocal = _get_session_factory(engine)
 
         logger.info("데이터베이스 연결 및 세션 팩토리가 성공적으로 설정되었습니다.")
@@ -94,6 +111,49 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def _create_crawler_tables(bind: Engine) -> None:
+    """
+    크롤러가 소유하는 보조 테이블을 없을 경우에만 생성합니다.
+
+    posts/company_posts 테이블은 서비스 쪽에서 관리하므로 건드리지 않습니다.
+
+    Args:
+        bind: SQLAlchemy 엔진 객체.
+    """
+    DBCrawlWatermark.__table__.create(bind=bind, checkfirst=True)
+    DBPostFingerprint.__table__.create(bind=bind, checkfirst=True)
+
+
+def _check_company_posts_schema(bind: Engine) -> None:
+    """
+    company_posts에 크롤러가 사용하는 source_url_hash 컬럼과 유니크 인덱스가 있는지 확인합니다.
+
+    company_posts는 서비스 쪽 테이블이므로 여기서는 바꾸지 않습니다. 마이그레이션은 배포할 때
+    `python run.py migrate`로 한 번 적용합니다.
+
+    Args:
+        bind: SQLAlchemy 엔진 객체.
+
+    Raises:
+        RuntimeError: 테이블, 컬럼 또는 인덱스가 없는 경우.
+    """
+    table = DBCompanyPost.__table__
+    inspector = inspect(bind)
+    if not inspector.has_table(table.name):
+        raise RuntimeError(f"{table.name} 테이블이 없습니다.")
+
+    columns = {column["name"] for column in inspector.get_columns(table.name)}
+    indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+    missing = [
+        f"{name} 컬럼" for name in ("source_url_hash",) if name not in columns
+    ] + [f"{index.name} 인덱스" for index in table.indexes if index.name not in indexes]
+    if missing:
+        raise RuntimeError(
+            f"{table.name}에 {', '.join(missing)}가 없습니다. "
+            f"`python run.py migrate`로 마이그레이션을 먼저 적용해주세요."
+        )
+
+
 def _get_session_factory(bind: Engine) -> sessionmaker[Session]:
     """
     주어진 SQLAlchemy 엔진에 바인딩된 세션 팩토리를 생성합니다.
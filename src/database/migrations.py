@@ -0,0 +1,122 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import bindparam, inspect, select, text, update
+from sqlalchemy.engine import Engine
+
+from src.database import connection
+from src.database.models import DBCompanyPost
+from src.utils.url_utils import url_hash
+
+logger = logging.getLogger(__name__)
+
+SOURCE_URL_HASH_INDEX = "uq_company_posts_source_url_hash"
+
+
+def migrate_source_url_hash(
+    bind: Optional[Engine] = None, batch_size: int = 1000
+) -> Dict[str, Any]:
+    """
+    company_posts에 source_url_hash 컬럼과 유니크 인덱스를 추가하고, 기존 행의 해시를 채웁니다.
+
+    이미 있는 컬럼과 인덱스는 건너뛰고 해시가 비어 있는 행만 채우므로 여러 번 실행해도 안전합니다.
+    같은 URL이 이미 여러 번 저장되어 있으면 가장 먼저 저장된 행(id가 가장 작은 행)에만 해시를
+    채우고 나머지 행의 id를 보고서에 남깁니다. 행은 지우지 않습니다.
+
+    Args:
+        bind: 마이그레이션할 데이터베이스 엔진. 없으면 init_db()로 만든 엔진을 씁니다.
+        batch_size: 한 번에 읽고 갱신할 행 수.
+
+    Returns:
+        column_added, index_created, backfilled(해시를 채운 행 수),
+        duplicates(URL별 남긴 행 id와 중복 행 id 목록) 보고서.
+    """
+    if bind is None:
+        bind = connection.engine
+    if bind is None:
+        raise RuntimeError(
+            "데이터베이스 엔진이 초기화되지 않았습니다. init_db()를 먼저 호출해야 합니다."
+        )
+    table = DBCompanyPost.__table__
+    report: Dict[str, Any] = {"column_added": False, "index_created": False}
+
+    columns = {column["name"] for column in inspect(bind).get_columns(table.name)}
+    if "source_url_hash" not in columns:
+        logger.info("company_posts에 source_url_hash 컬럼을 추가합니다.")
+        with bind.begin() as conn:
+            conn.execute(
+                text(
+                    f"ALTER TABLE {table.name} ADD COLUMN source_url_hash CHAR(64) NULL"
+                )
+            )
+        report["column_added"] = True
+
+    duplicates: Dict[str, List[int]] = {}
+    kept_ids: Dict[str, int] = {}
+    backfilled = 0
+    last_id = 0
+    statement = (
+        update(table)
+        .where(table.c.id == bindparam("row_id"))
+        .values(source_url_hash=bindparam("hash"))
+    )
+    while True:
+        with bind.begin() as conn:
+            rows = conn.execute(
+                select(table.c.id, table.c.source_url)
+                .where(table.c.source_url_hash.is_(None))
+                .where(table.c.source_url.isnot(None))
+                .where(table.c.id > last_id)
+                .order_by(table.c.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            digests = {url_hash(row.source_url) for row in rows}
+            # 이 배치의 URL 중 이미 해시가 채워진 행만 조회하므로 테이블 전체를 읽지 않습니다.
+            for row in conn.execute(
+                select(table.c.id, table.c.source_url_hash).where(
+                    table.c.source_url_hash.in_(digests)
+                )
+            ):
+                kept_ids.setdefault(row.source_url_hash, row.id)
+            updates = []
+            for row in rows:
+                digest = url_hash(row.source_url)
+                if digest in kept_ids:
+                    duplicates.setdefault(row.source_url, []).append(row.id)
+                    continue
+                kept_ids[digest] = row.id
+                updates.append({"row_id": row.id, "hash": digest})
+            if updates:
+                conn.execute(statement, updates)
+            backfilled += len(updates)
+            last_id = rows[-1].id
+        logger.info(f"source_url_hash 채우는 중: {backfilled}개 (마지막 id {last_id})")
+
+    index = next(
+        index for index in table.indexes if index.name == SOURCE_URL_HASH_INDEX
+    )
+    existing_indexes = {
+        index["name"] for index in inspect(bind).get_indexes(table.name)
+    }
+    if SOURCE_URL_HASH_INDEX not in existing_indexes:
+        logger.info(f"유니크 인덱스 {SOURCE_URL_HASH_INDEX}를 만듭니다.")
+        index.create(bind)
+        report["index_created"] = True
+
+    report["backfilled"] = backfilled
+    report["duplicates"] = [
+        {
+            "source_url": source_url,
+            "kept_id": kept_ids[url_hash(source_url)],
+            "duplicate_ids": ids,
+        }
+        for source_url, ids in duplicates.items()
+    ]
+    if duplicates:
+        logger.warning(
+            f"같은 URL로 여러 번 저장된 포스트가 {len(duplicates)}개 있습니다. "
+            f"가장 먼저 저장된 행에만 해시를 채웠습니다."
+        )
+    return report
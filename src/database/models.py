@@ -1,4 +1,14 @@
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    CHAR,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.ext.declarative import declarative_base
 
 from src.models.enums import Company, Field
@@ -48,13 +58,64 @@ class DBCompanyPost(DBPost):
     Attributes:
         id: 'posts' 테이블의 id를 참조하는 외래 키 (PK).
         source_url: 게시물의 원본 URL (최대 255자, nullable).
+        source_url_hash: source_url의 SHA-256 해시 (64자리 16진수, 유니크 인덱스, nullable).
+            중복 확인은 이 컬럼으로 조회하며, 같은 URL이 두 번 저장되지 않도록 막습니다.
+            기존 데이터베이스에는 `python run.py migrate`로 추가합니다.
         company: 게시물을 발행한 회사 (Company Enum, non-nullable).
     """
 
     __tablename__ = "company_posts"
+    __table_args__ = (
+        Index("uq_company_posts_source_url_hash", "source_url_hash", unique=True),
+    )
 
     id = Column(Integer, ForeignKey("posts.id"), primary_key=True)
     source_url = Column(String(255), nullable=True)
+    source_url_hash = Column(CHAR(64), nullable=True)
     company = Column(Enum(Company), nullable=False)
 
     __mapper_args__ = {"polymorphic_identity": "COMPANY"}
+
+
+class DBCrawlWatermark(Base):
+    """
+    피드별 증분 크롤링 기준점을 저장하는 'crawl_watermarks' 테이블의 SQLAlchemy 모델입니다.
+    포스트가 저장된 뒤에만 갱신되며, 다음 크롤링은 이 지점 이전의 항목을 건너뜁니다.
+
+    Attributes:
+        feed_url: 피드 URL (PK).
+        company: 피드를 발행한 회사 (Company Enum, non-nullable).
+        last_entry_id: 마지막으로 저장된 항목의 id/guid (nullable).
+        last_published_at: 마지막으로 저장된 항목의 발행 일시, naive UTC (nullable).
+        updated_at: 기준점이 마지막으로 갱신된 날짜 및 시간 (non-nullable).
+    """
+
+    __tablename__ = "crawl_watermarks"
+
+    feed_url = Column(String(255), primary_key=True)
+    company = Column(Enum(Company), nullable=False)
+    last_entry_id = Column(String(512), nullable=True)
+    last_published_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=False)
+
+
+class DBPostFingerprint(Base):
+    """
+    근사 중복 검사용 본문 지문을 저장하는 'post_fingerprints' 테이블의 SQLAlchemy 모델입니다.
+    company_posts에는 요약만 저장되므로 원문으로 만든 지문을 포스트 저장과 함께 따로 기록합니다.
+
+    Attributes:
+        source_url: 포스트의 정규화된 URL (PK).
+        fingerprint: 본문의 64비트 SimHash 지문 (16자리 16진수, non-nullable).
+        duplicate_of: 근사 중복으로 건너뛴 포스트이면 원본 포스트의 URL (nullable).
+        distance: 원본과의 해밍 거리 (nullable).
+        created_at: 레코드가 생성된 날짜 및 시간 (non-nullable).
+    """
+
+    __tablename__ = "post_fingerprints"
+
+    source_url = Column(String(255), primary_key=True)
+    fingerprint = Column(String(16), nullable=False)
+    duplicate_of = Column(String(255), nullable=True)
+    distance = Column(Integer, nullable=True)
+    created_at = Column(DateTime, nullable=False)
@@ -1,4 +1,16 @@
-from src.models.dto import CompanyPost, CrawledContentDto, LlmResponseDto
+from src.models.dto import (
+    CompanyPost,
+    CrawledContentDto,
+    CrawlWatermark,
+    LlmResponseDto,
+)
 from src.models.enums import Company, Field
 
-__all__ = ["Field", "Company", "CrawledContentDto", "LlmResponseDto", "CompanyPost"]
+__all__ = [
+    "Field",
+    "Company",
+    "CrawledContentDto",
+    "CrawlWatermark",
+    "LlmResponseDto",
+    "CompanyPost",
+]
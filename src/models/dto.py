@@ -18,6 +18,10 @@ class CrawledContentDto:
         thumbnail_url: 게시물의 썸네일 이미지 URL.
         published_at: 게시물의 발행 일시.
         company: 게시물을 발행한 회사 (Company Enum).
+        feed_url: 게시물을 수집한 피드 URL (Optional).
+        entry_id: 피드 항목의 id 또는 guid (Optional).
+        published_at_estimated: 발행 일시를 파싱하지 못해 크롤링 시각으로 대신했는지 여부.
+            이 경우 published_at으로 크롤링 기준점을 옮기지 않습니다.
     """
 
     title: str
@@ -27,6 +31,9 @@ class CrawledContentDto:
     thumbnail_url: str
     published_at: datetime
     company: Company
+    feed_url: Optional[str] = None
+    entry_id: Optional[str] = None
+    published_at_estimated: bool = False
 
 
 @dataclass
@@ -57,6 +64,7 @@ class CompanyPost:
         company: 게시물을 발행한 회사 (Company Enum).
         url: 게시물의 정규화된 URL.
         id: 데이터베이스에서의 게시물 ID (저장 후 할당됨, Optional).
+        fingerprint: 근사 중복 검사용 원문 SimHash 지문 (16자리 16진수, Optional).
     """
 
     title: str
@@ -67,3 +75,20 @@ class CompanyPost:
     company: Company
     url: str
     id: Optional[int] = None
+    fingerprint: Optional[str] = None
+
+
+@dataclass
+class CrawlWatermark:
+    """
+    피드별 증분 크롤링 기준점을 나타냅니다.
+
+    Attributes:
+        feed_url: 피드 URL.
+        entry_id: 마지막으로 저장된 항목의 id/guid (Optional).
+        published_at: 마지막으로 저장된 항목의 발행 일시, naive UTC (Optional).
+    """
+
+    feed_url: str
+    entry_id: Optional[str] = None
+    published_at: Optional[datetime] = None
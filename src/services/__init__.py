@@ -1,4 +1,4 @@
 from src.services.crawler import BlogCrawler
-from src.services.summarizer import summarize_content
+from src.services.summarizer import summarize_content, summarize_contents
 
-__all__ = ["BlogCrawler", "summarize_content"]
+__all__ = ["BlogCrawler", "summarize_content", "summarize_contents"]
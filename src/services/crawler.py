@@ -1,50 +1,200 @@
 import logging
-import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import feedparser
 import requests
 
 from src.config.blog_config import BLOG_CONFIGS
-from src.models.dto import CrawledContentDto
+from src.models.dto import CrawledContentDto, CrawlWatermark
 from src.models.enums import Company
-from src.services.crawler_constants import DEFAULT_HEADERS, BlogType
+from src.services.crawler_constants import (
+    CRAWL_CONCURRENCY,
+    FEED_READ_CHUNK_SIZE,
+    FEED_TIMEOUT,
+    PER_HOST_CONCURRENCY,
+    REQUEST_TIMEOUT,
+    RUN_TIMEOUT,
+    TEXT_EXTRACTION_BACKEND,
+    BlogType,
+)
 from src.services.crawler_utils import (
-    extract_text_from_html,
+    extract_thumbnail_from_html,
     extract_thumbnail_from_webpage,
     normalize_thumbnail_url,
 )
+from src.services.feed_parsers import FeedParser, get_feed_parser
+from src.services.source_profile import (
+    SourceProfile,
+    SourceProfileStore,
+    extract_entry_thumbnail,
+    parse_entry_date,
+    source_profile_store,
+)
+from src.utils.date_utils import watermark_time
+from src.utils.feed_poll_log import FeedPollLog
+from src.utils.http_cache import http_cache
+from src.utils.http_client import http_client
+from src.utils.known_urls import KnownUrlIndex
 
 logger = logging.getLogger(__name__)
 
 
+class CrawlTimeoutError(Exception):
+    """피드 또는 전체 크롤링의 제한 시간을 초과했을 때 발생하는 예외입니다."""
+
+
 class BlogCrawler:
     """블로그 크롤링을 담당하는 클래스"""
 
-    def __init__(self):
-        """크롤러 초기화"""
-        self.session = requests.Session()
-        self.session.headers.update(DEFAULT_HEADERS)
+    def __init__(
+        self,
+        concurrency: int = CRAWL_CONCURRENCY,
+        per_host_limit: int = PER_HOST_CONCURRENCY,
+        feed_timeout: Optional[float] = FEED_TIMEOUT,
+        run_timeout: Optional[float] = RUN_TIMEOUT,
+        watermarks: Optional[Dict[str, CrawlWatermark]] = None,
+        text_backend: str = TEXT_EXTRACTION_BACKEND,
+        profiles: Optional[SourceProfileStore] = None,
+        known_urls: Optional[KnownUrlIndex] = None,
+        poll_log: Optional[FeedPollLog] = None,
+    ):
+        """크롤러 초기화
+
+        Args:
+            concurrency: 동시에 크롤링할 최대 피드 수 (1이면 순차 실행).
+            per_host_limit: 같은 호스트에 대해 동시에 크롤링할 최대 피드 수.
+            feed_timeout: 피드 하나의 크롤링 제한 시간(초). None이면 제한 없음.
+            run_timeout: 전체 크롤링 제한 시간(초). None이면 제한 없음.
+            watermarks: feed_url별 증분 크롤링 기준점. 기준점 이하의 항목은 건너뜁니다.
+            text_backend: 본문 텍스트 추출 엔진 ("lxml" 또는 "bs4").
+            profiles: 피드별 파싱 프로필 저장소. None이면 기본 저장소를 사용합니다.
+            known_urls: 이미 저장된 포스트 URL 인덱스. 여기에 있는 항목은 처리 전에 버립니다.
+            poll_log: 피드별 마지막 크롤링 시각 기록. 크롤링에 성공한 피드를 기록합니다.
+        """
+        self.session = http_client.session
+        self.concurrency = max(1, concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.feed_timeout = feed_timeout
+        self.run_timeout = run_timeout
+        self.watermarks = watermarks or {}
+        self.text_backend = text_backend
+        self.profiles = profiles if profiles is not None else source_profile_store
+        self.poll_log = poll_log
+        self.known_urls = known_urls
+        self._host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_lock = threading.Lock()
 
     def crawl_all_sources(
-        self, configs: List[Dict[str, Any]], max_posts: int
+        self,
+        configs: List[Dict[str, Any]],
+        max_posts: int,
+        on_posts: Optional[Callable[[List[CrawledContentDto]], None]] = None,
     ) -> List[CrawledContentDto]:
-        """지정된 설정에 따라 모든 블로그 소스를 크롤링합니다."""
+        """지정된 설정에 따라 모든 블로그 소스를 크롤링합니다.
+
+        concurrency가 2 이상이면 워커 풀에서 피드를 동시에 크롤링합니다.
+        실행 방식과 관계없이 결과는 configs 순서대로 병합됩니다.
+
+        Args:
+            configs: 크롤링할 블로그 설정 목록.
+            max_posts: 블로그별 최대 포스트 수.
+            on_posts: 피드 하나의 크롤링이 끝날 때마다 그 결과로 호출되는 콜백.
+                워커 스레드에서 호출될 수 있습니다.
+        """
+        run_deadline = self._deadline_after(self.run_timeout)
+        if self.concurrency <= 1 or len(configs) <= 1:
+            results = [
+                self._crawl_blog_safely(config, max_posts, run_deadline, on_posts)
+                for config in configs
+            ]
+        else:
+            results = self._crawl_concurrently(
+                configs, max_posts, run_deadline, on_posts
+            )
+
         all_posts = []
-        for config in configs:
-            try:
-                posts = self._crawl_blog(config, max_posts)
-                all_posts.extend(posts)
-            except Exception as e:
+        for posts in results:
+            all_posts.extend(posts)
+
+        self.profiles.save()
+        logger.info(f"파싱 프로필 통계: {self.profiles.stats()}")
+        if self.poll_log is not None:
+            self.poll_log.save()
+        return all_posts
+
+    def _crawl_concurrently(
+        self,
+        configs: List[Dict[str, Any]],
+        max_posts: int,
+        run_deadline: Optional[float],
+        on_posts: Optional[Callable[[List[CrawledContentDto]], None]] = None,
+    ) -> List[List[CrawledContentDto]]:
+        """워커 풀에서 피드를 동시에 크롤링하고 configs 순서대로 결과를 반환합니다."""
+        results: List[List[CrawledContentDto]] = [[] for _ in configs]
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.concurrency, len(configs)),
+            thread_name_prefix="crawler",
+        )
+        try:
+            futures = {
+                executor.submit(
+                    self._crawl_blog_safely, config, max_posts, run_deadline, on_posts
+                ): index
+                for index, config in enumerate(configs)
+            }
+            done, not_done = wait(futures, timeout=self._remaining(run_deadline))
+
+            for future in done:
+                results[futures[future]] = future.result()
+
+            for future in not_done:
+                future.cancel()
+                config = configs[futures[future]]
                 logger.error(
-                    f"{config.get('name', '알 수 없는')} 블로그 크롤링 중 오류: {e}"
+                    f"{config.get('name', '알 수 없는')} 블로그 크롤링이 전체 제한 시간"
+                    f"({self.run_timeout}초)을 초과하여 결과를 버립니다."
                 )
-        return all_posts
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def _crawl_blog_safely(
+        self,
+        config: Dict[str, Any],
+        max_posts: int,
+        run_deadline: Optional[float],
+        on_posts: Optional[Callable[[List[CrawledContentDto]], None]] = None,
+    ) -> List[CrawledContentDto]:
+        """호스트별 동시성 제한과 제한 시간을 적용하여 블로그를 크롤링합니다."""
+        try:
+            with self._host_slot(config.get("blog_url", "")):
+                deadline = self._earliest(
+                    self._deadline_after(self.feed_timeout), run_deadline
+                )
+                posts = self._crawl_blog(config, max_posts, deadline)
+            if self.poll_log is not None:
+                self.poll_log.mark(config.get("blog_url", ""))
+        except Exception as e:
+            logger.error(
+                f"{config.get('name', '알 수 없는')} 블로그 크롤링 중 오류: {e}"
+            )
+            return []
+
+        if on_posts and posts:
+            on_posts(posts)
+        return posts
 
     def _crawl_blog(
-        self, config: Dict[str, Any], max_posts: int
+        self,
+        config: Dict[str, Any],
+        max_posts: int,
+        deadline: Optional[float] = None,
     ) -> List[CrawledContentDto]:
         """개별 블로그를 크롤링하고 처리합니다."""
         blog_url = config.get("blog_url")
@@ -58,22 +208,155 @@ class BlogCrawler:
                 f"알 수 없는 블로그 타입입니다: {blog_url}. 이 블로그는 건너뜁니다."
             )
             return []
-        feed = feedparser.parse(blog_url)
+        feed = self._fetch_feed(blog_url, deadline)
 
         source_name_cfg = config.get("name")
         company_cfg = config.get("company")
 
+        profile = self.profiles.get(blog_url)
         parser = self._parse_default_feed
-        entries = parser(feed, max_posts)
+        entries = parser(feed, max_posts, self.watermarks.get(blog_url), profile)
+
+        return self._process_feed(
+            blog_url,
+            source_name_cfg,
+            company_cfg,
+            entries,
+            deadline,
+            profile,
+            get_feed_parser(blog_type),
+        )
+
+    def _fetch_feed(self, blog_url: str, deadline: Optional[float] = None):
+        """세션과 HTTP 캐시를 통해 피드를 내려받아 파싱합니다.
 
-        return self._process_feed(blog_url, source_name_cfg, company_cfg, entries)
+        피드가 바뀌지 않았으면(304) 캐시된 본문을 사용합니다. 본문을 청크 단위로
+        읽으면서 제한 시간을 확인하므로, 응답이 느리게 흘러들어오는 피드도
+        deadline을 넘기지 않습니다.
 
-    def _parse_default_feed(self, feed, max_posts: int) -> List[Dict[str, Any]]:
-        """기본 RSS/Atom 피드를 파싱합니다."""
+        Raises:
+            CrawlTimeoutError: 피드를 다 읽기 전에 제한 시간을 초과한 경우.
+            requests.RequestException: 요청이 실패한 경우.
+        """
+
+        def read_body(response: requests.Response) -> bytes:
+            chunks = []
+            for chunk in response.iter_content(chunk_size=FEED_READ_CHUNK_SIZE):
+                if self._is_expired(deadline):
+                    raise CrawlTimeoutError(f"피드 수신 제한 시간 초과: {blog_url}")
+                chunks.append(chunk)
+            return b"".join(chunks)
+
+        response = http_cache.get(
+            self.session,
+            blog_url,
+            timeout=self._request_timeout(deadline),
+            read_body=read_body,
+            deadline=deadline,
+            kind="feed",
+        )
+        if response.from_cache:
+            logger.info(f"피드가 변경되지 않아 캐시를 사용합니다: {blog_url}")
+
+        response_headers = {
+            "content-location": response.url,
+            "content-type": response.headers.get("Content-Type", ""),
+        }
+        return feedparser.parse(response.content, response_headers=response_headers)
+
+    @contextmanager
+    def _host_slot(self, url: str) -> Iterator[None]:
+        """같은 호스트에 대한 동시 크롤링 수를 per_host_limit으로 제한합니다."""
+        host = (urlparse(url).hostname or "").lower()
+        with self._host_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_semaphores[host] = semaphore
+        with semaphore:
+            yield
+
+    @staticmethod
+    def _deadline_after(timeout: Optional[float]) -> Optional[float]:
+        return time.monotonic() + timeout if timeout else None
+
+    @staticmethod
+    def _earliest(*deadlines: Optional[float]) -> Optional[float]:
+        candidates = [deadline for deadline in deadlines if deadline is not None]
+        return min(candidates) if candidates else None
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        return max(0.0, deadline - time.monotonic()) if deadline is not None else None
+
+    def _is_expired(self, deadline: Optional[float]) -> bool:
+        return deadline is not None and time.monotonic() >= deadline
+
+    def _request_timeout(self, deadline: Optional[float]) -> float:
+        """deadline을 넘지 않는 범위에서 요청 타임아웃을 계산합니다."""
+        remaining = self._remaining(deadline)
+        if remaining is None:
+            return REQUEST_TIMEOUT
+        if remaining <= 0:
+            raise CrawlTimeoutError("제한 시간이 이미 지났습니다.")
+        return min(REQUEST_TIMEOUT, remaining)
+
+    def _parse_default_feed(
+        self,
+        feed,
+        max_posts: int,
+        watermark: Optional[CrawlWatermark] = None,
+        profile: Optional[SourceProfile] = None,
+    ) -> List[Dict[str, Any]]:
+        """기본 RSS/Atom 피드를 파싱합니다.
+
+        기준점(watermark)이 주어지면 기준점 이하의 첫 항목에서 멈추고,
+        이미 저장된 URL의 항목은 max_posts 개수에는 포함하되 결과에서 제외합니다.
+        """
         logger.debug(
             f"Parsing feed using _parse_default_feed for up to {max_posts} posts."
         )
-        return feed.entries[:max_posts]
+        entries = []
+        for entry in feed.entries:
+            if len(entries) >= max_posts:
+                break
+            if watermark and self._is_at_or_below_watermark(entry, watermark, profile):
+                logger.info(
+                    f"이전에 저장한 항목에 도달하여 크롤링을 멈춥니다: "
+                    f"{entry.get('title', '제목 없음')} ({watermark.feed_url})"
+                )
+                break
+            entries.append(entry)
+
+        if self.known_urls is not None:
+            new_entries = [
+                entry
+                for entry in entries
+                if self._extract_link_from_entry(entry) not in self.known_urls
+            ]
+            if len(new_entries) < len(entries):
+                logger.info(
+                    f"이미 저장된 포스트 {len(entries) - len(new_entries)}개를 건너뜁니다."
+                )
+            entries = new_entries
+        return entries
+
+    def _is_at_or_below_watermark(
+        self,
+        entry,
+        watermark: CrawlWatermark,
+        profile: Optional[SourceProfile] = None,
+    ) -> bool:
+        """항목이 기준점과 같거나 기준점보다 오래되었는지 확인합니다."""
+        entry_id = self._extract_entry_id(entry)
+        if watermark.entry_id and entry_id == watermark.entry_id:
+            return True
+
+        if watermark.published_at:
+            published = watermark_time(self._parse_entry_date(entry, profile))
+            if published is not None and published <= watermark.published_at:
+                return True
+        return False
 
     def _process_feed(
         self,
@@ -81,8 +364,15 @@ class BlogCrawler:
         source_name_from_config: Optional[str],
         company_obj: Company,
         entries: List[Dict[str, Any]],
+        deadline: Optional[float] = None,
+        profile: Optional[SourceProfile] = None,
+        feed_parser: Optional[FeedParser] = None,
     ) -> List[CrawledContentDto]:
-        """피드 항목을 CrawledContentDto 객체로 변환합니다."""
+        """피드 항목을 CrawledContentDto 객체로 변환합니다.
+
+        피드 본문이 잘린 항목은 원문 페이지를 가져와 본문과 썸네일을 추출합니다.
+        """
+        feed_parser = feed_parser or get_feed_parser(None)
         final_source_name = (
             source_name_from_config
             if source_name_from_config is not None
@@ -91,8 +381,16 @@ class BlogCrawler:
 
         logger.info(f"{final_source_name} 블로그 크롤링 시작: {blog_url}")
         results = []
+        article_fetches = 0
         try:
-            for entry in entries:
+            for index, entry in enumerate(entries):
+                if self._is_expired(deadline):
+                    logger.warning(
+                        f"{final_source_name} 블로그 크롤링 제한 시간을 초과하여 "
+                        f"나머지 {len(entries) - index}개 항목을 건너뜁니다."
+                    )
+                    break
+
                 title = entry.get("title", "제목 없음")
                 link = self._extract_link_from_entry(entry)
                 if not link:
@@ -101,17 +399,37 @@ class BlogCrawler:
                     )
                     continue
 
-                content_text = self._extract_content_from_entry(entry)
-                published_date = self._extract_date_from_entry(entry)
-                thumbnail_url = self._extract_thumbnail(entry)
+                content_text, is_full = feed_parser.extract_content(
+                    entry, self.text_backend
+                )
+                article_html = None
+                if not is_full:
+                    article_fetches += 1
+                    article_html = self._fetch_article(link, deadline)
+                    if article_html:
+                        article_text = feed_parser.extract_article_text(
+                            article_html, self.text_backend
+                        )
+                        if len(article_text) > len(content_text):
+                            content_text = article_text
+
+                published_date, date_estimated = self._extract_date_from_entry(
+                    entry, profile
+                )
+                thumbnail_url = self._extract_thumbnail(entry, profile)
 
-                if not thumbnail_url and link:
+                if not thumbnail_url and article_html:
+                    thumbnail_url = extract_thumbnail_from_html(article_html, link)
+                elif not thumbnail_url and link:
                     try:
                         logger.debug(
                             f"피드에서 썸네일을 찾지 못했습니다. 웹페이지에서 추출 시도: {link} ({final_source_name})"
                         )
                         thumbnail_url = extract_thumbnail_from_webpage(
-                            self.session, link
+                            self.session,
+                            link,
+                            timeout=self._request_timeout(deadline),
+                            deadline=deadline,
                         )
                         if thumbnail_url:
                             logger.debug(
@@ -139,6 +457,9 @@ class BlogCrawler:
                     thumbnail_url=normalized_thumbnail_url,
                     published_at=published_date,
                     company=company_enum_member,
+                    feed_url=blog_url,
+                    entry_id=self._extract_entry_id(entry),
+                    published_at_estimated=date_estimated,
                 )
                 results.append(post_data)
                 logger.debug(f"{final_source_name} 포스트 크롤링 완료: {title}")
@@ -154,13 +475,34 @@ class BlogCrawler:
 
         logger.info(
             f"{final_source_name} 블로그 크롤링 완료, {len(results)}개 포스트 수집"
+            f" (본문이 잘려 원문을 가져온 항목: {article_fetches}개)"
         )
         return results
 
+    def _fetch_article(
+        self, link: str, deadline: Optional[float] = None
+    ) -> Optional[str]:
+        """원문 페이지의 HTML을 가져옵니다. 실패하면 None을 반환합니다."""
+        try:
+            response = http_cache.get(
+                self.session,
+                link,
+                timeout=self._request_timeout(deadline),
+                deadline=deadline,
+            )
+            return response.text
+        except Exception as e:
+            logger.warning(
+                f"원문 페이지 {link}를 가져오지 못해 피드 본문을 사용합니다: {e}"
+            )
+            return None
+
     def _detect_blog_type(
         self, blog_url: str, config: Dict[str, Any]
     ) -> Union[BlogType, None]:
-        """블로그 타입을 감지합니다. (match-case 사용)
+        """블로그 타입을 감지합니다.
+
+        설정에 type이 있으면 그대로 사용하고, 없으면 URL로 판단합니다. (match-case 사용)
 
         Args:
             blog_url: 블로그 URL
@@ -169,6 +511,16 @@ class BlogCrawler:
         Returns:
             블로그 타입 식별자 또는 None
         """
+        configured_type = config.get("type")
+        if configured_type:
+            try:
+                return BlogType(configured_type)
+            except ValueError:
+                logger.warning(
+                    f"알 수 없는 블로그 타입입니다: {configured_type} ({blog_url})"
+                )
+                return None
+
         try:
             parsed_url = urlparse(blog_url)
             hostname = parsed_url.hostname if parsed_url.hostname else ""
@@ -204,42 +556,9 @@ class BlogCrawler:
         logger.warning(f"알 수 없는 블로그 URL 패턴입니다 (match-case): {blog_url}")
         return None
 
-    def _extract_thumbnail(self, entry) -> str:
-        """엔트리에서 썸네일 URL을 추출합니다."""
-        if hasattr(entry, "thumbnail"):
-            logger.info("thumbnail 태그에서 썸네일 찾음")
-            return entry.thumbnail
-
-        if hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
-            logger.info("media_thumbnail에서 썸네일 찾음")
-            return entry.media_thumbnail[0]["url"]
-
-        if hasattr(entry, "links"):
-            for link in entry.links:
-                if link.get("type", "").startswith("image"):
-                    logger.info("이미지 링크에서 썸네일 찾음")
-                    return link.get("href", "")
-
-        if hasattr(entry, "content"):
-            for content in entry.content:
-                if not hasattr(content, "value"):
-                    continue
-                img_match = re.search(
-                    r'<img[^>]+src=[\'"]([^\'"]+)[\'"]', content.value, re.IGNORECASE
-                )
-                if img_match:
-                    logger.info("본문에서 이미지 추출")
-                    return img_match.group(1)
-
-        if hasattr(entry, "summary"):
-            img_match = re.search(
-                r'<img[^>]+src=[\'"]([^\'"]+)[\'"]', entry.summary, re.IGNORECASE
-            )
-            if img_match:
-                logger.info("요약에서 이미지 추출")
-                return img_match.group(1)
-
-        return ""
+    def _extract_thumbnail(self, entry, profile: Optional[SourceProfile] = None) -> str:
+        """엔트리에서 썸네일 URL을 추출합니다. 프로필의 전략을 먼저 시도합니다."""
+        return extract_entry_thumbnail(entry, profile)
 
     def _extract_link_from_entry(self, entry) -> str:
         """피드 엔트리에서 링크를 추출합니다.
@@ -254,52 +573,33 @@ class BlogCrawler:
             return entry.link
         return ""
 
-    def _extract_content_from_entry(self, entry) -> str:
-        """피드 엔트리에서 콘텐츠를 추출합니다.
-
-        Args:
-            entry: 피드 엔트리 객체
+    def _extract_entry_id(self, entry) -> str:
+        """피드 엔트리의 고유 식별자(id/guid, 없으면 링크)를 추출합니다."""
+        return entry.get("id") or entry.get("guid") or entry.get("link") or ""
 
-        Returns:
-            추출된 콘텐츠 문자열
-        """
-        content = ""
-        if "content" in entry and len(entry.content) > 0:
-            content = extract_text_from_html(entry.content[0].value)
-        elif "summary" in entry:
-            content = extract_text_from_html(entry.summary)
-        return content
-
-    def _extract_date_from_entry(self, entry) -> datetime:
+    def _extract_date_from_entry(
+        self, entry, profile: Optional[SourceProfile] = None
+    ) -> Tuple[datetime, bool]:
         """피드 엔트리에서 날짜를 추출합니다.
 
         Args:
             entry: 피드 엔트리 객체
+            profile: 피드의 파싱 프로필
 
         Returns:
-            추출된 날짜 datetime 객체
+            (추출된 날짜 datetime 객체, 파싱에 실패해 현재 UTC 시각으로 대신했는지 여부)
         """
-        published = ""
-
-        if hasattr(entry, "published"):
-            published = entry.published
-        elif hasattr(entry, "updated"):
-            published = entry.updated
-
-        date_formats = [
-            "%a, %d %b %Y %H:%M:%S %z",
-            "%a, %d %b %Y %H:%M:%S %Z",
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%S.%f%z",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-        ]
-
-        for date_format in date_formats:
-            try:
-                return datetime.strptime(published, date_format)
-            except (ValueError, TypeError):
-                continue
+        parsed = self._parse_entry_date(entry, profile)
+        if parsed is not None:
+            return parsed, False
+
+        logger.warning(
+            f"날짜 파싱 실패: {entry.get('published') or entry.get('updated')}, 현재 시간으로 대체"
+        )
+        return datetime.now(timezone.utc), True
 
-        logger.warning(f"날짜 파싱 실패: {published}, 현재 시간으로 대체")
-        return datetime.now()
+    def _parse_entry_date(
+        self, entry, profile: Optional[SourceProfile] = None
+    ) -> Optional[datetime]:
+        """피드 엔트리의 발행일을 파싱합니다. 실패하면 None을 반환합니다."""
+        return parse_entry_date(entry, profile)
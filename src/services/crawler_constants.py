@@ -1,16 +1,30 @@
-DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-DEFAULT_HEADERS = {
-    "User-Agent": DEFAULT_USER_AGENT,
-    "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-}
-
 THUMBNAIL_SIZE = (300, 300)
 THUMBNAIL_QUALITY = 85
 THUMBNAIL_FORMAT = "JPEG"
 
-MAX_RETRIES = 3
 REQUEST_TIMEOUT = 15
 
+CRAWL_CONCURRENCY = 4
+PER_HOST_CONCURRENCY = 1
+FEED_TIMEOUT = 120
+RUN_TIMEOUT = 900
+FEED_READ_CHUNK_SIZE = 16 * 1024
+HEAD_FETCH_MAX_BYTES = 64 * 1024
+HEAD_FETCH_CHUNK_SIZE = 8 * 1024
+
+TEXT_EXTRACTION_BACKEND = "lxml"
+
+# 피드 본문이 이보다 짧거나 말줄임 표시로 끝나면 잘린 요약으로 보고 원문을 가져옵니다.
+TRUNCATED_BODY_MIN_LENGTH = 500
+TRUNCATION_SUFFIXES = ("...", "…", "[…]", "[...]")
+TRUNCATION_LINK_TEXTS = (
+    "continue reading",
+    "read more",
+    "더 보기",
+    "더보기",
+    "계속 읽기",
+)
+
 from enum import Enum
 
 
@@ -23,3 +37,6 @@ class BlogType(Enum):
     MY_REAL_TRIP = "myrealtrip"
     DAANGN = "daangn"
     OLIVE_YOUNG = "olive_young"
+    # 레지스트리로 추가되는 블로그용 범용 타입
+    RSS = "rss"
+    MEDIUM = "medium"
@@ -1,62 +1,82 @@
 import logging
+import re
 from typing import Optional
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
 from requests import Session as RequestsSession
 
-from src.services.crawler_constants import REQUEST_TIMEOUT
+from src.services.crawler_constants import (
+    HEAD_FETCH_CHUNK_SIZE,
+    HEAD_FETCH_MAX_BYTES,
+    REQUEST_TIMEOUT,
+    TEXT_EXTRACTION_BACKEND,
+)
+from src.services.html_image_extractor import ImageCandidates, scan_image_candidates
+from src.services.text_extractor import TEXT_EXTRACTION_BACKENDS
+from src.utils.http_cache import http_cache
+from src.utils.http_retry import CircuitOpenError
 
 logger = logging.getLogger(__name__)
 
+_HEAD_END_PATTERN = re.compile(rb"</head\s*>", re.IGNORECASE)
+_HTML_END_PATTERN = re.compile(rb"</html\s*>", re.IGNORECASE)
 
-def extract_thumbnail_from_webpage(session: RequestsSession, url: str) -> Optional[str]:
+
+def extract_thumbnail_from_webpage(
+    session: RequestsSession,
+    url: str,
+    timeout: float = REQUEST_TIMEOUT,
+    head_only: bool = True,
+    max_head_bytes: int = HEAD_FETCH_MAX_BYTES,
+    deadline: Optional[float] = None,
+) -> Optional[str]:
     """
     웹페이지에서 썸네일 URL을 추출합니다.
 
     Open Graph(og:image), Twitter Card(twitter:image) 등 표준 메타 태그를
     우선적으로 확인하고, 없을 경우 HTML 본문의 첫 번째 이미지를 대안으로 사용합니다.
+    head_only가 True이면 먼저 `</head>`까지만(최대 max_head_bytes) 내려받고,
+    메타 태그가 없을 때만 전체 본문을 다시 요청합니다.
 
     Args:
         session: HTTP 요청에 사용할 requests.Session 객체.
         url: 썸네일을 추출할 웹페이지의 URL.
+        timeout: 요청 타임아웃(초).
+        head_only: `<head>` 영역만 먼저 스트리밍으로 읽을지 여부.
+        max_head_bytes: head_only 모드에서 읽을 최대 바이트 수.
+        deadline: time.monotonic() 기준 마감 시각. 재시도와 각 요청이 이를 넘지 않습니다.
 
     Returns:
         추출된 썸네일의 절대 URL. 찾지 못한 경우 None.
     """
     try:
-        response = session.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        html_content = response.text
-        soup = BeautifulSoup(html_content, "lxml")
-
-        og_image = soup.find("meta", property="og:image")
-        if og_image and og_image.get("content"):
-            logger.debug(f"'{url}'에서 'og:image' 메타 태그로 썸네일 찾음.")
-            return urljoin(url, og_image["content"])
-
-        twitter_image = soup.find("meta", attrs={"name": "twitter:image"})
-        if twitter_image and twitter_image.get("content"):
-            logger.debug(f"'{url}'에서 'twitter:image' 메타 태그로 썸네일 찾음.")
-            return urljoin(url, twitter_image["content"])
-
-        image_src_link = soup.find("link", rel="image_src")
-        if image_src_link and image_src_link.get("href"):
-            logger.debug(f"'{url}'에서 'link[rel=image_src]' 태그로 썸네일 찾음.")
-            return urljoin(url, image_src_link["href"])
-
-        logger.info(
-            f"'{url}'에서 메타 태그 썸네일을 찾지 못해 본문 이미지 검색을 시도합니다."
-        )
-        body_image_url = _extract_image_url_from_html(html_content, url)
-        if body_image_url:
-            logger.debug(f"'{url}'의 HTML 본문에서 썸네일로 사용할 이미지 찾음.")
-            return body_image_url
-
-        logger.warning(f"'{url}'에서 썸네일로 사용할 수 있는 이미지를 찾지 못했습니다.")
+        if head_only:
+            response = http_cache.get(
+                session,
+                url,
+                timeout=timeout,
+                read_body=_HeadReader(max_head_bytes),
+                cache_key=f"{url}#head",
+                deadline=deadline,
+            )
+            is_complete = bool(_HTML_END_PATTERN.search(response.content))
+            candidates = scan_image_candidates(response.text)
+            thumbnail_url = _select_thumbnail(candidates, url, include_body=is_complete)
+            if thumbnail_url or is_complete:
+                return thumbnail_url
+
+            logger.debug(
+                f"'{url}'의 <head>에서 메타 태그를 찾지 못해 전체 본문을 요청합니다."
+            )
+
+        response = http_cache.get(session, url, timeout=timeout, deadline=deadline)
+        candidates = scan_image_candidates(response.text)
+        return _select_thumbnail(candidates, url, include_body=True)
+
+    except CircuitOpenError as e:
+        logger.warning(f"'{url}' 썸네일 추출 건너뜀: {e}")
         return None
-
     except requests.RequestException as e:
         logger.error(f"'{url}' 썸네일 추출 중 네트워크 오류 발생: {e}", exc_info=True)
         return None
@@ -67,6 +87,65 @@ def extract_thumbnail_from_webpage(session: RequestsSession, url: str) -> Option
         return None
 
 
+class _HeadReader:
+    """
+    스트리밍 응답을 `</head>`가 나오거나 바이트 예산을 다 쓸 때까지만 읽습니다.
+
+    HttpCache.get의 read_body로 사용합니다.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+
+    def __call__(self, response: requests.Response) -> bytes:
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=HEAD_FETCH_CHUNK_SIZE):
+            search_from = max(0, len(buffer) - len(b"</head"))
+            buffer.extend(chunk)
+            match = _HEAD_END_PATTERN.search(buffer, search_from)
+            if match:
+                return bytes(buffer[: match.end()])
+            if len(buffer) >= self.max_bytes:
+                break
+        return bytes(buffer)
+
+
+def _select_thumbnail(
+    candidates: ImageCandidates, url: str, include_body: bool
+) -> Optional[str]:
+    """수집한 후보 중 우선순위가 가장 높은 썸네일의 절대 URL을 반환합니다."""
+    best = candidates.best(include_body=include_body)
+    if best is None:
+        if include_body:
+            logger.warning(
+                f"'{url}'에서 썸네일로 사용할 수 있는 이미지를 찾지 못했습니다."
+            )
+        return None
+
+    source, image_url = best
+    if source == "img":
+        logger.info(
+            f"'{url}'에서 메타 태그 썸네일을 찾지 못해 본문 이미지를 사용합니다."
+        )
+    else:
+        logger.debug(f"'{url}'에서 '{source}' 태그로 썸네일 찾음.")
+    return urljoin(url, image_url)
+
+
+def extract_thumbnail_from_html(html: str, url: str) -> Optional[str]:
+    """
+    이미 내려받은 웹페이지 HTML에서 썸네일 URL을 추출합니다.
+
+    Args:
+        html: 웹페이지 HTML 문자열.
+        url: 웹페이지의 URL (상대 경로 변환 기준).
+
+    Returns:
+        추출된 썸네일의 절대 URL. 찾지 못한 경우 None.
+    """
+    return _select_thumbnail(scan_image_candidates(html), url, include_body=True)
+
+
 def normalize_thumbnail_url(thumbnail_url: str, base_url: str) -> str:
     """
     썸네일 URL을 완전한 절대 경로로 정규화합니다.
@@ -86,44 +165,23 @@ def normalize_thumbnail_url(thumbnail_url: str, base_url: str) -> str:
     return urljoin(base_url, thumbnail_url)
 
 
-def extract_text_from_html(html_content: str) -> str:
+def extract_text_from_html(
+    html_content: str, backend: str = TEXT_EXTRACTION_BACKEND
+) -> str:
     """
     HTML 콘텐츠에서 스크립트와 스타일을 제거하고 순수 텍스트를 추출합니다.
 
     Args:
         html_content: 정제할 HTML 콘텐츠 문자열.
+        backend: 사용할 추출 엔진 ("lxml" 또는 "bs4"). 두 엔진의 결과는 같습니다.
 
     Returns:
         추출된 텍스트. 내용이 없으면 빈 문자열.
-    """
-    if not html_content:
-        return ""
-
-    soup = BeautifulSoup(html_content, "lxml")
-
-    for script_or_style in soup(["script", "style"]):
-        script_or_style.decompose()
-
-    return soup.get_text(separator="\n", strip=True)
 
-
-def _extract_image_url_from_html(html: str, base_url: str) -> Optional[str]:
+    Raises:
+        ValueError: 알 수 없는 backend인 경우.
     """
-    웹페이지 HTML 본문에서 가장 의미 있는 이미지 URL을 추출합니다.
-
-    Args:
-        html: 분석할 HTML 콘텐츠 문자열.
-        base_url: 이미지 URL이 상대 경로일 경우 절대 경로로 변환하기 위한 기준 URL.
-
-    Returns:
-        추출된 이미지의 절대 URL. 이미지를 찾지 못한 경우 None.
-    """
-    if not html:
-        return None
-
-    soup = BeautifulSoup(html, "lxml")
-    img_tag = soup.find("img")
-
-    if img_tag and img_tag.get("src"):
-        return urljoin(base_url, img_tag["src"])
-    return None
+    extractor = TEXT_EXTRACTION_BACKENDS.get(backend)
+    if extractor is None:
+        raise ValueError(f"알 수 없는 텍스트 추출 엔진입니다: {backend}")
+    return extractor(html_content)
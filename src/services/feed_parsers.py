@@ -0,0 +1,129 @@
+from typing import Dict, Optional, Tuple
+
+from lxml import etree
+
+from src.services.crawler_constants import (
+    TEXT_EXTRACTION_BACKEND,
+    TRUNCATED_BODY_MIN_LENGTH,
+    TRUNCATION_LINK_TEXTS,
+    TRUNCATION_SUFFIXES,
+    BlogType,
+)
+from src.services.crawler_utils import extract_text_from_html
+
+
+class FeedParser:
+    """
+    기본 RSS/Atom 피드 파서입니다.
+
+    항목의 본문을 추출하고, 그 본문이 글 전체인지(잘린 요약인지) 판단합니다.
+    본문이 잘린 경우 크롤러가 원문 페이지를 가져오며, 원문에서 본문을 찾을 때는
+    article_xpaths를 순서대로 시도합니다.
+
+    Attributes:
+        min_full_length: 전체 본문으로 볼 최소 텍스트 길이(문자 수).
+        article_xpaths: 원문 페이지에서 본문 영역을 찾을 XPath 목록 (우선순위 순).
+    """
+
+    min_full_length: int = TRUNCATED_BODY_MIN_LENGTH
+    article_xpaths: Tuple[str, ...] = ("//article", "//main")
+
+    def extract_content(
+        self, entry, backend: str = TEXT_EXTRACTION_BACKEND
+    ) -> Tuple[str, bool]:
+        """
+        피드 항목에서 본문 텍스트를 추출합니다.
+
+        Args:
+            entry: 피드 엔트리 객체.
+            backend: 텍스트 추출 엔진.
+
+        Returns:
+            (본문 텍스트, 전체 본문 여부) 튜플.
+        """
+        if "content" in entry and len(entry.content) > 0:
+            text = extract_text_from_html(entry.content[0].value, backend)
+            return text, self.has_full_body(entry, text, from_content=True)
+        if "summary" in entry:
+            text = extract_text_from_html(entry.summary, backend)
+            return text, self.has_full_body(entry, text, from_content=False)
+        return "", False
+
+    def has_full_body(self, entry, text: str, from_content: bool) -> bool:
+        """
+        추출한 본문이 글 전체인지 판단합니다.
+
+        content 요소는 말줄임 표시("...", "Continue reading" 등)로 끝나지 않으면
+        전체 본문으로 보고, summary만 있으면 길이와 말줄임 표시로 판단합니다.
+        """
+        if from_content:
+            return not _ends_with_marker(text)
+        return len(text) >= self.min_full_length and not _ends_with_marker(text)
+
+    def extract_article_text(
+        self, html: str, backend: str = TEXT_EXTRACTION_BACKEND
+    ) -> str:
+        """
+        원문 페이지에서 본문 영역의 텍스트를 추출합니다.
+
+        article_xpaths로 본문 영역을 찾지 못하면 페이지 전체의 텍스트를 반환합니다.
+        """
+        if not html:
+            return ""
+        try:
+            root = etree.fromstring(html, etree.HTMLParser())
+        except (etree.XMLSyntaxError, ValueError):
+            root = None
+
+        if root is not None:
+            for xpath in self.article_xpaths:
+                nodes = root.xpath(xpath)
+                if nodes:
+                    return extract_text_from_html(
+                        etree.tostring(nodes[0], encoding="unicode", method="html"),
+                        backend,
+                    )
+        return extract_text_from_html(html, backend)
+
+
+class MediumFeedParser(FeedParser):
+    """
+    Medium 피드 파서입니다.
+
+    Medium은 피드에 따라 content:encoded로 전체 본문을 주거나, description에
+    "Continue reading on Medium" 요약만 줍니다. 요약만 있으면 항상 잘린 것으로 봅니다.
+    """
+
+    article_xpaths = ("//article", "//section", "//main")
+
+    def has_full_body(self, entry, text: str, from_content: bool) -> bool:
+        return from_content and not _ends_with_marker(text)
+
+
+def _ends_with_marker(text: str) -> bool:
+    """본문 끝이 말줄임표나 "Continue reading on Medium »" 같은 링크 문구인지 확인합니다."""
+    tail = text[-40:].rstrip().lower()
+    return tail.endswith(TRUNCATION_SUFFIXES) or any(
+        link_text in tail for link_text in TRUNCATION_LINK_TEXTS
+    )
+
+
+DEFAULT_FEED_PARSER = FeedParser()
+
+FEED_PARSERS: Dict[BlogType, FeedParser] = {
+    BlogType.NAVER: DEFAULT_FEED_PARSER,
+    BlogType.KAKAO: DEFAULT_FEED_PARSER,
+    BlogType.DEVOCEAN: DEFAULT_FEED_PARSER,
+    BlogType.TOSS: DEFAULT_FEED_PARSER,
+    BlogType.LINE: DEFAULT_FEED_PARSER,
+    BlogType.MY_REAL_TRIP: MediumFeedParser(),
+    BlogType.DAANGN: MediumFeedParser(),
+    BlogType.OLIVE_YOUNG: DEFAULT_FEED_PARSER,
+    BlogType.RSS: DEFAULT_FEED_PARSER,
+    BlogType.MEDIUM: MediumFeedParser(),
+}
+
+
+def get_feed_parser(blog_type: Optional[BlogType]) -> FeedParser:
+    """블로그 타입에 맞는 피드 파서를 반환합니다. 등록되지 않은 타입은 기본 파서를 사용합니다."""
+    return FEED_PARSERS.get(blog_type, DEFAULT_FEED_PARSER)
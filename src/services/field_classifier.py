@@ -0,0 +1,212 @@
+import logging
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from src.models.enums import Field
+from src.services.local_summarizer import classify_field, keyword_scores
+
+logger = logging.getLogger(__name__)
+
+FIELD_CLASSIFIER_MAX_FEATURES = 20000
+FIELD_CLASSIFIER_MIN_DF = 2
+# 라벨이 붙은 포스트가 이보다 적으면 학습하지 않고 키워드 분류만 사용합니다.
+FIELD_CLASSIFIER_MIN_POSTS = 30
+KEYWORD_FEATURE_WEIGHT = 0.2
+HOLDOUT_RATIO = 0.2
+
+_WORD_PATTERN = re.compile(r"[0-9a-z가-힣]+")
+_HANGUL_PATTERN = re.compile(r"[가-힣]{3,}")
+
+
+def _tokens(text: str) -> List[str]:
+    """단어와, 조사가 붙은 한글 단어를 위한 글자 2-gram을 특징으로 뽑습니다."""
+    tokens = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        tokens.append(word)
+        if _HANGUL_PATTERN.fullmatch(word):
+            tokens.extend(f"#{word[i : i + 2]}" for i in range(len(word) - 1))
+    return tokens
+
+
+class FieldClassifier:
+    """
+    TF-IDF와 키워드 특징으로 포스트의 Field를 고르는 최근접 중심(Rocchio) 분류기입니다.
+
+    학습할 때 분류마다 TF-IDF 벡터의 중심을 구해 두고, 분류할 때는 글의 TF-IDF 벡터와
+    각 중심의 코사인 유사도에 FIELD_KEYWORDS 키워드 점수를 더해 가장 높은 분류를 고릅니다.
+    글 하나의 분류는 토큰화와 희소 벡터·중심 행렬 일부의 곱뿐이므로 수백 마이크로초 안에 끝납니다.
+    학습 전에는 키워드 분류(classify_field)로 대신합니다.
+
+    Attributes:
+        fields: 학습 데이터에 있던 분류 목록 (중심 행렬의 행 순서).
+        trained_on: 학습에 사용한 포스트 수.
+    """
+
+    def __init__(
+        self,
+        max_features: int = FIELD_CLASSIFIER_MAX_FEATURES,
+        min_df: int = FIELD_CLASSIFIER_MIN_DF,
+        keyword_weight: float = KEYWORD_FEATURE_WEIGHT,
+    ):
+        self.max_features = max_features
+        self.min_df = min_df
+        self.keyword_weight = keyword_weight
+        self.fields: List[Field] = []
+        self.trained_on = 0
+        self._vocabulary: Dict[str, int] = {}
+        self._idf = np.zeros(0, dtype=np.float32)
+        self._centroids = np.zeros((0, 0), dtype=np.float32)
+
+    @property
+    def trained(self) -> bool:
+        return bool(self.fields)
+
+    def fit(self, texts: Sequence[str], labels: Sequence[Field]) -> "FieldClassifier":
+        """
+        라벨이 붙은 글로 분류기를 학습합니다.
+
+        Args:
+            texts: 학습할 글 (제목과 요약).
+            labels: 글마다의 분류.
+
+        Raises:
+            ValueError: 글과 라벨 수가 다르거나, 특징으로 쓸 단어가 없는 경우.
+        """
+        if len(texts) != len(labels):
+            raise ValueError("학습할 글과 라벨의 수가 다릅니다.")
+        token_counts = [Counter(_tokens(text)) for text in texts]
+        document_frequency: Counter = Counter()
+        for counts in token_counts:
+            document_frequency.update(counts.keys())
+        terms = [
+            term
+            for term, count in document_frequency.most_common(self.max_features)
+            if count >= self.min_df
+        ]
+        if not terms:
+            raise ValueError("학습할 특징이 없습니다.")
+
+        vocabulary = {term: index for index, term in enumerate(terms)}
+        idf = np.array(
+            [
+                math.log((1 + len(texts)) / (1 + document_frequency[term])) + 1
+                for term in terms
+            ],
+            dtype=np.float32,
+        )
+        fields = sorted(set(labels), key=list(Field).index)
+        rows = {field: row for row, field in enumerate(fields)}
+        centroids = np.zeros((len(fields), len(terms)), dtype=np.float32)
+        for counts, label in zip(token_counts, labels):
+            indices, values = _tfidf(counts, vocabulary, idf)
+            centroids[rows[label], indices] += values
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+
+        self.fields = fields
+        self.trained_on = len(texts)
+        self._vocabulary = vocabulary
+        self._idf = idf
+        self._centroids = centroids / norms
+        return self
+
+    def predict(self, text: str) -> Field:
+        """글의 분류를 반환합니다."""
+        if not self.trained:
+            return classify_field(text)
+        indices, values = _tfidf(Counter(_tokens(text)), self._vocabulary, self._idf)
+        scores = self._centroids[:, indices] @ values
+        keywords = keyword_scores(text)
+        keyword_total = sum(keywords.values())
+        if keyword_total:
+            scores = scores + self.keyword_weight * np.array(
+                [keywords.get(field, 0) / keyword_total for field in self.fields],
+                dtype=np.float32,
+            )
+        return self.fields[int(np.argmax(scores))]
+
+    def predict_many(self, texts: Sequence[str]) -> List[Field]:
+        return [self.predict(text) for text in texts]
+
+
+def _tfidf(
+    counts: Counter, vocabulary: Dict[str, int], idf: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """단어 빈도를 L2 정규화된 희소 TF-IDF 벡터(인덱스, 값)로 바꿉니다."""
+    pairs = [
+        (vocabulary[term], 1.0 + math.log(count))
+        for term, count in counts.items()
+        if term in vocabulary
+    ]
+    if not pairs:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+    indices = np.fromiter((index for index, _ in pairs), dtype=np.int64)
+    values = np.fromiter((tf for _, tf in pairs), dtype=np.float32) * idf[indices]
+    return indices, values / np.linalg.norm(values)
+
+
+def agreement_report(
+    expected: Sequence[Field], predicted: Sequence[Field]
+) -> Dict[str, object]:
+    """
+    두 분류 결과(예: 저장된 LLM 분류와 로컬 분류)의 일치도를 계산합니다.
+
+    Returns:
+        전체 일치율, 분류별 건수/재현율/정밀도, 가장 많이 엇갈린 분류 쌍.
+    """
+    total = len(expected)
+    agreed = sum(a == b for a, b in zip(expected, predicted))
+    expected_counts = Counter(expected)
+    predicted_counts = Counter(predicted)
+    agreed_counts = Counter(a for a, b in zip(expected, predicted) if a == b)
+    by_field = {
+        field.value: {
+            "count": expected_counts[field],
+            "recall": round(agreed_counts[field] / expected_counts[field], 3),
+            "precision": (
+                round(agreed_counts[field] / predicted_counts[field], 3)
+                if predicted_counts[field]
+                else 0.0
+            ),
+        }
+        for field in Field
+        if expected_counts[field]
+    }
+    confusions = Counter(
+        f"{a.value} → {b.value}" for a, b in zip(expected, predicted) if a != b
+    )
+    return {
+        "posts": total,
+        "agreement": round(agreed / total, 3) if total else 0.0,
+        "by_field": by_field,
+        "top_disagreements": dict(confusions.most_common(5)),
+    }
+
+
+def holdout_agreement(
+    texts: Sequence[str],
+    labels: Sequence[Field],
+    holdout_ratio: float = HOLDOUT_RATIO,
+    seed: int = 0,
+) -> Dict[str, object]:
+    """
+    일부를 떼어 두고 나머지로 학습한 분류기가 떼어 둔 글의 라벨과 얼마나 일치하는지 계산합니다.
+
+    학습에 쓴 글로 일치도를 재면 실제보다 높게 나오므로, 새 글에 대한 일치도의 추정치로 사용합니다.
+    """
+    order = np.random.default_rng(seed).permutation(len(texts))
+    cut = max(1, int(len(texts) * holdout_ratio))
+    test, train = order[:cut], order[cut:]
+    classifier = FieldClassifier().fit(
+        [texts[i] for i in train], [labels[i] for i in train]
+    )
+    return agreement_report(
+        [labels[i] for i in test], classifier.predict_many([texts[i] for i in test])
+    )
+
+
+field_classifier = FieldClassifier()
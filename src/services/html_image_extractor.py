@@ -0,0 +1,114 @@
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+from lxml import etree
+
+
+@dataclass
+class ImageCandidates:
+    """
+    HTML 문서에서 수집한 썸네일 후보를 나타냅니다.
+
+    각 항목은 해당 태그가 문서에 처음 등장한 위치의 값입니다.
+
+    Attributes:
+        og_image: 첫 번째 meta[property=og:image]의 content.
+        twitter_image: 첫 번째 meta[name=twitter:image]의 content.
+        image_src: 첫 번째 link[rel=image_src]의 href.
+        first_img: 첫 번째 img의 src.
+    """
+
+    og_image: Optional[str] = None
+    twitter_image: Optional[str] = None
+    image_src: Optional[str] = None
+    first_img: Optional[str] = None
+    _og_seen: bool = field(default=False, init=False, repr=False)
+    _twitter_seen: bool = field(default=False, init=False, repr=False)
+    _image_src_seen: bool = field(default=False, init=False, repr=False)
+    _img_seen: bool = field(default=False, init=False, repr=False)
+
+    def best(self, include_body: bool = True) -> Optional[Tuple[str, str]]:
+        """
+        기존 우선순위(og:image > twitter:image > image_src > 본문 img)에 따라
+        가장 좋은 후보를 (태그 이름, URL) 형태로 반환합니다.
+
+        Args:
+            include_body: 메타 태그가 없을 때 본문 img도 후보로 사용할지 여부.
+        """
+        if self.og_image:
+            return "og:image", self.og_image
+        if self.twitter_image:
+            return "twitter:image", self.twitter_image
+        if self.image_src:
+            return "link[rel=image_src]", self.image_src
+        if include_body and self.first_img:
+            return "img", self.first_img
+        return None
+
+    def _visit(self, tag: str, attrib) -> bool:
+        """시작 태그 하나를 확인하고, 최우선 후보(og:image)를 찾았으면 True를 반환합니다."""
+        if tag == "meta":
+            if not self._og_seen and attrib.get("property") == "og:image":
+                self._og_seen = True
+                self.og_image = attrib.get("content") or None
+                return self.og_image is not None
+            if not self._twitter_seen and attrib.get("name") == "twitter:image":
+                self._twitter_seen = True
+                self.twitter_image = attrib.get("content") or None
+        elif tag == "link":
+            if (
+                not self._image_src_seen
+                and "image_src" in (attrib.get("rel") or "").split()
+            ):
+                self._image_src_seen = True
+                self.image_src = attrib.get("href") or None
+        elif tag == "img" and not self._img_seen:
+            self._img_seen = True
+            self.first_img = attrib.get("src") or None
+        return False
+
+
+class _StopParsing(Exception):
+    """최우선 후보를 찾아 파싱을 멈출 때 사용하는 내부 예외입니다."""
+
+
+class _CandidateTarget:
+    """시작 태그만 받아 ImageCandidates를 채우는 lxml 파서 타깃입니다."""
+
+    def __init__(self, candidates: ImageCandidates):
+        self.candidates = candidates
+
+    def start(self, tag, attrib) -> None:
+        if self.candidates._visit(tag, attrib):
+            raise _StopParsing()
+
+    def close(self) -> None:
+        return None
+
+
+def scan_image_candidates(html: str) -> ImageCandidates:
+    """
+    HTML을 한 번만 훑으면서 썸네일 후보를 모두 수집합니다.
+
+    트리를 만들지 않는 lxml 파서 타깃으로 시작 태그만 확인하고,
+    og:image를 찾으면 그 자리에서 파싱을 중단합니다.
+
+    Args:
+        html: 분석할 HTML 콘텐츠 문자열.
+
+    Returns:
+        수집한 ImageCandidates 객체.
+    """
+    candidates = ImageCandidates()
+    if not html:
+        return candidates
+
+    # libxml2 push 파서는 조각 경계에서 잘린 태그를 잘못 복구할 수 있으므로
+    # 문서를 나누지 않고 한 번에 넣습니다. 조기 종료는 타깃의 예외로 처리합니다.
+    parser = etree.HTMLParser(target=_CandidateTarget(candidates))
+    try:
+        parser.feed(html)
+        parser.close()
+    except (_StopParsing, etree.XMLSyntaxError):
+        pass
+    return candidates
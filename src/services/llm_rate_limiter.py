@@ -0,0 +1,311 @@
+import logging
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, TypeVar
+
+from openai import APIConnectionError
+
+from src.config.api_config import (
+    OPENAI_LATENCY_TARGET,
+    OPENAI_MAX_CONCURRENCY,
+    OPENAI_MAX_RETRIES,
+    OPENAI_RETRY_AFTER_MAX,
+    OPENAI_RPM_LIMIT,
+    OPENAI_TPM_LIMIT,
+    SUMMARY_CONCURRENCY,
+)
+from src.utils.http_retry import RetryPolicy, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 한도 초과(429), 요청 타임아웃(408), 충돌(409)과 일시적인 서버 오류는 기다렸다가 다시 요청합니다.
+# 응답을 받지 못한 연결 오류/타임아웃(APIConnectionError, APITimeoutError)도 다시 요청합니다.
+# 클라이언트의 자체 재시도(max_retries)를 끄므로 OpenAI SDK가 재시도하던 경우를 모두 포함합니다.
+RATE_LIMIT_STATUS = 429
+RETRYABLE_STATUSES = frozenset({408, 409, RATE_LIMIT_STATUS, 500, 502, 503, 504})
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class TokenBucket:
+    """
+    분당 한도를 초 단위로 채우는 토큰 버킷입니다.
+
+    잔량이 모자라도 요청 하나가 버킷 전체보다 크면 가득 찼을 때 보낼 수 있도록
+    필요한 양을 capacity로 제한하며, 차감 후 잔량은 음수가 될 수 있습니다.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = max(1.0, float(per_minute))
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / 60
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount만큼 꺼낼 수 있을 때까지 기다려야 하는 시간(초)을 반환합니다."""
+        self._refill(now)
+        needed = min(amount, self.capacity)
+        if self.level >= needed:
+            return 0.0
+        return (needed - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.level -= amount
+
+    def give_back(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+    def sync(self, limit: Optional[float], remaining: Optional[float]) -> None:
+        """서버가 알려준 한도와 잔량에 맞춥니다. 잔량은 더 적은 쪽을 따릅니다."""
+        if limit:
+            self.capacity = float(limit)
+        if remaining is not None:
+            self.level = min(self.level, float(remaining))
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class LlmRateLimiter:
+    """
+    LLM 요청의 분당 요청 수(RPM), 분당 토큰 수(TPM), 동시 요청 수를 제한하는 스케줄러입니다.
+
+    요청 전에 추정 토큰만큼 두 토큰 버킷에서 차감하고, 응답의 x-ratelimit-* 헤더와
+    실제 사용량으로 버킷을 보정합니다. 동시 요청 한도는 AIMD로 조정하여, 429 응답을
+    받으면 절반으로 줄이고 모든 요청을 Retry-After만큼 멈추며, 지연 시간이 목표보다
+    길면 하나씩 줄이고 목표 안에서 한도만큼 연속으로 성공하면 하나씩 늘립니다.
+    한도 초과로 실패한 요청은 백오프 후 다시 보내고, 재시도를 모두 소진하면 예외를 올립니다.
+
+    Attributes:
+        limit: 현재 동시 요청 한도.
+        max_concurrency: 동시 요청 한도의 최댓값.
+        latency_target: 동시 요청 한도를 늘릴 수 있는 최대 응답 시간(초).
+    """
+
+    def __init__(
+        self,
+        rpm: int = OPENAI_RPM_LIMIT,
+        tpm: int = OPENAI_TPM_LIMIT,
+        initial_concurrency: int = SUMMARY_CONCURRENCY,
+        max_concurrency: int = OPENAI_MAX_CONCURRENCY,
+        latency_target: float = OPENAI_LATENCY_TARGET,
+        policy: Optional[RetryPolicy] = None,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = min(max(1, initial_concurrency), self.max_concurrency)
+        self.latency_target = latency_target
+        self.policy = policy or RetryPolicy(
+            max_retries=OPENAI_MAX_RETRIES,
+            retry_after_max=OPENAI_RETRY_AFTER_MAX,
+            retry_statuses=RETRYABLE_STATUSES,
+        )
+        self.requests = 0
+        self.rate_limited = 0
+        self.retries = 0
+        self.wait_seconds = 0.0
+        self.min_limit = self.limit
+        self.max_limit_seen = self.limit
+        self._request_bucket = TokenBucket(rpm)
+        self._token_bucket = TokenBucket(tpm)
+        self._in_flight = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    def call(self, func: Callable[[], T], tokens: int) -> T:
+        """
+        한도 안에서 func을 호출하고, 한도 초과나 일시적인 서버/연결 오류면 기다렸다가 다시 호출합니다.
+
+        Args:
+            func: LLM 요청을 보내는 함수.
+            tokens: 요청의 추정 토큰 수 (입력 + 예상 출력).
+
+        Returns:
+            func의 반환값.
+
+        Raises:
+            Exception: 재시도할 수 없는 오류이거나 재시도를 모두 소진한 경우 func의 마지막 예외.
+        """
+        attempt = 0
+        while True:
+            self._acquire(tokens)
+            started = time.perf_counter()
+            try:
+                result = func()
+            except Exception as e:
+                status = _status_code(e)
+                self._release(
+                    time.perf_counter() - started, status == RATE_LIMIT_STATUS
+                )
+                if not _is_retryable(e, status):
+                    raise
+                retry_after = _retry_after(e)
+                delay = self.policy.delay(attempt, retry_after)
+                if delay is None:
+                    raise
+                logger.warning(
+                    f"LLM {_describe_error(e, status)}, {delay:.1f}초 후 재시도합니다 "
+                    f"({attempt + 1}/{self.policy.max_retries}, 동시 요청 한도: {self.limit})"
+                )
+                with self._cond:
+                    self.retries += 1
+                    if status == RATE_LIMIT_STATUS:
+                        # 다른 요청도 같은 한도를 공유하므로 모두 함께 멈춥니다.
+                        self._paused_until = max(
+                            self._paused_until, time.monotonic() + delay
+                        )
+                    else:
+                        self._cond.notify_all()
+                if status != RATE_LIMIT_STATUS:
+                    time.sleep(delay)
+                attempt += 1
+            else:
+                self._release(time.perf_counter() - started, False)
+                return result
+
+    def observe(
+        self,
+        headers: Optional[Mapping[str, str]],
+        estimated_tokens: int,
+        used_tokens: Optional[int],
+    ) -> None:
+        """
+        응답으로 버킷을 보정합니다.
+
+        Args:
+            headers: 응답 헤더 (x-ratelimit-limit/remaining/reset-requests|tokens).
+            estimated_tokens: 요청 전에 차감한 추정 토큰 수.
+            used_tokens: 응답의 실제 사용 토큰 수. 모르면 None.
+        """
+        with self._cond:
+            if used_tokens is not None:
+                self._token_bucket.give_back(estimated_tokens - used_tokens)
+            if headers:
+                self._sync_bucket(self._request_bucket, headers, "requests")
+                self._sync_bucket(self._token_bucket, headers, "tokens")
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "requests": self.requests,
+                "rate_limited": self.rate_limited,
+                "retries": self.retries,
+                "wait_seconds": round(self.wait_seconds, 2),
+                "concurrency": self.limit,
+                "concurrency_range": [self.min_limit, self.max_limit_seen],
+                "rpm_limit": int(self._request_bucket.capacity),
+                "tpm_limit": int(self._token_bucket.capacity),
+            }
+
+    def _acquire(self, tokens: int) -> None:
+        started = time.monotonic()
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                wait = None
+                if self._in_flight < self.limit:
+                    wait = max(
+                        self._paused_until - now,
+                        self._request_bucket.wait_time(1, now),
+                        self._token_bucket.wait_time(tokens, now),
+                    )
+                    if wait <= 0:
+                        break
+                self._cond.wait(wait)
+
+            self._request_bucket.take(1)
+            self._token_bucket.take(tokens)
+            self._in_flight += 1
+            self.requests += 1
+            self.wait_seconds += time.monotonic() - started
+
+    def _release(self, latency: float, rate_limited: bool) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if rate_limited:
+                self.rate_limited += 1
+                self._set_limit(self.limit // 2)
+            elif latency > self.latency_target:
+                self._set_limit(self.limit - 1)
+            else:
+                self._successes += 1
+                if self._successes >= self.limit:
+                    self._set_limit(self.limit + 1)
+            self._cond.notify_all()
+
+    def _set_limit(self, limit: int) -> None:
+        limit = min(max(1, limit), self.max_concurrency)
+        if limit != self.limit:
+            logger.info(f"LLM 동시 요청 한도 조정: {self.limit} → {limit}")
+        self.limit = limit
+        self._successes = 0
+        self.min_limit = min(self.min_limit, limit)
+        self.max_limit_seen = max(self.max_limit_seen, limit)
+
+    def _sync_bucket(
+        self, bucket: TokenBucket, headers: Mapping[str, str], kind: str
+    ) -> None:
+        limit = _header_float(headers, f"x-ratelimit-limit-{kind}")
+        remaining = _header_float(headers, f"x-ratelimit-remaining-{kind}")
+        bucket.sync(limit, remaining)
+        if remaining is not None and remaining <= 0:
+            reset = _parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+            if reset:
+                self._paused_until = max(self._paused_until, time.monotonic() + reset)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _is_retryable(error: Exception, status: Optional[int]) -> bool:
+    if status is None:
+        return isinstance(error, APIConnectionError)
+    return status in RETRYABLE_STATUSES
+
+
+def _describe_error(error: Exception, status: Optional[int]) -> str:
+    if status is not None:
+        return f"{status} 응답"
+    return f"연결 오류({type(error).__name__})"
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    if response is None or getattr(response, "headers", None) is None:
+        return None
+    return parse_retry_after(response)
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _parse_duration(value: Optional[str]) -> Optional[float]:
+    """OpenAI의 재설정 시간 표기("1s", "6m0s", "20ms")를 초 단위로 변환합니다."""
+    if not value:
+        return None
+    parts = _DURATION_PATTERN.findall(value)
+    if not parts:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+llm_rate_limiter = LlmRateLimiter()
@@ -0,0 +1,208 @@
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.config.api_config import (
+    OPENAI_INPUT_PRICE_PER_1M,
+    OPENAI_MODEL_PRICES,
+    OPENAI_OUTPUT_PRICE_PER_1M,
+)
+from src.utils.stat_utils import percentile_ms
+
+logger = logging.getLogger(__name__)
+
+
+def model_price(model: str) -> Optional[Tuple[float, float]]:
+    """
+    모델의 100만 토큰당 (입력, 출력) 가격(USD)을 반환합니다.
+
+    OPENAI_INPUT_PRICE_PER_1M/OPENAI_OUTPUT_PRICE_PER_1M이 설정되어 있으면 그 값을, 아니면
+    OPENAI_MODEL_PRICES에서 모델 이름("gpt-4o-mini-2024-07-18" 등)이 가장 길게 일치하는 항목을 씁니다.
+    모르는 모델이면 None.
+    """
+    if OPENAI_INPUT_PRICE_PER_1M is not None and OPENAI_OUTPUT_PRICE_PER_1M is not None:
+        return OPENAI_INPUT_PRICE_PER_1M, OPENAI_OUTPUT_PRICE_PER_1M
+    for name in sorted(OPENAI_MODEL_PRICES, key=len, reverse=True):
+        if model.startswith(name):
+            return OPENAI_MODEL_PRICES[name]
+    return None
+
+
+@dataclass
+class LlmCallRecord:
+    """
+    LLM 호출 한 번의 기록입니다.
+
+    Attributes:
+        kind: 호출 종류 ("summary": 최종 요약, "chunk": 긴 글의 조각 요약).
+        model: 응답한 모델 이름.
+        company: 포스트를 발행한 회사 이름 (모르면 None).
+        url: 포스트의 URL (모르면 None).
+        prompt_tokens: 입력 토큰 수 (응답의 usage 기준).
+        completion_tokens: 출력 토큰 수.
+        latency: 마지막 시도의 응답 시간(초).
+        elapsed: 한도 대기와 재시도를 포함해 호출에 걸린 전체 시간(초).
+        attempts: 요청을 보낸 횟수 (재시도 횟수 + 1).
+        outcome: 파싱까지 성공하면 "ok", 응답은 받았지만 출력 파서가 실패하면 "parse_error",
+            재시도 후에도 응답을 받지 못하면 "error".
+        cost: 추정 비용(USD). 가격을 모르는 모델이면 None.
+    """
+
+    kind: str
+    model: str
+    company: Optional[str]
+    url: Optional[str]
+    prompt_tokens: int
+    completion_tokens: int
+    latency: float
+    elapsed: float
+    attempts: int
+    outcome: str
+    cost: Optional[float] = None
+
+    def __post_init__(self):
+        if self.cost is None:
+            price = model_price(self.model)
+            if price is not None:
+                self.cost = (
+                    self.prompt_tokens * price[0] + self.completion_tokens * price[1]
+                ) / 1_000_000
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+
+class LlmUsageTracker:
+    """
+    실행 중의 LLM 호출 기록을 모아 실행 전체, 회사별, 포스트별 사용량 보고서를 만듭니다.
+
+    Attributes:
+        records: 기록된 호출 목록 (기록한 순서).
+    """
+
+    def __init__(self):
+        self.records: List[LlmCallRecord] = []
+        self._lock = threading.Lock()
+
+    def record(self, call: LlmCallRecord) -> None:
+        with self._lock:
+            self.records.append(call)
+
+    def report(self, top: int = 10) -> Dict[str, Any]:
+        """
+        사용량 보고서를 만듭니다.
+
+        Args:
+            top: 비용이 가장 큰 포스트와 가장 느린 포스트를 몇 개씩 보여줄지.
+
+        Returns:
+            전체 합계(totals), 호출 종류별(by_kind), 모델별(by_model), 회사별(by_company,
+            비용이 큰 순서), 비용이 큰 포스트(costliest_posts), 느린 포스트(slowest_posts).
+        """
+        with self._lock:
+            records = list(self.records)
+
+        by_post = _group(records, lambda call: call.url)
+        by_post.pop(None, None)
+        posts = [
+            {
+                "url": url,
+                "company": calls[0].company,
+                **_aggregate(calls),
+                "latency_total_ms": round(
+                    sum(call.latency for call in calls) * 1000, 1
+                ),
+            }
+            for url, calls in by_post.items()
+        ]
+        by_company = {
+            company or "unknown": _aggregate(calls)
+            for company, calls in _group(records, lambda call: call.company).items()
+        }
+        return {
+            "totals": _aggregate(records),
+            "by_kind": {
+                kind: _aggregate(calls)
+                for kind, calls in _group(records, lambda call: call.kind).items()
+            },
+            "by_model": {
+                model: _aggregate(calls)
+                for model, calls in _group(records, lambda call: call.model).items()
+            },
+            "by_company": dict(
+                sorted(
+                    by_company.items(),
+                    key=lambda item: (-item[1]["cost_usd"], -item[1]["total_tokens"]),
+                )
+            ),
+            "costliest_posts": sorted(
+                posts, key=lambda post: (-post["cost_usd"], -post["total_tokens"])
+            )[:top],
+            "slowest_posts": sorted(posts, key=lambda post: -post["latency_total_ms"])[
+                :top
+            ],
+        }
+
+    def write_report(self, path: str, **sections: Any) -> bool:
+        """
+        사용량 보고서를 JSON 파일로 저장합니다.
+
+        Args:
+            path: 저장할 파일 경로.
+            **sections: 보고서에 함께 넣을 항목 (실행 정보, 다른 통계 등).
+
+        Returns:
+            저장했으면 True.
+        """
+        report = {**sections, "llm": self.report()}
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"실행 보고서 저장 실패: {path} - {e}")
+            return False
+        return True
+
+
+def _group(
+    records: Iterable[LlmCallRecord], key: Callable[[LlmCallRecord], Any]
+) -> Dict[Any, List[LlmCallRecord]]:
+    groups: Dict[Any, List[LlmCallRecord]] = defaultdict(list)
+    for call in records:
+        groups[key(call)].append(call)
+    return dict(groups)
+
+
+def _aggregate(calls: List[LlmCallRecord]) -> Dict[str, Any]:
+    latencies = sorted(call.latency for call in calls if call.outcome != "error")
+    elapsed = sorted(call.elapsed for call in calls)
+    prompt_tokens = sum(call.prompt_tokens for call in calls)
+    completion_tokens = sum(call.completion_tokens for call in calls)
+    return {
+        "calls": len(calls),
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "cost_usd": round(sum(call.cost or 0.0 for call in calls), 6),
+        "unpriced_calls": sum(call.cost is None for call in calls),
+        "retries": sum(call.retries for call in calls),
+        "parse_failures": sum(call.outcome == "parse_error" for call in calls),
+        "errors": sum(call.outcome == "error" for call in calls),
+        "latency_p50_ms": percentile_ms(latencies, 0.50),
+        "latency_p95_ms": percentile_ms(latencies, 0.95),
+        "latency_max_ms": round(latencies[-1] * 1000, 1) if latencies else 0.0,
+        "elapsed_p95_ms": percentile_ms(elapsed, 0.95),
+    }
+
+
+llm_usage = LlmUsageTracker()
@@ -0,0 +1,253 @@
+import logging
+import re
+from typing import Dict, List
+
+import numpy as np
+
+from src.models.enums import Field
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_MAX_CHARS = 520
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_MAX_ITERATIONS = 50
+TEXTRANK_TOLERANCE = 1e-6
+MIN_SENTENCE_LENGTH = 10
+
+_SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?。])\s+|\n+")
+_WORD_PATTERN = re.compile(r"[0-9A-Za-z가-힣]+")
+
+# 본문에 키워드가 많이 나올수록 그 분류일 가능성이 높다고 봅니다 (대소문자 무시).
+FIELD_KEYWORDS: Dict[Field, List[str]] = {
+    Field.AI: [
+        "ai",
+        "llm",
+        "gpt",
+        "chatgpt",
+        "머신러닝",
+        "딥러닝",
+        "인공지능",
+        "모델 학습",
+        "생성형",
+        "추천 모델",
+        "rag",
+        "임베딩",
+        "프롬프트",
+        "파인튜닝",
+    ],
+    Field.BACKEND: [
+        "서버",
+        "백엔드",
+        "api",
+        "spring",
+        "kotlin",
+        "java",
+        "msa",
+        "트래픽",
+        "kafka",
+        "redis",
+        "동시성",
+        "마이크로서비스",
+        "jvm",
+    ],
+    Field.FRONTEND: [
+        "프론트엔드",
+        "react",
+        "vue",
+        "javascript",
+        "typescript",
+        "css",
+        "브라우저",
+        "웹 성능",
+        "next.js",
+        "렌더링",
+        "디자인 시스템",
+    ],
+    Field.DEVOPS: [
+        "ci/cd",
+        "docker",
+        "kubernetes",
+        "k8s",
+        "aws",
+        "azure",
+        "gcp",
+        "배포",
+        "인프라",
+        "모니터링",
+        "terraform",
+        "클라우드",
+        "쿠버네티스",
+    ],
+    Field.MOBILE: [
+        "android",
+        "ios",
+        "안드로이드",
+        "swift",
+        "flutter",
+        "모바일",
+        "앱 개발",
+        "react native",
+        "jetpack",
+    ],
+    Field.DB: [
+        "데이터베이스",
+        "mysql",
+        "postgresql",
+        "쿼리",
+        "인덱스",
+        "sql",
+        "mongodb",
+        "샤딩",
+        "트랜잭션",
+        "db",
+    ],
+    Field.COLLAB_TOOL: [
+        "협업",
+        "회고",
+        "온보딩",
+        "문서화",
+        "슬랙",
+        "jira",
+        "notion",
+        "코드 리뷰",
+        "스크럼",
+        "애자일",
+    ],
+}
+FIELD_MIN_SCORE = 2
+
+
+def split_sentences(text: str) -> List[str]:
+    """본문을 문장 단위로 나눕니다. 너무 짧은 조각(메뉴, 캡션 등)은 버립니다."""
+    sentences = []
+    for sentence in _SENTENCE_SPLIT_PATTERN.split(text):
+        sentence = " ".join(sentence.split())
+        if len(sentence) >= MIN_SENTENCE_LENGTH:
+            sentences.append(sentence)
+    return sentences
+
+
+def _sentence_vectors(sentences: List[str]) -> np.ndarray:
+    """
+    문장마다 글자 2-gram 빈도 벡터를 만들어 L2 정규화합니다.
+
+    한국어는 조사가 붙어 단어 단위로는 겹치는 부분이 적으므로 단어 안의 글자 2-gram을 씁니다.
+    """
+    vocabulary: Dict[str, int] = {}
+    rows: List[Dict[int, int]] = []
+    for sentence in sentences:
+        counts: Dict[int, int] = {}
+        for word in _WORD_PATTERN.findall(sentence.lower()):
+            grams = (
+                [word]
+                if len(word) < 2
+                else [word[i : i + 2] for i in range(len(word) - 1)]
+            )
+            for gram in grams:
+                index = vocabulary.setdefault(gram, len(vocabulary))
+                counts[index] = counts.get(index, 0) + 1
+        rows.append(counts)
+
+    vectors = np.zeros((len(sentences), max(1, len(vocabulary))))
+    for row, counts in enumerate(rows):
+        for index, count in counts.items():
+            vectors[row, index] = count
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def textrank_scores(sentences: List[str]) -> np.ndarray:
+    """문장 유사도 그래프에 PageRank를 적용해 문장별 중요도를 계산합니다."""
+    count = len(sentences)
+    if count == 0:
+        return np.zeros(0)
+    vectors = _sentence_vectors(sentences)
+    similarity = vectors @ vectors.T
+    np.fill_diagonal(similarity, 0.0)
+
+    row_sums = similarity.sum(axis=1, keepdims=True)
+    # 다른 문장과 전혀 겹치지 않는 문장은 모든 문장으로 균등하게 이어지도록 합니다.
+    transition = np.where(
+        row_sums > 0, similarity / np.where(row_sums > 0, row_sums, 1), 1.0 / count
+    )
+
+    scores = np.full(count, 1.0 / count)
+    for _ in range(TEXTRANK_MAX_ITERATIONS):
+        updated = (1 - TEXTRANK_DAMPING) / count + TEXTRANK_DAMPING * (
+            transition.T @ scores
+        )
+        if np.abs(updated - scores).sum() < TEXTRANK_TOLERANCE:
+            return updated
+        scores = updated
+    return scores
+
+
+def extractive_summary(text: str, max_chars: int = SUMMARY_MAX_CHARS) -> str:
+    """
+    TextRank로 중요한 문장을 골라 max_chars자 이하의 요약을 만듭니다.
+
+    본문이 이미 max_chars자 이하이면 공백만 정리해 그대로 반환하고, 고른 문장은
+    본문에 나온 순서대로 이어 붙입니다.
+    """
+    normalized = " ".join(text.split())
+    if len(normalized) <= max_chars:
+        return normalized
+
+    # 반복되는 문장(공통 안내 문구 등)이 요약에 여러 번 들어가지 않도록 한 번만 남깁니다.
+    sentences = list(dict.fromkeys(split_sentences(text)))
+    if not sentences:
+        return normalized[: max_chars - 1] + "…"
+
+    scores = textrank_scores(sentences)
+    chosen: List[int] = []
+    length = 0
+    for index in np.argsort(-scores, kind="stable"):
+        added = len(sentences[index]) + (1 if chosen else 0)
+        if length + added <= max_chars:
+            chosen.append(int(index))
+            length += added
+
+    if not chosen:
+        best = sentences[int(np.argmax(scores))]
+        return best[: max_chars - 1] + "…"
+    return " ".join(sentences[index] for index in sorted(chosen))
+
+
+def keyword_scores(text: str) -> Dict[Field, int]:
+    """분류별로 본문에 나온 FIELD_KEYWORDS 키워드 수를 셉니다 (대소문자 무시)."""
+    lowered = text.lower()
+    words = set(_WORD_PATTERN.findall(lowered))
+    scores: Dict[Field, int] = {}
+    for field, keywords in FIELD_KEYWORDS.items():
+        score = 0
+        for keyword in keywords:
+            # 짧은 영문 약어(ai, db 등)는 다른 단어 안에 섞이지 않도록 단어 단위로만 셉니다.
+            if keyword.isascii() and keyword.isalnum() and len(keyword) <= 3:
+                score += keyword in words
+            else:
+                score += lowered.count(keyword)
+        scores[field] = score
+    return scores
+
+
+def classify_field(text: str) -> Field:
+    """키워드 빈도로 분류를 정합니다. 어느 분류도 FIELD_MIN_SCORE에 못 미치면 기타입니다."""
+    best_field, best_score = Field.ETC, 0
+    for field, score in keyword_scores(text).items():
+        if score > best_score:
+            best_field, best_score = field, score
+    return best_field if best_score >= FIELD_MIN_SCORE else Field.ETC
+
+
+def summarize_locally(content: str) -> Dict[str, str]:
+    """
+    LLM 없이 요약합니다.
+
+    Returns:
+        LLM 요약과 같은 형태의 요약 결과(summary, field).
+    """
+    return {
+        "summary": extractive_summary(content),
+        "field": classify_field(content).value,
+    }
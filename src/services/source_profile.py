@@ -0,0 +1,313 @@
+import json
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.config.cache_config import SOURCE_PROFILE_PATH
+
+logger = logging.getLogger(__name__)
+
+DATE_FIELDS: Tuple[str, ...] = ("published", "updated")
+DATE_FORMATS: Tuple[str, ...] = (
+    "%a, %d %b %Y %H:%M:%S %z",
+    "%a, %d %b %Y %H:%M:%S %Z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+# 문자열 파싱이 모두 실패했을 때 사용하는 feedparser의 파싱 결과(UTC struct_time)입니다.
+PARSED_DATE_FIELDS: Tuple[str, ...] = ("published_parsed", "updated_parsed")
+
+_IMG_SRC_PATTERN = re.compile(r'<img[^>]+src=[\'"]([^\'"]+)[\'"]', re.IGNORECASE)
+
+
+@dataclass
+class SourceProfile:
+    """
+    피드 하나에서 마지막으로 성공한 파싱 방법을 나타냅니다.
+
+    Attributes:
+        date_field: 날짜를 찾은 필드 (published, updated, published_parsed, updated_parsed).
+        date_format: date_field가 문자열 필드일 때 일치한 strptime 형식.
+        thumbnail_strategy: 썸네일을 찾은 전략 이름 (THUMBNAIL_STRATEGIES의 키).
+        fast_path_hits: 이번 실행에서 프로필로 바로 성공한 횟수 (저장하지 않음).
+        fallbacks: 이번 실행에서 전체 탐색을 수행한 횟수 (저장하지 않음).
+    """
+
+    date_field: Optional[str] = None
+    date_format: Optional[str] = None
+    thumbnail_strategy: Optional[str] = None
+    fast_path_hits: int = field(default=0, compare=False)
+    fallbacks: int = field(default=0, compare=False)
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return {
+            "date_field": self.date_field,
+            "date_format": self.date_format,
+            "thumbnail_strategy": self.thumbnail_strategy,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SourceProfile":
+        profile = cls(
+            date_field=data.get("date_field"),
+            date_format=data.get("date_format"),
+            thumbnail_strategy=data.get("thumbnail_strategy"),
+        )
+        # 코드가 바뀌어 더 이상 없는 형식/전략은 버리고 다시 학습합니다.
+        if profile.date_format not in DATE_FORMATS:
+            profile.date_format = None
+        if profile.date_field not in DATE_FIELDS + PARSED_DATE_FIELDS:
+            profile.date_field = None
+        if profile.thumbnail_strategy not in THUMBNAIL_STRATEGIES:
+            profile.thumbnail_strategy = None
+        return profile
+
+
+def parse_entry_date(
+    entry, profile: Optional[SourceProfile] = None
+) -> Optional[datetime]:
+    """
+    피드 엔트리의 발행일을 파싱합니다.
+
+    프로필에 기록된 필드와 형식을 먼저 시도하고, 실패하면 published/updated 문자열에
+    모든 형식을 차례로 시도한 뒤 feedparser의 published_parsed/updated_parsed를 사용합니다.
+    성공한 방법은 프로필에 기록됩니다.
+
+    Args:
+        entry: 피드 엔트리 객체.
+        profile: 피드의 파싱 프로필. None이면 학습 없이 전체 탐색만 수행합니다.
+
+    Returns:
+        파싱된 datetime 객체. 모든 방법이 실패하면 None.
+    """
+    field_name, raw = _raw_date(entry)
+
+    if profile is not None and profile.date_field:
+        parsed = None
+        if profile.date_field == field_name and profile.date_format:
+            parsed = _strptime(raw, profile.date_format)
+        elif profile.date_field in PARSED_DATE_FIELDS:
+            parsed = _from_struct(entry.get(profile.date_field))
+        if parsed is not None:
+            profile.fast_path_hits += 1
+            return parsed
+
+    if profile is not None:
+        profile.fallbacks += 1
+
+    for date_format in DATE_FORMATS:
+        parsed = _strptime(raw, date_format)
+        if parsed is not None:
+            if profile is not None:
+                profile.date_field, profile.date_format = field_name, date_format
+            return parsed
+
+    for struct_field in PARSED_DATE_FIELDS:
+        parsed = _from_struct(entry.get(struct_field))
+        if parsed is not None:
+            if profile is not None:
+                profile.date_field, profile.date_format = struct_field, None
+            return parsed
+    return None
+
+
+def extract_entry_thumbnail(entry, profile: Optional[SourceProfile] = None) -> str:
+    """
+    피드 엔트리에서 썸네일 URL을 추출합니다.
+
+    프로필에 기록된 전략을 먼저 시도하고, 실패하면 모든 전략을 우선순위대로 시도합니다.
+    성공한 전략은 프로필에 기록됩니다.
+
+    Args:
+        entry: 피드 엔트리 객체.
+        profile: 피드의 파싱 프로필. None이면 학습 없이 전체 탐색만 수행합니다.
+
+    Returns:
+        썸네일 URL. 찾지 못하면 빈 문자열.
+    """
+    if profile is not None and profile.thumbnail_strategy:
+        strategy = THUMBNAIL_STRATEGIES[profile.thumbnail_strategy]
+        thumbnail_url = strategy(entry)
+        if thumbnail_url is not None:
+            profile.fast_path_hits += 1
+            return thumbnail_url
+
+    if profile is not None:
+        profile.fallbacks += 1
+
+    for name, strategy in THUMBNAIL_STRATEGIES.items():
+        thumbnail_url = strategy(entry)
+        if thumbnail_url is not None:
+            if profile is not None:
+                profile.thumbnail_strategy = name
+            return thumbnail_url
+    return ""
+
+
+def _raw_date(entry) -> Tuple[Optional[str], str]:
+    if hasattr(entry, "published"):
+        return "published", entry.published
+    if hasattr(entry, "updated"):
+        return "updated", entry.updated
+    return None, ""
+
+
+def _strptime(value: str, date_format: str) -> Optional[datetime]:
+    try:
+        return datetime.strptime(value, date_format)
+    except (ValueError, TypeError):
+        return None
+
+
+def _from_struct(value) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime(*value[:6], tzinfo=timezone.utc)
+    except (ValueError, TypeError):
+        return None
+
+
+def _thumbnail_tag(entry) -> Optional[str]:
+    if hasattr(entry, "thumbnail"):
+        logger.info("thumbnail 태그에서 썸네일 찾음")
+        return entry.thumbnail
+    return None
+
+
+def _media_thumbnail(entry) -> Optional[str]:
+    if hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
+        logger.info("media_thumbnail에서 썸네일 찾음")
+        return entry.media_thumbnail[0]["url"]
+    return None
+
+
+def _image_link(entry) -> Optional[str]:
+    if hasattr(entry, "links"):
+        for link in entry.links:
+            if link.get("type", "").startswith("image"):
+                logger.info("이미지 링크에서 썸네일 찾음")
+                return link.get("href", "")
+    return None
+
+
+def _content_image(entry) -> Optional[str]:
+    if hasattr(entry, "content"):
+        for content in entry.content:
+            if not hasattr(content, "value"):
+                continue
+            img_match = _IMG_SRC_PATTERN.search(content.value)
+            if img_match:
+                logger.info("본문에서 이미지 추출")
+                return img_match.group(1)
+    return None
+
+
+def _summary_image(entry) -> Optional[str]:
+    if hasattr(entry, "summary"):
+        img_match = _IMG_SRC_PATTERN.search(entry.summary)
+        if img_match:
+            logger.info("요약에서 이미지 추출")
+            return img_match.group(1)
+    return None
+
+
+# 우선순위 순서입니다. 각 전략은 찾지 못하면 None을 반환합니다.
+THUMBNAIL_STRATEGIES: Dict[str, Callable[[Any], Optional[str]]] = {
+    "thumbnail": _thumbnail_tag,
+    "media_thumbnail": _media_thumbnail,
+    "image_link": _image_link,
+    "content_image": _content_image,
+    "summary_image": _summary_image,
+}
+
+
+class SourceProfileStore:
+    """
+    피드 URL별 파싱 프로필을 JSON 파일로 보관합니다.
+
+    프로필은 실행 사이에 유지되며, 잘못되거나 오래된 값은 다음 파싱에서
+    전체 탐색으로 자연스럽게 교정되므로 언제든 파일을 지워도 됩니다.
+    """
+
+    def __init__(self, path: str = SOURCE_PROFILE_PATH):
+        self.path = path
+        self._profiles: Optional[Dict[str, SourceProfile]] = None
+        self._saved: Dict[str, Dict[str, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, feed_url: str) -> SourceProfile:
+        """feed_url의 프로필을 반환합니다. 없으면 빈 프로필을 만듭니다."""
+        with self._lock:
+            profiles = self._load()
+            profile = profiles.get(feed_url)
+            if profile is None:
+                profile = profiles[feed_url] = SourceProfile()
+            return profile
+
+    def stats(self) -> Dict[str, int]:
+        """이번 실행의 프로필 적중/전체 탐색 횟수를 반환합니다."""
+        with self._lock:
+            profiles = list((self._profiles or {}).values())
+        return {
+            "profiles": len(profiles),
+            "fast_path_hits": sum(profile.fast_path_hits for profile in profiles),
+            "fallbacks": sum(profile.fallbacks for profile in profiles),
+        }
+
+    def save(self) -> None:
+        """바뀐 프로필이 있으면 파일에 기록합니다."""
+        with self._lock:
+            if self._profiles is None:
+                return
+            snapshot = {
+                feed_url: profile.to_dict()
+                for feed_url, profile in self._profiles.items()
+                if profile.to_dict() != SourceProfile().to_dict()
+            }
+            if snapshot == self._saved:
+                return
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                temp_path = f"{self.path}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f, ensure_ascii=False, indent=2, sort_keys=True)
+                os.replace(temp_path, self.path)
+                self._saved = snapshot
+            except OSError as e:
+                logger.warning(f"파싱 프로필 저장 실패: {self.path} - {e}")
+
+    def _load(self) -> Dict[str, SourceProfile]:
+        if self._profiles is not None:
+            return self._profiles
+
+        self._profiles = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._profiles = {
+                feed_url: SourceProfile.from_dict(values)
+                for feed_url, values in data.items()
+            }
+            self._saved = {
+                feed_url: profile.to_dict()
+                for feed_url, profile in self._profiles.items()
+            }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(
+                f"파싱 프로필을 읽지 못해 새로 학습합니다: {self.path} - {e}"
+            )
+        return self._profiles
+
+
+source_profile_store = SourceProfileStore()
@@ -1,13 +1,44 @@
+import hashlib
 import logging
+import threading
+import time
+import unicodedata
+from collections import Counter, defaultdict
 from enum import Enum
-from typing import Dict
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
 
 from langchain.output_parsers import PydanticOutputParser
 from langchain.prompts import ChatPromptTemplate
+from langchain_core.messages import BaseMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 
-from src.config.api_config import OPENAI_API_KEY, OPENAI_MODEL_NAME, OPENAI_TEMPERATURE
+from src.config.api_config import (
+    FIELD_SOURCE,
+    LOCAL_SUMMARY_MAX_CHARS,
+    OPENAI_API_KEY,
+    OPENAI_MODEL_NAME,
+    OPENAI_TEMPERATURE,
+    SUMMARY_BACKEND,
+    SUMMARY_CHUNK_TOKENS,
+    SUMMARY_CONCURRENCY,
+    SUMMARY_FALLBACK,
+    SUMMARY_MAX_INPUT_TOKENS,
+    SUMMARY_OUTPUT_TOKENS,
+)
+from src.services.llm_rate_limiter import llm_rate_limiter
+from src.services.llm_usage import LlmCallRecord, llm_usage
+from src.services.local_summarizer import summarize_locally
+from src.services.summary_chunker import (
+    chunk_text,
+    compact_code,
+    estimate_tokens,
+    summary_token_stats,
+)
+from src.utils.summary_cache import summary_cache
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +59,10 @@ class SummaryResult(BaseModel):
     field: SummaryField = Field(description="분류 카테고리")
 
 
+class SummaryOnlyResult(BaseModel):
+    summary: str = Field(description="500-520자 사이의 요약 내용")
+
+
 FIELD_OPTIONS = ", ".join([field.value for field in SummaryField])
 
 SYSTEM_PROMPT = f"""
@@ -53,32 +88,466 @@ SYSTEM_PROMPT = f"""
 - 요약은 내용에만 집중하고 작성자에 대한 언급은 모두 제거하세요
 """
 
+# 분류를 로컬 분류기(field_classifier)가 맡을 때 쓰는 요약 전용 프롬프트입니다.
+SUMMARY_ONLY_SYSTEM_PROMPT = """
+당신은 한국어 요약을 생성하는 AI입니다.
+
+다음 형식의 JSON만 반환하세요:
+{{
+  "summary": "요약 내용"
+}}
+
+내부 지침 (출력에 포함하지 마세요):
+- 무조건 500-520자 사이의 요약 작성
+- 500자 이하의 글이거나 500자 이상이라도 요약이 힘든 경우 500자 이하로 요약 작성
+- 요약에 작성자의 이름이나 자기 소개를 절대 포함하지 마세요 (예: "저는", "필자는" 등)
+- 요약은 내용에만 집중하고 작성자에 대한 언급은 모두 제거하세요
+"""
+
+
+SUMMARY_BACKENDS = ("llm", "local")
+SUMMARY_FALLBACKS = ("local", "none")
+FIELD_SOURCES = ("llm", "local")
+
+
+class SummaryPolicy:
+    """
+    콘텐츠마다 LLM과 로컬 요약기(TextRank) 중 무엇으로 요약할지 정합니다.
+
+    Attributes:
+        backend: "llm"이면 LLM으로, "local"이면 모든 콘텐츠를 로컬 요약기로 요약합니다.
+        local_max_chars: 공백을 정리한 본문이 이 글자 수 이하이면 로컬 요약기를 씁니다 (0이면 사용 안 함).
+        fallback: LLM 요약이 실패했을 때 "local"이면 로컬 요약으로 대체하고, "none"이면 None을 반환합니다.
+        field_source: "llm"이면 요약과 함께 분류도 요청하고, "local"이면 요약만 요청하며
+            결과에서 field를 빼고 로컬 분류기(field_classifier)에 맡깁니다.
+    """
+
+    def __init__(
+        self,
+        backend: str = SUMMARY_BACKEND,
+        local_max_chars: int = LOCAL_SUMMARY_MAX_CHARS,
+        fallback: str = SUMMARY_FALLBACK,
+        field_source: str = FIELD_SOURCE,
+    ):
+        if backend not in SUMMARY_BACKENDS:
+            raise ValueError(f"알 수 없는 요약 방식입니다: {backend}")
+        if fallback not in SUMMARY_FALLBACKS:
+            raise ValueError(f"알 수 없는 요약 대체 방식입니다: {fallback}")
+        if field_source not in FIELD_SOURCES:
+            raise ValueError(f"알 수 없는 분류 방식입니다: {field_source}")
+        self.backend = backend
+        self.local_max_chars = local_max_chars
+        self.fallback = fallback
+        self.field_source = field_source
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def local_reason(self, content: str) -> Optional[str]:
+        """로컬 요약기를 써야 하면 그 이유("local_backend", "short_content")를, 아니면 None을 반환합니다."""
+        if self.backend == "local":
+            return "local_backend"
+        if (
+            self.local_max_chars
+            and len(" ".join(content.split())) <= self.local_max_chars
+        ):
+            return "short_content"
+        return None
+
+    def system_prompt(self) -> str:
+        if self.field_source == "local":
+            return SUMMARY_ONLY_SYSTEM_PROMPT
+        return SYSTEM_PROMPT
+
+    def record(self, route: str) -> None:
+        with self._lock:
+            self._counts[route] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """요약 경로(llm, cache, short_content, local_backend, fallback, failed)별 콘텐츠 수를 반환합니다."""
+        with self._lock:
+            return dict(self._counts)
+
+
+summary_policy = SummaryPolicy()
+
+HUMAN_PROMPT = "다음 내용을 요약해주세요:\n{content}"
+
+CHUNK_SYSTEM_PROMPT = """
+당신은 긴 기술 블로그 글의 일부를 요약하는 AI입니다.
+주어진 부분의 핵심 내용(문제, 접근 방법, 결과)을 한국어 평문 3-5문장으로 요약하세요.
+코드는 무엇을 하는지만 설명하고 그대로 옮기지 마세요.
+"""
+
+CHUNK_HUMAN_PROMPT = "다음은 글의 {index}/{total}번째 부분입니다:\n{content}"
+
 
 def get_chat_client():
+    # 재시도(연결 오류 포함)는 llm_rate_limiter가 한도 헤더와 함께 처리하므로 SDK 자체 재시도는 끕니다.
     return ChatOpenAI(
         model_name=OPENAI_MODEL_NAME,
         temperature=OPENAI_TEMPERATURE,
         openai_api_key=OPENAI_API_KEY,
+        max_retries=0,
+        include_response_headers=True,
+    )
+
+
+def _llm_call(client, parser, kind: str) -> RunnableLambda:
+    """
+    client를 llm_rate_limiter를 거쳐 호출하고 응답을 parser로 파싱하는 Runnable을 만듭니다.
+
+    호출마다 사용 토큰, 지연 시간, 재시도 횟수, 파싱 결과를 llm_usage에 기록합니다.
+    포스트의 회사와 URL은 실행 설정의 metadata("company", "url")에서 가져옵니다.
+    """
+
+    def invoke(prompt_value: PromptValue, config: RunnableConfig) -> Any:
+        messages = prompt_value.to_messages()
+        estimated = (
+            sum(estimate_tokens(str(message.content)) for message in messages)
+            + SUMMARY_OUTPUT_TOKENS
+        )
+        attempts: List[float] = []
+
+        def send() -> BaseMessage:
+            sent = time.perf_counter()
+            try:
+                return client.invoke(messages)
+            finally:
+                attempts.append(time.perf_counter() - sent)
+
+        started = time.perf_counter()
+        message: Optional[BaseMessage] = None
+        outcome = "error"
+        try:
+            message = llm_rate_limiter.call(send, estimated)
+            usage = getattr(message, "usage_metadata", None) or {}
+            llm_rate_limiter.observe(
+                message.response_metadata.get("headers"),
+                estimated,
+                usage.get("total_tokens"),
+            )
+            outcome = "parse_error"
+            result = parser.invoke(message)
+            outcome = "ok"
+            return result
+        finally:
+            _record_call(kind, config, message, attempts, started, outcome)
+
+    return RunnableLambda(invoke)
+
+
+def _record_call(
+    kind: str,
+    config: Optional[RunnableConfig],
+    message: Optional[BaseMessage],
+    attempts: List[float],
+    started: float,
+    outcome: str,
+) -> None:
+    source = (config or {}).get("metadata") or {}
+    usage = (getattr(message, "usage_metadata", None) or {}) if message else {}
+    model = message.response_metadata.get("model_name") if message else None
+    llm_usage.record(
+        LlmCallRecord(
+            kind=kind,
+            model=model or OPENAI_MODEL_NAME,
+            company=source.get("company"),
+            url=source.get("url"),
+            prompt_tokens=usage.get("input_tokens", 0),
+            completion_tokens=usage.get("output_tokens", 0),
+            latency=attempts[-1] if attempts else 0.0,
+            elapsed=time.perf_counter() - started,
+            attempts=len(attempts),
+            outcome=outcome,
+        )
     )
 
 
-def summarize_content(content: str) -> Dict[str, str]:
-    parser = PydanticOutputParser(pydantic_object=SummaryResult)
+_chains: Dict[str, Any] = {}
+_chain_lock = threading.Lock()
+
+
+def _get_shared_client():
+    # _chain_lock 안에서만 호출됩니다.
+    if "client" not in _chains:
+        _chains["client"] = get_chat_client()
+    return _chains["client"]
+
+
+def get_summary_chain():
+    """
+    프롬프트, 채팅 클라이언트, 출력 파서로 이루어진 요약 체인을 한 번만 만들어 재사용합니다.
+
+    summary_policy.field_source가 "local"이면 분류 없이 요약만 요청하는 체인을 반환합니다.
+    """
+    summary_only = summary_policy.field_source == "local"
+    name = "summary_only" if summary_only else "summary"
+    with _chain_lock:
+        if name not in _chains:
+            parser = PydanticOutputParser(
+                pydantic_object=SummaryOnlyResult if summary_only else SummaryResult
+            )
+            prompt = ChatPromptTemplate.from_messages(
+                [("system", summary_policy.system_prompt()), ("human", HUMAN_PROMPT)]
+            )
+            _chains[name] = prompt | _llm_call(_get_shared_client(), parser, "summary")
+        return _chains[name]
+
+
+def get_chunk_chain():
+    """긴 글의 조각을 평문으로 요약하는 체인을 한 번만 만들어 재사용합니다."""
+    with _chain_lock:
+        if "chunk" not in _chains:
+            prompt = ChatPromptTemplate.from_messages(
+                [("system", CHUNK_SYSTEM_PROMPT), ("human", CHUNK_HUMAN_PROMPT)]
+            )
+            _chains["chunk"] = prompt | _llm_call(
+                _get_shared_client(), StrOutputParser(), "chunk"
+            )
+        return _chains["chunk"]
+
+
+def summary_cache_key(content: str) -> str:
+    """
+    요약 캐시 키를 만듭니다.
+
+    공백을 정규화한 본문과 프롬프트, 모델 이름, 온도를 함께 해시하므로
+    프롬프트나 모델 설정이 바뀌면 기존 캐시 항목은 자동으로 쓰이지 않습니다.
+    """
+    normalized = " ".join(unicodedata.normalize("NFC", content).split())
+    digest = hashlib.sha256()
+    for part in (
+        summary_policy.system_prompt(),
+        HUMAN_PROMPT,
+        CHUNK_SYSTEM_PROMPT,
+        CHUNK_HUMAN_PROMPT,
+        OPENAI_MODEL_NAME,
+        str(OPENAI_TEMPERATURE),
+        str(SUMMARY_MAX_INPUT_TOKENS),
+        normalized,
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _batch_configs(
+    sources: Sequence[Optional[Mapping[str, str]]], max_concurrency: int
+) -> List[RunnableConfig]:
+    """요청마다 포스트 정보(company, url)를 metadata로 담은 batch 설정을 만듭니다."""
+    return [
+        {"max_concurrency": max(1, max_concurrency), "metadata": dict(source or {})}
+        for source in sources
+    ]
+
+
+def _condense_contents(
+    contents: List[str],
+    max_concurrency: int,
+    sources: Sequence[Optional[Mapping[str, str]]],
+) -> List[Union[str, Exception]]:
+    """
+    최종 요약에 넣을 입력을 준비합니다 (map 단계).
+
+    토큰 예산(SUMMARY_MAX_INPUT_TOKENS) 안의 본문은 그대로 사용합니다. 예산을 넘으면
+    긴 코드 목록을 줄이고, 그래도 넘으면 섹션 경계에서 조각으로 나눠 모든 포스트의
+    조각을 한 번에 동시에 요약한 뒤 조각 요약을 이어 붙입니다.
+
+    Args:
+        contents: 요약할 콘텐츠 목록.
+        max_concurrency: 동시에 보낼 최대 조각 요약 요청 수.
+        sources: contents와 같은 순서의 포스트 정보 (사용량 기록용).
 
-    prompt = ChatPromptTemplate.from_messages(
-        [("system", SYSTEM_PROMPT), ("human", "다음 내용을 요약해주세요:\n{content}")]
+    Returns:
+        contents와 같은 순서의 최종 요약 입력. 조각 요약이 실패한 포스트는 그 예외.
+    """
+    condensed: List[Union[str, Exception]] = []
+    chunk_owners: List[int] = []
+    chunk_inputs: List[Dict[str, Any]] = []
+    input_tokens: List[int] = []
+    chunk_tokens: Dict[int, int] = defaultdict(int)
+
+    for index, content in enumerate(contents):
+        tokens = estimate_tokens(content)
+        input_tokens.append(tokens)
+        if tokens <= SUMMARY_MAX_INPUT_TOKENS:
+            condensed.append(content)
+            continue
+
+        compacted = compact_code(content)
+        if estimate_tokens(compacted) <= SUMMARY_MAX_INPUT_TOKENS:
+            condensed.append(compacted)
+            continue
+
+        chunks = chunk_text(compacted, SUMMARY_CHUNK_TOKENS)
+        logger.info(
+            f"[{index + 1}/{len(contents)}] 본문이 길어 {len(chunks)}개 조각으로 나눠 요약합니다. "
+            f"(추정 {tokens} 토큰)"
+        )
+        condensed.append("")
+        for chunk_index, chunk in enumerate(chunks, 1):
+            chunk_owners.append(index)
+            chunk_inputs.append(
+                {"index": chunk_index, "total": len(chunks), "content": chunk}
+            )
+
+    if chunk_inputs:
+        try:
+            chunk_results = get_chunk_chain().batch(
+                chunk_inputs,
+                config=_batch_configs(
+                    [sources[owner] for owner in chunk_owners], max_concurrency
+                ),
+                return_exceptions=True,
+            )
+        except Exception as e:
+            chunk_results = [e] * len(chunk_inputs)
+
+        for owner, chunk_input, result in zip(
+            chunk_owners, chunk_inputs, chunk_results
+        ):
+            chunk_tokens[owner] += estimate_tokens(chunk_input["content"])
+            if isinstance(condensed[owner], Exception):
+                continue
+            if isinstance(result, Exception):
+                condensed[owner] = result
+            else:
+                condensed[owner] = f"{condensed[owner]}\n\n{result}".strip()
+
+    chunk_counts = Counter(chunk_owners)
+    for index, text in enumerate(condensed):
+        if isinstance(text, Exception):
+            continue
+        summary_token_stats.record(
+            input_tokens[index],
+            estimate_tokens(text),
+            chunk_tokens[index],
+            chunk_counts.get(index, 0),
+        )
+    return condensed
+
+
+def summarize_content(
+    content: str, source: Optional[Mapping[str, str]] = None
+) -> Optional[Dict[str, str]]:
+    return summarize_contents([content], sources=[source])[0]
+
+
+def summarize_contents(
+    contents: List[str],
+    max_concurrency: int = SUMMARY_CONCURRENCY,
+    sources: Optional[Sequence[Optional[Mapping[str, str]]]] = None,
+) -> List[Optional[Dict[str, str]]]:
+    """
+    여러 콘텐츠를 동시에 요약합니다.
+
+    summary_policy에 따라 짧은 콘텐츠(또는 전체)는 LLM 없이 로컬 요약기로 요약하고,
+    요약 캐시에 있는 콘텐츠는 바로 결과를 사용하며, 나머지만 체인의 batch 인터페이스로
+    최대 max_concurrency개씩 동시에 요청합니다. 토큰 예산을 넘는 긴 글은 조각별로 먼저
+    요약한 뒤(map) 그 요약들로 최종 요약을 만듭니다(reduce). 요청은 llm_rate_limiter의
+    RPM/TPM 한도 안에서 보내며, 한도 초과로 실패한 요청은 기다렸다가 다시 보냅니다.
+
+    Args:
+        contents: 요약할 콘텐츠 목록.
+        max_concurrency: 동시에 보낼 최대 요약 요청 수.
+        sources: contents와 같은 순서의 포스트 정보({"company": ..., "url": ...}).
+            LLM 호출 사용량을 회사별, 포스트별로 집계하는 데 씁니다.
+
+    Returns:
+        contents와 같은 순서의 요약 결과(summary, field) 목록. field_source가 "local"이면
+        field 없이 summary만 담깁니다. 재시도 후에도 LLM으로
+        요약하지 못한 콘텐츠는 로컬 요약으로 대체하거나(fallback="local") None이 되며,
+        다른 콘텐츠의 결과에는 영향을 주지 않습니다.
+    """
+    if not contents:
+        return []
+    if sources is None:
+        sources = [None] * len(contents)
+
+    summaries: List[Optional[Dict[str, str]]] = [None] * len(contents)
+    keys: Dict[int, str] = {}
+    pending: List[int] = []
+    for index, content in enumerate(contents):
+        reason = summary_policy.local_reason(content)
+        if reason:
+            summaries[index] = summarize_locally(content)
+            summary_policy.record(reason)
+            continue
+        keys[index] = summary_cache_key(content)
+        summaries[index] = summary_cache.get(keys[index])
+        if summaries[index] is None:
+            pending.append(index)
+        else:
+            summary_policy.record("cache")
+    logger.info(
+        f"콘텐츠 {len(contents)}개 일괄 요약 시작 "
+        f"(로컬 요약: {len(contents) - len(keys)}개, "
+        f"캐시 적중: {len(keys) - len(pending)}개, 동시 요청: {max_concurrency})"
     )
+    if not pending:
+        return _apply_field_source(summaries)
+
+    condensed = _condense_contents(
+        [contents[index] for index in pending],
+        max_concurrency,
+        [sources[index] for index in pending],
+    )
+    ready = [
+        (index, text)
+        for index, text in zip(pending, condensed)
+        if not isinstance(text, Exception)
+    ]
+    results: Dict[int, Any] = {
+        index: text
+        for index, text in zip(pending, condensed)
+        if isinstance(text, Exception)
+    }
+    if ready:
+        try:
+            batch_results = get_summary_chain().batch(
+                [{"content": text} for _, text in ready],
+                config=_batch_configs(
+                    [sources[index] for index, _ in ready], max_concurrency
+                ),
+                return_exceptions=True,
+            )
+        except Exception as e:
+            batch_results = [e] * len(ready)
+        results.update(
+            (index, result) for (index, _), result in zip(ready, batch_results)
+        )
+
+    failed = 0
+    for index in pending:
+        result = results[index]
+        if isinstance(result, Exception) and summary_policy.fallback == "local":
+            logger.warning(
+                f"[{index + 1}/{len(contents)}] 요약 중 오류 발생, 로컬 요약으로 대체합니다: {str(result)}"
+            )
+            summaries[index] = summarize_locally(contents[index])
+            summary_policy.record("fallback")
+            failed += 1
+        elif isinstance(result, Exception):
+            logger.error(
+                f"[{index + 1}/{len(contents)}] 요약 중 오류 발생 (저장하지 않고 다음 실행에서 다시 시도): {str(result)}"
+            )
+            summary_policy.record("failed")
+            failed += 1
+        else:
+            summaries[index] = result.dict()
+            summary_cache.put(keys[index], summaries[index])
+            summary_policy.record("llm")
+    logger.info(f"일괄 요약 완료: {len(pending) - failed}개 성공, {failed}개 실패")
+    return _apply_field_source(summaries)
+
 
-    chain = prompt | get_chat_client() | parser
-
-    try:
-        logger.info("콘텐츠 요약 시작")
-        result = chain.invoke({"content": content})
-        logger.info("콘텐츠 요약 완료")
-        return result.dict()
-    except Exception as e:
-        logger.error(f"요약 중 오류 발생: {str(e)}")
-        return {
-            "summary": "요약을 생성하는 중 오류가 발생했습니다. 나중에 다시 시도해주세요.",
-            "field": SummaryField.ETC.value,
-        }
+def _apply_field_source(
+    summaries: List[Optional[Dict[str, str]]]
+) -> List[Optional[Dict[str, str]]]:
+    """분류를 로컬 분류기가 맡으면 결과에서 field를 뺍니다 (로컬 요약기의 키워드 분류 포함)."""
+    if summary_policy.field_source != "local":
+        return summaries
+    return [
+        {"summary": summary["summary"]} if summary is not None else None
+        for summary in summaries
+    ]
@@ -0,0 +1,187 @@
+import math
+import re
+import threading
+from typing import Dict, List
+
+# 한글/한자/가나는 대부분 글자당 1토큰 이상으로 인코딩됩니다.
+_CJK_PATTERN = re.compile(r"[ᄀ-ᇿ぀-ヿ㄰-㆏一-鿿가-힯]")
+_ALNUM_PATTERN = re.compile(r"[A-Za-z0-9_]")
+_SYMBOL_PATTERN = re.compile(r"[^\sA-Za-z0-9_ᄀ-ᇿ぀-ヿ㄰-㆏一-鿿가-힯]")
+_CODE_SYMBOL_PATTERN = re.compile(r"[{}()\[\];=<>]")
+_SENTENCE_END_PATTERN = re.compile(r"[.!?。:]$|[다요죠음]\.?$")
+
+# 연속된 코드 줄이 이보다 길면 앞부분만 남깁니다.
+CODE_RUN_MIN_LINES = 8
+CODE_RUN_KEEP_LINES = 5
+SECTION_TITLE_MAX_LENGTH = 40
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    네트워크 없이 텍스트의 토큰 수를 추정합니다.
+
+    한글/CJK 글자는 글자당 1토큰, 영문/숫자는 4글자당 1토큰, 기호는 1토큰으로 계산합니다.
+    OpenAI 토크나이저보다 약간 크게 추정하므로 예산 판단에 안전한 쪽입니다.
+    """
+    if not text:
+        return 0
+    cjk = len(_CJK_PATTERN.findall(text))
+    alnum = len(_ALNUM_PATTERN.findall(text))
+    symbols = len(_SYMBOL_PATTERN.findall(text))
+    return cjk + math.ceil(alnum / 4) + symbols
+
+
+def _is_code_line(line: str) -> bool:
+    stripped = line.strip()
+    if not stripped:
+        return False
+    if stripped.startswith(("#include", "import ", "from ", "def ", "class ", "//")):
+        return True
+    return len(_CODE_SYMBOL_PATTERN.findall(stripped)) / len(stripped) >= 0.08
+
+
+def compact_code(text: str) -> str:
+    """
+    긴 코드 목록을 앞부분 몇 줄과 생략 표시로 줄입니다.
+
+    연속해서 CODE_RUN_MIN_LINES줄 이상 코드로 보이는 줄이 나오면
+    앞의 CODE_RUN_KEEP_LINES줄만 남기고 나머지는 "(코드 N줄 생략)"으로 바꿉니다.
+    """
+    lines = text.split("\n")
+    compacted: List[str] = []
+    run: List[str] = []
+
+    def flush() -> None:
+        if len(run) >= CODE_RUN_MIN_LINES:
+            compacted.extend(run[:CODE_RUN_KEEP_LINES])
+            compacted.append(f"(코드 {len(run) - CODE_RUN_KEEP_LINES}줄 생략)")
+        else:
+            compacted.extend(run)
+        run.clear()
+
+    for line in lines:
+        if _is_code_line(line):
+            run.append(line)
+        else:
+            flush()
+            compacted.append(line)
+    flush()
+    return "\n".join(compacted)
+
+
+def _is_section_title(line: str) -> bool:
+    stripped = line.strip()
+    return (
+        0 < len(stripped) <= SECTION_TITLE_MAX_LENGTH
+        and not _SENTENCE_END_PATTERN.search(stripped)
+        and not _is_code_line(stripped)
+    )
+
+
+def split_sections(text: str) -> List[str]:
+    """
+    본문을 섹션 단위로 나눕니다.
+
+    추출된 본문은 텍스트 노드마다 한 줄이므로, 문장으로 끝나지 않는 짧은 줄(소제목)을
+    섹션의 시작으로 봅니다.
+    """
+    sections: List[List[str]] = [[]]
+    for line in text.split("\n"):
+        if _is_section_title(line) and sections[-1]:
+            sections.append([])
+        sections[-1].append(line)
+    return ["\n".join(lines) for lines in sections if lines]
+
+
+def chunk_text(text: str, max_tokens: int) -> List[str]:
+    """
+    본문을 섹션 경계에서 최대 max_tokens 토큰의 조각으로 나눕니다.
+
+    이어지는 섹션은 예산 안에서 한 조각으로 묶고, 한 섹션이 예산보다 크면
+    줄 단위로 나눕니다.
+    """
+    pieces: List[str] = []
+    for section in split_sections(text):
+        if estimate_tokens(section) <= max_tokens:
+            pieces.append(section)
+            continue
+        pieces.extend(section.split("\n"))
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for piece in pieces:
+        tokens = estimate_tokens(piece)
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append("\n".join(current))
+            current, current_tokens = [], 0
+        if tokens > max_tokens:
+            # 한 줄이 예산보다 크면 글자 수 비율로 자릅니다.
+            step = max(1, len(piece) * max_tokens // tokens)
+            chunks.extend(piece[i : i + step] for i in range(0, len(piece), step))
+            continue
+        current.append(piece)
+        current_tokens += tokens
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+class SummaryTokenStats:
+    """
+    요약 입력 토큰(추정치) 통계입니다.
+
+    final_tokens는 최종 요약 호출에 들어간 토큰, sent_tokens는 조각 요약을 포함해
+    모델에 보낸 전체 토큰입니다. 조각 요약은 원문을 한 번 더 보내므로 sent_tokens가
+    원문보다 클 수 있고, 이때 tokens_saved는 음수가 됩니다.
+    """
+
+    def __init__(self):
+        self.posts = 0
+        self.chunked_posts = 0
+        self.chunks = 0
+        self.input_tokens = 0
+        self.final_tokens = 0
+        self.sent_tokens = 0
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        input_tokens: int,
+        final_tokens: int,
+        chunk_tokens: int = 0,
+        chunks: int = 0,
+    ) -> None:
+        """
+        포스트 하나의 요약 입력을 기록합니다.
+
+        Args:
+            input_tokens: 원래 본문의 토큰 수.
+            final_tokens: 최종 요약 호출에 보낸 본문 토큰 수.
+            chunk_tokens: 조각 요약 호출에 보낸 본문 토큰 수의 합.
+            chunks: 나눈 조각 수. 0이면 나누지 않은 포스트입니다.
+        """
+        with self._lock:
+            self.posts += 1
+            self.input_tokens += input_tokens
+            self.final_tokens += final_tokens
+            self.sent_tokens += final_tokens + chunk_tokens
+            if chunks:
+                self.chunked_posts += 1
+                self.chunks += chunks
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "posts": self.posts,
+                "chunked_posts": self.chunked_posts,
+                "chunks": self.chunks,
+                "input_tokens": self.input_tokens,
+                "final_tokens": self.final_tokens,
+                "sent_tokens": self.sent_tokens,
+                "final_tokens_saved": self.input_tokens - self.final_tokens,
+                "tokens_saved": self.input_tokens - self.sent_tokens,
+            }
+
+
+summary_token_stats = SummaryTokenStats()
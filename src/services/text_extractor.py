@@ -0,0 +1,121 @@
+from typing import Callable, Dict, List
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+# BeautifulSoup(lxml)의 get_text가 건너뛰는 문자열을 담는 태그입니다.
+# script/style은 decompose로 제거되고, rt/rp/template 내부 문자열은
+# NavigableString이 아닌 별도 타입이라 get_text 결과에 포함되지 않습니다.
+_EXCLUDED_TAGS = frozenset({"script", "style", "rt", "rp", "template"})
+
+
+def extract_text_bs4(html_content: str) -> str:
+    """
+    BeautifulSoup으로 HTML에서 스크립트와 스타일을 제거하고 순수 텍스트를 추출합니다.
+
+    Args:
+        html_content: 정제할 HTML 콘텐츠 문자열.
+
+    Returns:
+        추출된 텍스트. 내용이 없으면 빈 문자열.
+    """
+    if not html_content:
+        return ""
+
+    soup = BeautifulSoup(html_content, "lxml")
+
+    for script_or_style in soup(["script", "style"]):
+        script_or_style.decompose()
+
+    return soup.get_text(separator="\n", strip=True)
+
+
+def extract_text_lxml(html_content: str) -> str:
+    """
+    lxml 파서 이벤트에서 바로 텍스트를 모아 extract_text_bs4와 같은 결과를 만듭니다.
+
+    BeautifulSoup과 같은 lxml 파서를 같은 방식(문서 전체를 한 번에 feed)으로 사용하되,
+    트리 객체를 만들지 않고 문자열 경계만 재현하므로 결과는 같고 훨씬 빠릅니다.
+
+    Args:
+        html_content: 정제할 HTML 콘텐츠 문자열.
+
+    Returns:
+        추출된 텍스트. 내용이 없으면 빈 문자열.
+    """
+    if not html_content:
+        return ""
+
+    collector = _TextCollector()
+    parser = etree.HTMLParser(target=collector, strip_cdata=False, recover=True)
+    try:
+        parser.feed(html_content)
+        parser.close()
+    except etree.XMLSyntaxError:
+        pass
+    collector.flush()
+    return "\n".join(collector.parts)
+
+
+class _TextCollector:
+    """
+    lxml 파서 타깃으로 동작하며 BeautifulSoup이 만드는 문자열 단위로 텍스트를 모읍니다.
+
+    BeautifulSoup은 시작/종료 태그, 주석, PI, doctype 이벤트마다 모아 둔 문자열을
+    끊으므로 같은 지점에서 끊습니다. 열린 태그 스택도 BeautifulSoup과 같은 규칙으로
+    관리하여, 제외 태그가 열려 있는 동안의 문자열은 버립니다.
+    """
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self._buffer: List[str] = []
+        self._open_tags: List[str] = []
+        self._excluded_positions: List[int] = []
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        text = "".join(self._buffer).strip()
+        self._buffer = []
+        if text and not self._excluded_positions:
+            self.parts.append(text)
+
+    def start(self, tag, attrib) -> None:
+        self.flush()
+        if tag in _EXCLUDED_TAGS:
+            self._excluded_positions.append(len(self._open_tags))
+        self._open_tags.append(tag)
+
+    def end(self, tag) -> None:
+        self.flush()
+        # 가장 최근에 열린 같은 이름의 태그까지 모두 닫습니다. 없으면 무시합니다.
+        for position in range(len(self._open_tags) - 1, -1, -1):
+            if self._open_tags[position] == tag:
+                del self._open_tags[position:]
+                while (
+                    self._excluded_positions
+                    and self._excluded_positions[-1] >= position
+                ):
+                    self._excluded_positions.pop()
+                break
+
+    def data(self, content: str) -> None:
+        self._buffer.append(content)
+
+    def comment(self, content: str) -> None:
+        self.flush()
+
+    def pi(self, target: str, data: str = None) -> None:
+        self.flush()
+
+    def doctype(self, name: str, pubid: str, system: str) -> None:
+        self.flush()
+
+    def close(self) -> None:
+        self.flush()
+
+
+TEXT_EXTRACTION_BACKENDS: Dict[str, Callable[[str], str]] = {
+    "lxml": extract_text_lxml,
+    "bs4": extract_text_bs4,
+}
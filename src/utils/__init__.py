@@ -1,4 +1,15 @@
+from src.utils.http_cache import http_cache
+from src.utils.http_client import http_client
+from src.utils.http_retry import http_guard
 from src.utils.s3_uploader import s3_uploader
 from src.utils.ssh_tunnel import db_tunnel
+from src.utils.summary_cache import summary_cache
 
-__all__ = ["db_tunnel", "s3_uploader"]
+__all__ = [
+    "db_tunnel",
+    "http_cache",
+    "http_client",
+    "http_guard",
+    "s3_uploader",
+    "summary_cache",
+]
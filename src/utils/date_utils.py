@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+
+def to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    datetime을 비교 가능한 naive UTC datetime으로 변환합니다.
+
+    시간대 정보가 있는 값은 UTC로 변환한 뒤 tzinfo를 제거하고,
+    시간대 정보가 없는 값은 그대로 반환합니다.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def watermark_time(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    증분 크롤링 기준점과 비교할 수 있는 naive UTC datetime으로 변환합니다.
+
+    시간대 정보가 없는 값("%Y-%m-%d %H:%M:%S" 형식 등)은 피드의 시간대를 알 수 없어
+    UTC로 볼 수 없으므로 None을 반환합니다.
+    """
+    if value is None or value.tzinfo is None:
+        return None
+    return to_naive_utc(value)
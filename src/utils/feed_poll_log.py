@@ -0,0 +1,80 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from src.config.cache_config import FEED_POLL_LOG_PATH
+
+logger = logging.getLogger(__name__)
+
+
+class FeedPollLog:
+    """
+    피드별 마지막 크롤링 시각을 JSON 파일로 보관합니다.
+
+    레지스트리의 poll_interval보다 최근에 크롤링한 피드는 다음 실행에서 건너뜁니다.
+    파일이 없거나 손상되면 모든 피드를 크롤링 대상으로 보므로 언제든 지워도 됩니다.
+    """
+
+    def __init__(self, path: str = FEED_POLL_LOG_PATH):
+        self.path = path
+        self._polled_at: Optional[Dict[str, float]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def is_due(
+        self, feed_url: str, poll_interval: int, now: Optional[float] = None
+    ) -> bool:
+        """마지막 크롤링 후 poll_interval(초)이 지났는지 확인합니다."""
+        if poll_interval <= 0:
+            return True
+        with self._lock:
+            polled_at = self._load().get(feed_url)
+        if polled_at is None:
+            return True
+        return (now if now is not None else time.time()) - polled_at >= poll_interval
+
+    def mark(self, feed_url: str, now: Optional[float] = None) -> None:
+        """feed_url을 지금 크롤링한 것으로 기록합니다."""
+        with self._lock:
+            self._load()[feed_url] = now if now is not None else time.time()
+            self._dirty = True
+
+    def save(self) -> None:
+        """바뀐 기록이 있으면 파일에 기록합니다."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                temp_path = f"{self.path}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._polled_at, f, sort_keys=True)
+                os.replace(temp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"피드 크롤링 기록 저장 실패: {self.path} - {e}")
+
+    def _load(self) -> Dict[str, float]:
+        if self._polled_at is not None:
+            return self._polled_at
+
+        self._polled_at = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._polled_at = {url: float(value) for url, value in data.items()}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(
+                f"피드 크롤링 기록을 읽지 못해 새로 만듭니다: {self.path} - {e}"
+            )
+        return self._polled_at
+
+
+feed_poll_log = FeedPollLog()
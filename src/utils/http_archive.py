@@ -0,0 +1,203 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from io import BytesIO
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FILENAME = "http_archive.sqlite3"
+
+# 본문은 압축을 푼 상태로 저장하므로 전송 관련 헤더는 기록하지 않습니다.
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+class ArchiveMissError(requests.RequestException):
+    """재생 모드에서 아카이브에 기록되지 않은 요청을 보냈을 때 발생하는 예외입니다."""
+
+
+class HttpArchive:
+    """
+    HTTP 응답을 기록하고 재생하는 아카이브입니다.
+
+    기록 모드에서는 실제 요청의 상태 코드, 헤더, zlib으로 압축한 본문, 응답 시간을
+    디렉토리 안의 SQLite 파일에 저장합니다. 재생 모드에서는 네트워크 없이 저장된 응답을
+    돌려주며, 아카이브에 없는 요청은 재시도하지 않고 ArchiveMissError로 실패시킵니다.
+
+    Attributes:
+        directory: 아카이브 디렉토리.
+        mode: "record" 또는 "replay".
+        latency_scale: 재생할 때 기록된 응답 시간에 곱할 배율 (0이면 지연 없음).
+    """
+
+    RECORD = "record"
+    REPLAY = "replay"
+
+    def __init__(self, directory: str, mode: str, latency_scale: float = 0.0):
+        if mode not in (self.RECORD, self.REPLAY):
+            raise ValueError(f"알 수 없는 아카이브 모드입니다: {mode}")
+        self.directory = directory
+        self.mode = mode
+        self.latency_scale = max(0.0, latency_scale)
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = 0
+        self._lock = threading.Lock()
+
+        path = os.path.join(directory, ARCHIVE_FILENAME)
+        if mode == self.REPLAY and not os.path.exists(path):
+            raise FileNotFoundError(f"HTTP 아카이브가 없습니다: {path}")
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                elapsed REAL NOT NULL
+            )
+            """
+        )
+
+    def adapter(self, inner: Optional[BaseAdapter] = None) -> BaseAdapter:
+        """
+        세션에 마운트할 어댑터를 반환합니다.
+
+        Args:
+            inner: 기록 모드에서 실제 요청을 보낼 어댑터. None이면 기본 HTTPAdapter.
+        """
+        if self.mode == self.RECORD:
+            return _RecordingAdapter(self, inner or requests.adapters.HTTPAdapter())
+        return _ReplayAdapter(self)
+
+    def record(
+        self,
+        request: requests.PreparedRequest,
+        response: requests.Response,
+        elapsed: float,
+    ) -> None:
+        """
+        응답을 아카이브에 기록합니다. 본문은 이미 읽혀 있어야 합니다.
+
+        Args:
+            request: 보낸 요청.
+            response: 받은 응답.
+            elapsed: 요청부터 본문을 다 읽을 때까지 걸린 시간(초).
+        """
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _DROPPED_HEADERS
+        }
+        row = (
+            _key(request),
+            response.url,
+            response.status_code,
+            json.dumps(headers, ensure_ascii=False),
+            zlib.compress(response.content or b""),
+            elapsed,
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)", row
+            )
+            self._conn.commit()
+            self.recorded += 1
+
+    def replay(self, request: requests.PreparedRequest) -> Optional[requests.Response]:
+        """기록된 응답을 Response로 만들어 반환합니다. 없으면 None을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, body, elapsed FROM responses WHERE key = ?",
+                (_key(request),),
+            ).fetchone()
+            if row is None:
+                self.missing += 1
+                return None
+            self.replayed += 1
+
+        url, status, headers, body, elapsed = row
+        if self.latency_scale:
+            time.sleep(elapsed * self.latency_scale)
+
+        content = zlib.decompress(body)
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = url
+        response.request = request
+        response.reason = "Replayed"
+        response.raw = BytesIO(content)
+        response.raw.seek(0, os.SEEK_END)
+        response._content = content
+        response._content_consumed = True
+        return response
+
+    def stats(self) -> Dict[str, int]:
+        """기록/재생/누락 응답 수를 반환합니다."""
+        with self._lock:
+            return {
+                "recorded": self.recorded,
+                "replayed": self.replayed,
+                "missing": self.missing,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _key(request: requests.PreparedRequest) -> str:
+    return f"{request.method} {request.url}"
+
+
+class _RecordingAdapter(BaseAdapter):
+    """실제 요청을 보내고 그 응답을 아카이브에 기록하는 어댑터입니다."""
+
+    def __init__(self, archive: HttpArchive, inner: BaseAdapter):
+        super().__init__()
+        self.archive = archive
+        self.inner = inner
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        response = self.inner.send(request, **kwargs)
+        # 스트리밍 요청이라도 기록을 위해 본문 전체를 읽어 둡니다.
+        response.content
+        self.archive.record(request, response, time.perf_counter() - started)
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+class _ReplayAdapter(BaseAdapter):
+    """네트워크 대신 아카이브에서 응답을 돌려주는 어댑터입니다."""
+
+    def __init__(self, archive: HttpArchive):
+        super().__init__()
+        self.archive = archive
+
+    def send(self, request, **kwargs):
+        response = self.archive.replay(request)
+        if response is None:
+            raise ArchiveMissError(
+                f"HTTP 아카이브에 없는 요청입니다: {request.url}", request=request
+            )
+        return response
+
+    def close(self):
+        pass
@@ -0,0 +1,288 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+import requests
+from requests import Session as RequestsSession
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from src.config.cache_config import (
+    HTTP_CACHE_MAX_BYTES,
+    HTTP_CACHE_PATH,
+    HTTP_CACHE_TTL,
+)
+from src.utils.http_client import http_client
+from src.utils.http_retry import http_guard
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """
+    캐시를 거친 HTTP 응답을 나타냅니다.
+
+    Attributes:
+        url: 최종 응답 URL.
+        status_code: 원본 응답의 상태 코드 (304로 재검증된 경우 200).
+        headers: 응답 헤더.
+        content: 응답 본문 바이트.
+        from_cache: 304 응답으로 캐시된 본문을 재사용했는지 여부.
+    """
+
+    url: str
+    status_code: int
+    headers: CaseInsensitiveDict = field(default_factory=CaseInsensitiveDict)
+    content: bytes = b""
+    from_cache: bool = False
+
+    @property
+    def text(self) -> str:
+        encoding = get_encoding_from_headers(self.headers) or "utf-8"
+        return self.content.decode(encoding, errors="replace")
+
+
+class HttpCache:
+    """
+    ETag/Last-Modified 기반 조건부 GET을 수행하는 디스크 HTTP 캐시입니다.
+
+    URL별로 검증자(ETag, Last-Modified)와 본문을 SQLite 파일에 저장하고,
+    다음 요청에서 If-None-Match/If-Modified-Since 헤더를 보냅니다.
+    304 응답을 받으면 저장된 본문을 그대로 반환합니다.
+    TTL이 지난 항목과 최대 크기를 넘는 오래된 항목은 자동으로 제거됩니다.
+    """
+
+    def __init__(
+        self,
+        path: str = HTTP_CACHE_PATH,
+        ttl: int = HTTP_CACHE_TTL,
+        max_bytes: int = HTTP_CACHE_MAX_BYTES,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        session: RequestsSession,
+        url: str,
+        timeout: float,
+        read_body: Optional[Callable[[requests.Response], bytes]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        cache_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        kind: str = "html",
+    ) -> CachedResponse:
+        """
+        조건부 GET으로 URL을 가져옵니다.
+
+        Args:
+            session: HTTP 요청에 사용할 requests.Session 객체.
+            url: 가져올 URL.
+            timeout: 요청 타임아웃(초).
+            read_body: 스트리밍 응답에서 본문을 읽는 함수. None이면 전체 본문을 읽습니다.
+            headers: 요청에 추가할 헤더.
+            cache_key: 캐시 키. None이면 URL을 사용합니다. 같은 URL이라도 본문 일부만
+                읽는 요청은 별도의 키로 저장해야 합니다.
+            deadline: time.monotonic() 기준 마감 시각. 재시도 대기가 이를 넘지 않습니다.
+            kind: 응답 종류 ("feed", "html", "image"). Accept 헤더를 정합니다.
+
+        Returns:
+            CachedResponse 객체.
+
+        Raises:
+            requests.RequestException: 요청이 실패하거나 오류 상태 코드를 받은 경우.
+        """
+        key = cache_key or url
+        request_headers = http_client.headers_for(kind)
+        request_headers.update(headers or {})
+        entry = self._lookup(key) if self.enabled else None
+        if entry:
+            if entry["etag"]:
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        with http_guard.get(
+            session,
+            url,
+            timeout=timeout,
+            headers=request_headers,
+            stream=True,
+            deadline=deadline,
+        ) as response:
+            if entry and response.status_code == 304:
+                self._touch(key)
+                with self._lock:
+                    self.hits += 1
+                    self.bytes_saved += entry["size"]
+                logger.debug(f"HTTP 캐시 적중 (304): {url}")
+                return CachedResponse(
+                    url=entry["final_url"] or url,
+                    status_code=200,
+                    headers=CaseInsensitiveDict(
+                        {"Content-Type": entry["content_type"] or ""}
+                    ),
+                    content=entry["body"],
+                    from_cache=True,
+                )
+
+            response.raise_for_status()
+            body = read_body(response) if read_body else response.content
+            http_client.record_transfer(response, body)
+            response_headers = CaseInsensitiveDict(response.headers)
+            final_url = response.url
+
+        with self._lock:
+            self.misses += 1
+        if self.enabled:
+            self._store(key, final_url, response_headers, body)
+
+        return CachedResponse(
+            url=final_url,
+            status_code=response.status_code,
+            headers=response_headers,
+            content=body,
+        )
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 적중/실패 통계를 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 3) if total else 0.0,
+            "bytes_saved": self.bytes_saved,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        """만료/초과 항목을 정리하고 캐시 파일을 닫습니다."""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._evict()
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    final_url TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_type TEXT,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._evict()
+        return self._conn
+
+    def _lookup(self, url: str) -> Optional[sqlite3.Row]:
+        try:
+            with self._lock:
+                return (
+                    self._connect()
+                    .execute(
+                        "SELECT * FROM http_cache WHERE url = ? AND stored_at >= ?",
+                        (url, time.time() - self.ttl),
+                    )
+                    .fetchone()
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP 캐시 조회 실패: {url} - {e}")
+            return None
+
+    def _touch(self, url: str) -> None:
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "UPDATE http_cache SET stored_at = ?, accessed_at = ? WHERE url = ?",
+                    (now, now, url),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP 캐시 갱신 실패: {url} - {e}")
+
+    def _store(
+        self, url: str, final_url: str, headers: CaseInsensitiveDict, body: bytes
+    ) -> None:
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        url,
+                        final_url,
+                        etag,
+                        last_modified,
+                        headers.get("Content-Type"),
+                        body,
+                        len(body),
+                        now,
+                        now,
+                    ),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP 캐시 저장 실패: {url} - {e}")
+
+    def _evict(self) -> None:
+        """TTL이 지난 항목을 지우고, 최대 크기를 넘으면 오래 사용하지 않은 항목부터 지웁니다."""
+        conn = self._conn
+        expired = conn.execute(
+            "DELETE FROM http_cache WHERE stored_at < ?", (time.time() - self.ttl,)
+        ).rowcount
+
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM http_cache"
+        ).fetchone()[0]
+        evicted = 0
+        if total > self.max_bytes:
+            rows = conn.execute(
+                "SELECT url, size FROM http_cache ORDER BY accessed_at"
+            ).fetchall()
+            for row in rows:
+                if total <= self.max_bytes:
+                    break
+                conn.execute("DELETE FROM http_cache WHERE url = ?", (row["url"],))
+                total -= row["size"]
+                evicted += 1
+        conn.commit()
+        self.evictions += expired + evicted
+
+
+http_cache = HttpCache()
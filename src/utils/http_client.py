@@ -0,0 +1,185 @@
+import logging
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.request import ACCEPT_ENCODING
+
+from src.config.http_config import (
+    ACCEPT_HEADERS,
+    DEFAULT_USER_AGENT,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+)
+from src.utils.http_archive import HttpArchive
+from src.utils.http_retry import http_guard
+
+logger = logging.getLogger(__name__)
+
+
+class _CountingAdapter(HTTPAdapter):
+    """요청 수와 새로 연 연결 수를 HttpClient에 기록하는 HTTPAdapter입니다."""
+
+    def __init__(self, client: "HttpClient", **kwargs):
+        self._client = client
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self._client),
+            "https": _counting_pool(HTTPSConnectionPool, self._client),
+        }
+
+    def send(self, request, **kwargs):
+        self._client._count("requests")
+        return super().send(request, **kwargs)
+
+
+def _counting_pool(base, client: "HttpClient"):
+    class CountingConnectionPool(base):
+        def _new_conn(self):
+            client._count("connections_opened")
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+
+class HttpClient:
+    """
+    프로젝트의 모든 HTTP 요청이 공유하는 연결 풀 기반 클라이언트입니다.
+
+    하나의 requests.Session에 호스트별 연결 풀을 두어 피드, 웹페이지, 썸네일 요청이
+    keep-alive 연결을 재사용합니다. gzip/deflate(brotli 설치 시 br 포함) 압축을 요청하고,
+    응답 종류에 맞는 Accept 헤더를 보냅니다. 요청은 http_guard의 재시도/회로 차단기를 거칩니다.
+
+    Attributes:
+        session: 공유 requests.Session 객체.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+    ):
+        self._counters: Dict[str, int] = {
+            "requests": 0,
+            "connections_opened": 0,
+            "bytes_on_wire": 0,
+            "bytes_decoded": 0,
+        }
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update(
+            {"User-Agent": DEFAULT_USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING}
+        )
+        self._adapter = _CountingAdapter(
+            self, pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.mount(self._adapter)
+
+    def mount(self, adapter: BaseAdapter) -> None:
+        """http/https 요청을 처리할 어댑터를 교체합니다."""
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def use_archive(self, archive: "HttpArchive") -> None:
+        """
+        HTTP 아카이브를 거쳐 요청하도록 설정합니다.
+
+        기록 모드에서는 연결 풀 어댑터로 실제 요청을 보내고 응답을 기록하며,
+        재생 모드에서는 네트워크 없이 아카이브의 응답을 돌려줍니다.
+        """
+        self.mount(archive.adapter(self._adapter))
+
+    @staticmethod
+    def headers_for(kind: str) -> Dict[str, str]:
+        """
+        응답 종류에 맞는 요청 헤더를 반환합니다.
+
+        Args:
+            kind: 응답 종류 ("feed", "html", "image").
+
+        Raises:
+            KeyError: 알 수 없는 종류인 경우.
+        """
+        return {"Accept": ACCEPT_HEADERS[kind]}
+
+    def get(
+        self,
+        url: str,
+        kind: str,
+        timeout: float,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        공유 세션으로 GET 요청을 보냅니다.
+
+        Args:
+            url: 요청할 URL.
+            kind: 응답 종류 ("feed", "html", "image"). Accept 헤더를 정합니다.
+            timeout: 요청 타임아웃(초).
+            headers: 추가 요청 헤더.
+            deadline: time.monotonic() 기준 마감 시각 (재시도 대기 제한).
+            **kwargs: session.request에 그대로 전달할 인자.
+
+        Returns:
+            requests.Response 객체. stream=True가 아니면 본문 전송량까지 기록됩니다.
+
+        Raises:
+            requests.RequestException: 요청이 실패한 경우.
+        """
+        request_headers = self.headers_for(kind)
+        request_headers.update(headers or {})
+        response = http_guard.get(
+            self.session,
+            url,
+            timeout=timeout,
+            headers=request_headers,
+            deadline=deadline,
+            **kwargs,
+        )
+        if not kwargs.get("stream"):
+            self.record_transfer(response, response.content)
+        return response
+
+    def record_transfer(self, response: requests.Response, body: bytes) -> None:
+        """
+        읽은 응답 본문의 전송량(압축된 바이트)과 디코딩된 크기를 기록합니다.
+
+        stream=True로 받은 응답은 본문을 읽은 쪽에서 호출해야 합니다.
+        """
+        raw = getattr(response, "raw", None)
+        try:
+            wire_bytes = raw.tell() if raw is not None else len(body)
+        except (AttributeError, OSError, ValueError):
+            wire_bytes = len(body)
+        with self._lock:
+            self._counters["bytes_on_wire"] += wire_bytes
+            self._counters["bytes_decoded"] += len(body)
+
+    def stats(self) -> Dict[str, float]:
+        """요청 수, 연결 생성/재사용 수, 전송량 통계를 반환합니다."""
+        with self._lock:
+            counters = dict(self._counters)
+        counters["connections_reused"] = max(
+            0, counters["requests"] - counters["connections_opened"]
+        )
+        counters["compression_ratio"] = (
+            round(counters["bytes_on_wire"] / counters["bytes_decoded"], 3)
+            if counters["bytes_decoded"]
+            else 0.0
+        )
+        return counters
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+
+http_client = HttpClient()
@@ -0,0 +1,331 @@
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from src.config.http_config import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_TIMEOUT,
+    MAX_RETRIES,
+    RETRY_AFTER_MAX,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    RETRY_STATUS_CODES,
+)
+
+logger = logging.getLogger(__name__)
+
+_MIN_ATTEMPT_TIMEOUT = 0.01
+
+
+class CircuitOpenError(requests.RequestException):
+    """호스트의 회로 차단기가 열려 있어 요청을 보내지 않았을 때 발생하는 예외입니다."""
+
+
+class RetryPolicy:
+    """
+    지터가 적용된 지수 백오프 재시도 정책입니다.
+
+    Attributes:
+        max_retries: 최초 요청 이후 최대 재시도 횟수.
+        backoff_base: 첫 재시도의 최대 대기 시간(초). 재시도마다 두 배가 됩니다.
+        backoff_max: 재시도 한 번의 최대 대기 시간(초).
+        retry_after_max: 따를 수 있는 Retry-After의 최대값(초). 더 길면 재시도하지 않습니다.
+        retry_statuses: 재시도할 응답 상태 코드.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = MAX_RETRIES,
+        backoff_base: float = RETRY_BACKOFF_BASE,
+        backoff_max: float = RETRY_BACKOFF_MAX,
+        retry_after_max: float = RETRY_AFTER_MAX,
+        retry_statuses=RETRY_STATUS_CODES,
+    ):
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def delay(
+        self, attempt: int, retry_after: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        attempt번째 실패 뒤 기다릴 시간(초)을 반환합니다.
+
+        Args:
+            attempt: 지금까지 실패한 시도 수 - 1 (첫 실패는 0).
+            retry_after: 서버가 Retry-After로 요청한 대기 시간(초).
+
+        Returns:
+            대기 시간. 더 이상 재시도하지 않아야 하면 None.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if retry_after is not None:
+            if retry_after > self.retry_after_max:
+                return None
+            return max(0.0, retry_after)
+        # Full jitter: [0, min(max, base * 2^attempt)] 사이에서 고르게 고릅니다.
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+
+class CircuitBreaker:
+    """
+    호스트 하나의 회로 차단기입니다.
+
+    연속 실패가 failure_threshold에 도달하면 열림(open) 상태가 되어 요청을 바로 거부합니다.
+    reset_timeout이 지나면 반열림(half_open) 상태가 되어 시험 요청 하나만 허용하고,
+    그 결과에 따라 닫힘(closed) 또는 열림 상태로 돌아갑니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.times_opened = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 확인합니다."""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    self.rejected += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            if self.state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    self.rejected += 1
+                    return False
+                self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """상태는 그대로 두고 반열림 상태의 시험 요청 자리만 비웁니다."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            self.total_failures += 1
+            self._trial_in_flight = False
+            if (
+                self.state == self.HALF_OPEN
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "total_failures": self.total_failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+
+
+class HttpGuard:
+    """
+    모든 외부 HTTP 요청에 재시도 정책과 호스트별 회로 차단기를 적용합니다.
+
+    연결 오류, 타임아웃, 429/5xx 응답은 지터가 적용된 지수 백오프로 재시도하고
+    (429/503의 Retry-After를 따름), 같은 호스트에서 실패가 이어지면 회로 차단기가
+    열려 이후 요청을 REQUEST_TIMEOUT만큼 기다리지 않고 바로 실패시킵니다.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+    ):
+        self.policy = policy or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.retries = 0
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session, url: str, **kwargs) -> requests.Response:
+        return self.request(session, "GET", url, **kwargs)
+
+    def request(
+        self,
+        session,
+        method: str,
+        url: str,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        재시도와 회로 차단기를 적용하여 요청을 보냅니다.
+
+        Args:
+            session: requests.Session 객체 (또는 request 메서드가 있는 requests 모듈).
+            method: HTTP 메서드.
+            url: 요청할 URL.
+            deadline: time.monotonic() 기준 마감 시각. 재시도 대기가 이를 넘으면 재시도하지 않고,
+                각 시도의 timeout은 남은 시간을 넘지 않도록 줄입니다.
+            **kwargs: session.request에 그대로 전달할 인자.
+
+        Returns:
+            마지막 응답. 재시도 대상 상태 코드로 재시도를 모두 소진하면 그 응답을 반환합니다.
+
+        Raises:
+            CircuitOpenError: 호스트의 회로 차단기가 열려 있는 경우.
+            requests.RequestException: 재시도를 모두 소진한 연결 오류/타임아웃.
+        """
+        host = urlparse(url).netloc.lower()
+        breaker = self.breaker(host)
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(
+                    f"{host} 호스트의 회로 차단기가 열려 있어 요청을 보내지 않습니다: {url}"
+                )
+
+            try:
+                response = session.request(
+                    method, url, **_with_deadline(kwargs, deadline)
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                breaker.record_failure()
+                delay = self._next_delay(attempt, None, deadline)
+                if delay is None:
+                    raise
+                logger.warning(
+                    f"요청 실패, {delay:.1f}초 후 재시도합니다 ({attempt + 1}/{self.policy.max_retries}): {url} - {e}"
+                )
+            except requests.RequestException:
+                # 잘못된 URL, 리다이렉트 초과 등은 호스트 장애가 아니므로 재시도하지 않습니다.
+                # 호스트가 복구되었다는 뜻도 아니므로 회로 상태는 바꾸지 않습니다.
+                breaker.release_trial()
+                raise
+            else:
+                if response.status_code not in self.policy.retry_statuses:
+                    breaker.record_success()
+                    return response
+
+                breaker.record_failure()
+                delay = self._next_delay(attempt, parse_retry_after(response), deadline)
+                if delay is None:
+                    return response
+                logger.warning(
+                    f"{response.status_code} 응답, {delay:.1f}초 후 재시도합니다 ({attempt + 1}/{self.policy.max_retries}): {url}"
+                )
+                response.close()
+
+            with self._lock:
+                self.retries += 1
+            time.sleep(delay)
+            attempt += 1
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """호스트(host:port)의 회로 차단기를 반환합니다. 없으면 새로 만듭니다."""
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self._breakers[host] = breaker
+            return breaker
+
+    def stats(self) -> Dict[str, Any]:
+        """재시도 횟수와 실패가 있었던 호스트의 회로 차단기 상태를 반환합니다."""
+        with self._lock:
+            snapshots = {
+                host: breaker.snapshot() for host, breaker in self._breakers.items()
+            }
+        return {
+            "retries": self.retries,
+            "breakers": {
+                host: snapshot
+                for host, snapshot in snapshots.items()
+                if snapshot["total_failures"]
+            },
+        }
+
+    def _next_delay(
+        self, attempt: int, retry_after: Optional[float], deadline: Optional[float]
+    ) -> Optional[float]:
+        delay = self.policy.delay(attempt, retry_after)
+        if delay is None:
+            return None
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return None
+        return delay
+
+
+def _with_deadline(kwargs: Dict[str, Any], deadline: Optional[float]) -> Dict[str, Any]:
+    """요청 인자의 timeout(초 또는 (연결, 읽기) 튜플)을 deadline까지 남은 시간으로 제한합니다."""
+    if deadline is None:
+        return kwargs
+    # 백오프 대기가 조금 늦게 끝나 남은 시간이 없으면 바로 타임아웃되도록 최소값만 둡니다.
+    remaining = max(_MIN_ATTEMPT_TIMEOUT, deadline - time.monotonic())
+    timeout = kwargs.get("timeout")
+    if isinstance(timeout, tuple):
+        timeout = tuple(
+            remaining if value is None else min(value, remaining) for value in timeout
+        )
+    else:
+        timeout = remaining if timeout is None else min(timeout, remaining)
+    return {**kwargs, "timeout": timeout}
+
+
+def parse_retry_after(response) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜, OpenAI의 retry-after-ms)를 초 단위로 변환합니다."""
+    milliseconds = response.headers.get("retry-after-ms")
+    if milliseconds:
+        try:
+            return max(0.0, float(milliseconds) / 1000)
+        except ValueError:
+            pass
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+http_guard = HttpGuard()
@@ -0,0 +1,90 @@
+import hashlib
+import logging
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+from src.utils.url_utils import normalize_url
+
+logger = logging.getLogger(__name__)
+
+# 파일 헤더: 마지막으로 반영한 posts.id, 반영한 행 수
+_HEADER = struct.Struct("<QQ")
+
+
+def url_key(url: str) -> int:
+    """
+    URL을 정규화한 뒤 64비트 해시로 바꾼 KnownUrlIndex의 키를 반환합니다.
+
+    company_posts.source_url_hash에 저장되는 url_utils.url_hash와는 다른 값입니다.
+    """
+    digest = hashlib.blake2b(normalize_url(url).encode("utf-8"), digest_size=8)
+    return int.from_bytes(digest.digest(), "little")
+
+
+class KnownUrlIndex:
+    """
+    이미 저장된 포스트 URL을 64비트 해시의 정렬된 배열로 보관하는 집합입니다.
+
+    URL 10만 개도 1MB 이하로 메모리와 디스크에 올릴 수 있으며, 조회는 이진 탐색입니다.
+    해시 충돌로 새 포스트를 저장된 것으로 오인할 확률은 무시할 만큼 작습니다.
+
+    Attributes:
+        max_id: 인덱스에 반영된 가장 큰 company_posts.id.
+        row_count: 인덱스에 반영된 company_posts 행 수.
+    """
+
+    def __init__(self, hashes: Iterable[int] = (), max_id: int = 0, row_count: int = 0):
+        self._hashes = array("Q", sorted(set(hashes)))
+        self.max_id = max_id
+        self.row_count = row_count
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __contains__(self, url: str) -> bool:
+        if not url:
+            return False
+        key = url_key(url)
+        position = bisect_left(self._hashes, key)
+        return position < len(self._hashes) and self._hashes[position] == key
+
+    def add_urls(self, urls: Iterable[str]) -> None:
+        """URL들을 집합에 추가합니다."""
+        new_hashes = {url_key(url) for url in urls if url}
+        if new_hashes:
+            self._hashes = array("Q", sorted(new_hashes.union(self._hashes)))
+
+    def save(self, path: str) -> None:
+        """인덱스를 파일에 기록합니다. 실패해도 크롤링에는 영향이 없습니다."""
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(_HEADER.pack(self.max_id, self.row_count))
+                self._hashes.tofile(f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"저장된 URL 인덱스 기록 실패: {path} - {e}")
+
+    @classmethod
+    def load(cls, path: str) -> Optional["KnownUrlIndex"]:
+        """파일에서 인덱스를 읽습니다. 파일이 없거나 손상되었으면 None을 반환합니다."""
+        try:
+            with open(path, "rb") as f:
+                max_id, row_count = _HEADER.unpack(f.read(_HEADER.size))
+                hashes = array("Q")
+                hashes.frombytes(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, struct.error, ValueError) as e:
+            logger.warning(f"저장된 URL 인덱스를 읽지 못해 새로 만듭니다: {path} - {e}")
+            return None
+
+        index = cls(max_id=max_id, row_count=row_count)
+        index._hashes = hashes
+        return index
@@ -0,0 +1,222 @@
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.config.dedup_config import (
+    NEAR_DUPLICATE_MAX_DISTANCE,
+    SIMHASH_MIN_SHINGLES,
+    SIMHASH_SHINGLE_SIZE,
+)
+
+FINGERPRINT_BITS = 64
+_WORD_PATTERN = re.compile(r"[0-9a-z가-힣]+")
+_BIT_SHIFTS = np.arange(FINGERPRINT_BITS, dtype=np.uint64)
+
+
+def simhash(
+    text: str,
+    shingle_size: int = SIMHASH_SHINGLE_SIZE,
+    min_shingles: int = SIMHASH_MIN_SHINGLES,
+) -> Optional[int]:
+    """
+    본문의 64비트 SimHash 지문을 계산합니다.
+
+    연속된 shingle_size개 단어 묶음(shingle)을 특징으로, 출현 횟수를 가중치로 사용합니다.
+    비슷한 글일수록 지문의 해밍 거리가 작습니다.
+
+    Returns:
+        64비트 지문. 서로 다른 shingle이 min_shingles개보다 적은 짧은 글이면 None.
+    """
+    words = _WORD_PATTERN.findall(unicodedata.normalize("NFKC", text).lower())
+    shingles = Counter(
+        " ".join(words[i : i + shingle_size])
+        for i in range(len(words) - shingle_size + 1)
+    )
+    if len(shingles) < max(1, min_shingles):
+        return None
+
+    hashes = np.fromiter(
+        (_feature_hash(shingle) for shingle in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    weights = np.fromiter(shingles.values(), dtype=np.float64, count=len(shingles))
+    bits = (hashes[:, None] >> _BIT_SHIFTS) & np.uint64(1)
+    totals = (np.where(bits == 1, 1.0, -1.0) * weights[:, None]).sum(axis=0)
+    fingerprint = 0
+    for bit in np.flatnonzero(totals > 0):
+        fingerprint |= 1 << int(bit)
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def format_fingerprint(fingerprint: int) -> str:
+    return f"{fingerprint:016x}"
+
+
+def parse_fingerprint(value: str) -> int:
+    return int(value, 16)
+
+
+def _feature_hash(feature: str) -> int:
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8)
+    return int.from_bytes(digest.digest(), "little")
+
+
+@dataclass
+class NearDuplicateMatch:
+    """
+    근사 중복으로 판정된 포스트입니다.
+
+    Attributes:
+        url: 건너뛴 포스트의 URL.
+        title: 건너뛴 포스트의 제목.
+        fingerprint: 건너뛴 포스트의 지문.
+        duplicate_of: 원본으로 판정된 포스트의 URL.
+        distance: 두 지문의 해밍 거리.
+        stored: 원본이 이미 데이터베이스에 저장된 포스트인지 여부.
+            False이면 같은 실행에서 먼저 처리 중인 포스트와 겹친 것입니다.
+    """
+
+    url: str
+    title: str
+    fingerprint: int
+    duplicate_of: str
+    distance: int
+    stored: bool
+
+
+class NearDuplicateIndex:
+    """
+    SimHash 지문의 근사 중복 인덱스입니다.
+
+    64비트 지문을 max_distance + 1개의 구간(band)으로 나눠 구간 값마다 포스트를 모아 둡니다.
+    해밍 거리가 max_distance 이하인 두 지문은 비둘기집 원리에 따라 적어도 한 구간이 완전히
+    같으므로, 같은 구간 값을 가진 후보만 비교하면 빠짐없이 찾을 수 있습니다.
+
+    Attributes:
+        max_distance: 근사 중복으로 볼 최대 해밍 거리.
+        skipped: 근사 중복으로 판정된 포스트 목록.
+    """
+
+    def __init__(self, max_distance: int = NEAR_DUPLICATE_MAX_DISTANCE):
+        self.max_distance = min(max(0, max_distance), FINGERPRINT_BITS // 2 - 1)
+        band_count = self.max_distance + 1
+        edges = [i * FINGERPRINT_BITS // band_count for i in range(band_count + 1)]
+        self._bands = [
+            (start, (1 << (end - start)) - 1) for start, end in zip(edges, edges[1:])
+        ]
+        self._tables: List[Dict[int, List[str]]] = [
+            defaultdict(list) for _ in self._bands
+        ]
+        self._entries: Dict[str, Tuple[int, bool]] = {}
+        self.checked = 0
+        self.skipped: List[NearDuplicateMatch] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, url: str, fingerprint: int, stored: bool = True) -> None:
+        """
+        포스트의 지문을 인덱스에 추가합니다.
+
+        Args:
+            url: 포스트의 정규화된 URL.
+            fingerprint: 포스트의 지문.
+            stored: 데이터베이스에 저장된 포스트인지 여부.
+        """
+        with self._lock:
+            self._add(url, fingerprint, stored)
+
+    def find(self, fingerprint: int) -> Optional[Tuple[str, int, bool]]:
+        """
+        가장 가까운 근사 중복 포스트를 찾습니다.
+
+        Returns:
+            (URL, 해밍 거리, 저장 여부). max_distance 안에 없으면 None.
+        """
+        with self._lock:
+            return self._find(fingerprint)
+
+    def check(
+        self, url: str, title: str, content: str
+    ) -> Tuple[Optional[int], Optional[NearDuplicateMatch]]:
+        """
+        새 포스트가 근사 중복인지 확인합니다.
+
+        중복이 아니면 같은 실행의 이후 포스트와도 비교할 수 있도록 저장 전 상태로 인덱스에 추가합니다.
+
+        Returns:
+            (지문, 근사 중복 정보). 본문이 너무 짧아 지문을 만들 수 없으면 (None, None),
+            중복이 아니면 (지문, None).
+        """
+        fingerprint = simhash(content)
+        if fingerprint is None:
+            return None, None
+
+        with self._lock:
+            self.checked += 1
+            found = self._find(fingerprint, exclude=url)
+            if found is None:
+                self._add(url, fingerprint, stored=False)
+                return fingerprint, None
+            match = NearDuplicateMatch(
+                url=url,
+                title=title,
+                fingerprint=fingerprint,
+                duplicate_of=found[0],
+                distance=found[1],
+                stored=found[2],
+            )
+            self.skipped.append(match)
+            return fingerprint, match
+
+    def report(self) -> Dict[str, object]:
+        """확인한 포스트 수와 건너뛴 포스트 목록을 반환합니다."""
+        with self._lock:
+            return {
+                "indexed": len(self._entries),
+                "checked": self.checked,
+                "skipped": [
+                    {
+                        "title": match.title,
+                        "url": match.url,
+                        "duplicate_of": match.duplicate_of,
+                        "distance": match.distance,
+                    }
+                    for match in self.skipped
+                ],
+            }
+
+    def _add(self, url: str, fingerprint: int, stored: bool) -> None:
+        if url in self._entries:
+            return
+        self._entries[url] = (fingerprint, stored)
+        for table, (shift, mask) in zip(self._tables, self._bands):
+            table[(fingerprint >> shift) & mask].append(url)
+
+    def _find(
+        self, fingerprint: int, exclude: Optional[str] = None
+    ) -> Optional[Tuple[str, int, bool]]:
+        best: Optional[Tuple[str, int, bool]] = None
+        for table, (shift, mask) in zip(self._tables, self._bands):
+            for url in table.get((fingerprint >> shift) & mask, ()):
+                if url == exclude:
+                    continue
+                candidate, stored = self._entries[url]
+                distance = hamming_distance(fingerprint, candidate)
+                if distance <= self.max_distance and (
+                    best is None or distance < best[1]
+                ):
+                    best = (url, distance, stored)
+        return best
@@ -4,10 +4,21 @@ import uuid
 from io import BytesIO
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+# 이 크기 이하의 객체(썸네일 등)는 관리형 전송(upload_fileobj) 없이 PutObject 한 번으로 올립니다.
+S3_SINGLE_PUT_MAX_BYTES = int(os.getenv("S3_SINGLE_PUT_MAX_BYTES", 8 * 1024 * 1024))
+# 썸네일 워커들이 하나의 클라이언트를 함께 쓰므로 워커 수보다 넉넉하게 연결을 둡니다.
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", 16))
+# 더 큰 객체는 멀티파트로 올리되, 썸네일 워커가 이미 동시에 올리므로 전송 스레드는 만들지 않습니다.
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=S3_SINGLE_PUT_MAX_BYTES, use_threads=False
+)
+
 
 class S3Uploader:
 
@@ -17,6 +28,7 @@ class S3Uploader:
         self.s3_bucket = os.getenv("S3_BUCKET_NAME")
         self.s3_region = os.getenv("AWS_REGION", "ap-northeast-2")
         self.cdn_url = os.getenv("CDN_URL")
+        self.endpoint_url = os.getenv("S3_ENDPOINT_URL")
         self.s3_client = None
 
         if not all([self.aws_access_key, self.aws_secret_key, self.s3_bucket]):
@@ -31,6 +43,11 @@ class S3Uploader:
                 aws_access_key_id=self.aws_access_key,
                 aws_secret_access_key=self.aws_secret_key,
                 region_name=self.s3_region,
+                endpoint_url=self.endpoint_url,
+                config=Config(
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    s3={"addressing_style": "path"} if self.endpoint_url else None,
+                ),
             )
             logger.info("S3 클라이언트가 성공적으로 초기화되었습니다.")
         except Exception as e:
@@ -74,11 +91,21 @@ class S3Uploader:
             return f"thumbnails/{unique_filename}"
 
     def _upload_to_s3(self, image_data, key, extension):
+        content_type = f"image/{extension}"
+        if len(image_data) <= S3_SINGLE_PUT_MAX_BYTES:
+            self.s3_client.put_object(
+                Body=image_data,
+                Bucket=self.s3_bucket,
+                Key=key,
+                ContentType=content_type,
+            )
+            return
         self.s3_client.upload_fileobj(
             BytesIO(image_data),
             self.s3_bucket,
             key,
-            ExtraArgs={"ContentType": f"image/{extension}"},
+            ExtraArgs={"ContentType": content_type},
+            Config=_TRANSFER_CONFIG,
         )
 
 
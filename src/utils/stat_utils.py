@@ -0,0 +1,18 @@
+from typing import Sequence
+
+
+def percentile_ms(sorted_values: Sequence[float], ratio: float) -> float:
+    """
+    정렬된 소요 시간(초) 목록의 백분위수를 밀리초로 반환합니다.
+
+    Args:
+        sorted_values: 오름차순으로 정렬된 소요 시간(초) 목록.
+        ratio: 0과 1 사이의 백분위 (p95는 0.95).
+
+    Returns:
+        소수점 첫째 자리까지 반올림한 밀리초. 목록이 비어 있으면 0.0.
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(ratio * (len(sorted_values) - 1))))
+    return round(sorted_values[index] * 1000, 1)
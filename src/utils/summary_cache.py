@@ -0,0 +1,151 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from src.config.cache_config import (
+    SUMMARY_CACHE_MAX_BYTES,
+    SUMMARY_CACHE_PATH,
+    SUMMARY_CACHE_TTL,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryCache:
+    """
+    콘텐츠 해시를 키로 요약 결과를 저장하는 디스크 캐시입니다.
+
+    키는 호출하는 쪽에서 본문, 프롬프트, 모델 설정을 합쳐 만든 해시이므로,
+    같은 글을 다시 크롤링하거나 URL이 바뀌어도 LLM을 다시 호출하지 않고,
+    프롬프트나 모델이 바뀌면 자연히 새 키가 됩니다.
+    TTL이 지난 항목과 최대 크기를 넘는 오래된 항목은 자동으로 제거됩니다.
+    """
+
+    def __init__(
+        self,
+        path: str = SUMMARY_CACHE_PATH,
+        ttl: int = SUMMARY_CACHE_TTL,
+        max_bytes: int = SUMMARY_CACHE_MAX_BYTES,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """저장된 요약 결과를 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        if not self.enabled:
+            return None
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT result FROM summary_cache WHERE key = ? AND stored_at >= ?",
+                    (key, now - self.ttl),
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                conn.execute(
+                    "UPDATE summary_cache SET accessed_at = ? WHERE key = ?",
+                    (now, key),
+                )
+                conn.commit()
+                self.hits += 1
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"요약 캐시 조회 실패: {key} - {e}")
+            return None
+
+    def put(self, key: str, result: Dict[str, str]) -> None:
+        """요약 결과를 저장합니다."""
+        if not self.enabled:
+            return
+        value = json.dumps(result, ensure_ascii=False)
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO summary_cache VALUES (?, ?, ?, ?, ?)",
+                    (key, value, len(value.encode("utf-8")), now, now),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"요약 캐시 저장 실패: {key} - {e}")
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 적중/실패 통계를 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 3) if total else 0.0,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        """만료/초과 항목을 정리하고 캐시 파일을 닫습니다."""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._evict()
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS summary_cache (
+                    key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._evict()
+        return self._conn
+
+    def _evict(self) -> None:
+        """TTL이 지난 항목을 지우고, 최대 크기를 넘으면 오래 사용하지 않은 항목부터 지웁니다."""
+        conn = self._conn
+        expired = conn.execute(
+            "DELETE FROM summary_cache WHERE stored_at < ?", (time.time() - self.ttl,)
+        ).rowcount
+
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM summary_cache"
+        ).fetchone()[0]
+        evicted = 0
+        if total > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM summary_cache ORDER BY accessed_at"
+            ).fetchall()
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                conn.execute("DELETE FROM summary_cache WHERE key = ?", (key,))
+                total -= size
+                evicted += 1
+        conn.commit()
+        self.evictions += expired + evicted
+
+
+summary_cache = SummaryCache()
@@ -0,0 +1,78 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+from src.utils.stat_utils import percentile_ms
+
+
+class TransferStats:
+    """
+    다운로드/업로드 같은 전송 작업의 작업별 소요 시간과 전송량 통계입니다.
+
+    작업마다 소요 시간을 모두 보관하므로 p50/p95를 계산할 수 있습니다.
+    """
+
+    def __init__(self):
+        self._latencies: Dict[str, List[float]] = defaultdict(list)
+        self._bytes: Dict[str, int] = defaultdict(int)
+        self._failed: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(
+        self, operation: str, seconds: float, size: int = 0, ok: bool = True
+    ) -> None:
+        with self._lock:
+            self._latencies[operation].append(seconds)
+            self._bytes[operation] += size
+            if not ok:
+                self._failed[operation] += 1
+
+    @contextmanager
+    def timed(self, operation: str) -> Iterator[Dict[str, Any]]:
+        """
+        블록의 소요 시간을 operation으로 기록합니다.
+
+        블록 안에서 yield된 dict의 "bytes"에 전송량을, "ok"에 성공 여부를 넣을 수 있습니다.
+        블록에서 예외가 나면 실패로 기록합니다.
+        """
+        outcome: Dict[str, Any] = {"bytes": 0, "ok": True}
+        started = time.perf_counter()
+        try:
+            yield outcome
+        except BaseException:
+            outcome["ok"] = False
+            raise
+        finally:
+            self.record(
+                operation,
+                time.perf_counter() - started,
+                outcome["bytes"],
+                outcome["ok"],
+            )
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """작업별 횟수, 실패 수, 전송량, 전체 소요 시간, p50/p95/최대 소요 시간을 반환합니다."""
+        with self._lock:
+            return {
+                operation: _summary(
+                    sorted(latencies), self._bytes[operation], self._failed[operation]
+                )
+                for operation, latencies in self._latencies.items()
+            }
+
+
+def _summary(latencies: List[float], size: int, failed: int) -> Dict[str, Any]:
+    return {
+        "count": len(latencies),
+        "failed": failed,
+        "bytes": size,
+        "total_s": round(sum(latencies), 3),
+        "p50_ms": percentile_ms(latencies, 0.50),
+        "p95_ms": percentile_ms(latencies, 0.95),
+        "max_ms": round(latencies[-1] * 1000, 1) if latencies else 0.0,
+    }
+
+
+thumbnail_stats = TransferStats()
@@ -0,0 +1,46 @@
+import hashlib
+import logging
+from typing import Any
+from urllib.parse import unquote, urlparse, urlunparse
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_url(url: Any) -> str:
+    """URL에서 쿼리 파라미터, 프래그먼트, 불필요한 경로 요소를 제거하여 정규화합니다."""
+    if isinstance(url, dict) and "href" in url:
+        url_str = url["href"]
+    elif isinstance(url, str):
+        url_str = url
+    else:
+        try:
+            url_str = str(url)
+        except Exception:
+            logger.error(f"URL을 문자열로 변환 실패: {url}, 타입: {type(url)}")
+            return ""
+
+    try:
+        parsed = urlparse(url_str)
+        path = unquote(parsed.path)
+        path = path.lower()
+        path = path.rstrip("/")
+
+        if "?" in path:
+            path = path.split("?", 1)[0]
+        if "#" in path:
+            path = path.split("#", 1)[0]
+
+        return urlunparse((parsed.scheme, parsed.netloc.lower(), path, "", "", ""))
+    except Exception as e:
+        logger.error(f"URL 정규화 중 오류 발생: {url_str} - {e}", exc_info=True)
+        return ""
+
+
+def url_hash(url: str) -> str:
+    """
+    URL 문자열의 SHA-256 해시(64자리 16진수)를 반환합니다. company_posts.source_url_hash에 저장됩니다.
+
+    입력을 정규화하지 않으므로, 조회와 저장이 같은 값을 얻으려면 호출하는 쪽에서
+    normalize_url로 정규화한 URL(source_url에 저장되는 값)을 넘겨야 합니다.
+    """
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
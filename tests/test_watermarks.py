@@ -0,0 +1,109 @@
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import feedparser
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+from src.core.db_handler import advance_watermarks, load_watermarks, save_to_rds
+from src.database import connection
+from src.database.models import Base
+from src.models.dto import CompanyPost, CrawledContentDto
+from src.models.enums import Company, Field
+from src.services.crawler import BlogCrawler
+
+FEED_URL = "https://blog.example.com/feed"
+
+
+def _item(slug, published=None):
+    pub_date = f"<pubDate>{format_datetime(published)}</pubDate>" if published else ""
+    return (
+        f"<item><title>{slug}</title><link>https://blog.example.com/{slug}</link>"
+        f"<guid>{slug}</guid>{pub_date}<description>본문</description></item>"
+    )
+
+
+def _feed(*items):
+    return feedparser.parse(
+        f'<?xml version="1.0"?><rss version="2.0"><channel><title>blog</title>'
+        f"{''.join(items)}</channel></rss>"
+    )
+
+
+def _crawled(crawler, entry):
+    published_at, estimated = crawler._extract_date_from_entry(entry)
+    return CrawledContentDto(
+        title=entry.title,
+        content="본문",
+        url=entry.link,
+        source_name="blog",
+        thumbnail_url=None,
+        published_at=published_at,
+        company=Company.ETC,
+        feed_url=FEED_URL,
+        entry_id=crawler._extract_entry_id(entry),
+        published_at_estimated=estimated,
+    )
+
+
+def _save(posts):
+    save_to_rds(
+        [
+            CompanyPost(
+                title=post.title,
+                summary="요약",
+                thumbnail_url=None,
+                field=list(Field)[0],
+                published_at=post.published_at,
+                company=post.company,
+                url=post.url,
+            )
+            for post in posts
+        ]
+    )
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    # 워크플로와 같이 UTC가 아닌 로컬 시간대에서 실행합니다.
+    monkeypatch.setenv("TZ", "Asia/Seoul")
+    time.tzset()
+    engine = create_engine(f"sqlite:///{tmp_path / 'crawler.sqlite3'}")
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(connection, "SessionLocal", sessionmaker(bind=engine))
+    yield
+    engine.dispose()
+    monkeypatch.delenv("TZ")
+    time.tzset()
+
+
+def test_undated_entry_does_not_move_published_watermark(database):
+    crawler = BlogCrawler()
+    now = datetime.now(timezone.utc)
+    first_run = _feed(_item("undated"), _item("dated", now - timedelta(hours=2)))
+
+    entries = crawler._parse_default_feed(first_run, max_posts=10)
+    posts = [_crawled(crawler, entry) for entry in entries]
+    assert [post.published_at_estimated for post in posts] == [True, False]
+    _save(posts)
+    advance_watermarks(posts)
+
+    watermark = load_watermarks()[FEED_URL]
+    assert watermark.entry_id == "undated"
+    assert watermark.published_at == (now - timedelta(hours=2)).replace(
+        tzinfo=None, microsecond=0
+    )
+
+    # 크롤링 시각보다 이르게 발행된 새 글도 다음 실행에서 크롤링되어야 합니다.
+    second_run = _feed(
+        _item("new", now - timedelta(minutes=30)),
+        _item("undated"),
+        _item("dated", now - timedelta(hours=2)),
+    )
+    entries = crawler._parse_default_feed(second_run, 10, watermark=watermark)
+    assert [entry.guid for entry in entries] == ["new"]